@@ -0,0 +1,49 @@
+# Compare the memory usage of the default and the compact node layout for a large tuple of sub models
+# Run with: python benchmarks/memory.py
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from pydantic import BaseModel
+
+from easyconfig.config_objs import AppConfig
+
+
+class Device(BaseModel):
+    name: str = ''
+    host: str = 'localhost'
+    port: int = 0
+    enabled: bool = True
+    retries: int = 3
+
+
+class Devices(BaseModel):
+    devices: tuple[Device, ...] = ()
+
+
+def measure(model: Devices, **kwargs: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    cfg = AppConfig.from_model(model, **kwargs)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cfg
+    return size
+
+
+def main() -> None:
+    count = 40_000
+    model = Devices(devices=tuple(Device(name=f'device {i:d}', port=i) for i in range(count)))
+
+    # create the classes so they are not part of the measurement
+    AppConfig.from_model(Devices(devices=(Device(), )))
+    AppConfig.from_model(Devices(devices=(Device(), )), compact=True)
+
+    for name, kwargs in (('default', {}), ('compact', {'compact': True})):
+        size = measure(model, **kwargs)
+        print(f'{name:8s}: {size / 1024 / 1024:6.1f}MiB for {count:d} nodes, {size / count:.0f} bytes per node')
+
+
+if __name__ == '__main__':
+    main()
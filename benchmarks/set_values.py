@@ -0,0 +1,74 @@
+# Measure how fast the values of a large config tree can be updated
+# Run with: python benchmarks/set_values.py
+from __future__ import annotations
+
+from timeit import repeat
+
+from pydantic import BaseModel
+
+from easyconfig.config_objs import AppConfig, ConfigNodeSubscriptionManager
+
+
+class Leaf(BaseModel):
+    name: str = ''
+    port: int = 0
+    enabled: bool = True
+
+
+class Node(BaseModel):
+    name: str = ''
+    leaf1: Leaf = Leaf()
+    leaf2: Leaf = Leaf()
+    leaf3: Leaf = Leaf()
+    leaf4: Leaf = Leaf()
+
+
+class Root(BaseModel):
+    nodes: tuple[Node, ...] = ()
+
+
+def create_model(count: int, offset: int) -> Root:
+    return Root(nodes=tuple(
+        Node(name=f'node {i:d}',
+             **{f'leaf{j:d}': Leaf(name=f'leaf {i:d}.{j:d}', port=i + j + offset) for j in range(1, 5)})
+        for i in range(count)
+    ))
+
+
+def main() -> None:
+    count = 2_000
+    number = 20
+
+    cfg = AppConfig.from_model(create_model(count, 0))
+    nodes = 1 + count * 5
+    models = (create_model(count, 0), create_model(count, 1))
+
+    i = 0
+
+    def reload() -> None:
+        nonlocal i
+        i += 1
+        subscriptions: list[ConfigNodeSubscriptionManager] = []
+        cfg._set_values(models[i % 2], subscriptions)
+
+    duration = min(repeat(reload, number=number, repeat=5)) / number
+    print(f'{nodes:d} nodes: {duration * 1000:.1f}ms per reload, {nodes / duration:,.0f} nodes/s')
+
+    # Only one node changes, the unchanged subtrees are skipped by comparing the raw data
+    raws = [model.model_dump() for model in models]
+    raws[1]['nodes'] = [*raws[0]['nodes'][:-1], raws[1]['nodes'][-1]]
+    models = tuple(Root.model_validate(raw) for raw in raws)
+
+    def reload_changed() -> None:
+        nonlocal i
+        i += 1
+        subscriptions: list[ConfigNodeSubscriptionManager] = []
+        raw = raws[i % 2]
+        cfg._set_values(models[i % 2], subscriptions, raw)
+
+    duration = min(repeat(reload_changed, number=number, repeat=5)) / number
+    print(f'{nodes:d} nodes, one changed: {duration * 1000:.1f}ms per reload')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# Measure how fast many functions can subscribe, get called and cancel their subscription
+# Run with: python benchmarks/subscriptions.py
+from __future__ import annotations
+
+import gc
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from easyconfig.config_objs import AppConfig
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class Root(BaseModel):
+    value: int = 0
+
+
+class Handler:
+    def on_change(self) -> None:
+        pass
+
+
+def get_funcs(count: int) -> list[Callable[[], None]]:
+    funcs = []
+    for _ in range(count):
+        def func() -> None:
+            pass
+        funcs.append(func)
+    return funcs
+
+
+def measure(name: str, count: int, func: Callable[[], Any]) -> None:
+    start = perf_counter()
+    func()
+    duration = perf_counter() - start
+    print(f'{name:30s}: {duration * 1000:7.1f}ms, {duration / count * 1_000_000:5.1f}us per subscriber')
+
+
+def main() -> None:
+    count = 10_000
+    cfg = AppConfig.from_model(Root())
+    funcs = get_funcs(count)
+    i = 0
+
+    def load() -> None:
+        nonlocal i
+        i += 1
+        cfg.load_config_dict({'value': i})
+
+    subs = []
+    measure('subscribe', count, lambda: subs.extend(cfg.subscribe_for_changes(f) for f in funcs))
+    measure('load', count, load)
+    measure('cancel', count, lambda: [sub.cancel() for sub in subs])
+
+    subs = []
+    measure('subscribe_many', count, lambda: subs.extend(cfg.subscribe_many(funcs)))
+    measure('cancel in reverse order', count, lambda: [sub.cancel() for sub in reversed(subs)])
+
+    # the weak subscriptions of collected handlers are removed on the next load
+    handlers = [Handler() for _ in range(count)]
+    methods = [h.on_change for h in handlers]
+    measure('subscribe weak', count, lambda: cfg.subscribe_many(methods, weak=True))
+    handlers.clear()
+    methods.clear()
+    gc.collect()
+    measure('load, prune collected', count, load)
+
+
+if __name__ == '__main__':
+    main()
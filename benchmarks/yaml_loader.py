@@ -0,0 +1,63 @@
+# Compare the load time of the different yaml loaders for a large configuration file
+# Run with: python benchmarks/yaml_loader.py
+from __future__ import annotations
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import timeit
+
+from pydantic import BaseModel
+
+from easyconfig import create_app_config
+from easyconfig.yaml import HAS_C_LOADER
+
+
+class Entry(BaseModel):
+    name: str = ''
+    host: str = 'localhost'
+    port: int = 0
+    retries: int = 3
+    tags: list[str] = []
+
+
+class LargeConfig(BaseModel):
+    entries: dict[str, Entry] = {}
+
+
+def create_file(path: Path, count: int) -> None:
+    lines = ['entries:']
+    for i in range(count):
+        lines.extend((
+            f'  entry_{i:d}:  # comment for entry {i:d}',
+            f'    name: Entry {i:d}',
+            f'    host: host{i:d}.example.com',
+            f'    port: {8000 + i:d}',
+            '    retries: 5',
+            '    tags: [a, b, c]',
+        ))
+    path.write_text('\n'.join(lines), encoding='utf-8')
+
+
+def main() -> None:
+    count = 2_000
+    number = 5
+
+    print(f'C loader available: {HAS_C_LOADER}')
+
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'large.yml'
+        create_file(path, count)
+        print(f'File size: {path.stat().st_size / 1024:.0f}kB, {count:d} entries')
+
+        base = None
+        for loader in ('rt', 'safe', 'c'):
+            cfg = create_app_config(LargeConfig(), file_values=None, loader=loader)
+            duration = timeit(lambda: cfg.load_config_file(path), number=number) / number  # noqa: B023
+
+            if base is None:
+                base = duration
+            print(f'{loader:>4s}: {duration * 1000:7.1f}ms ({base / duration:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -14,3 +14,4 @@ MISSING_TYPE: TypeAlias = Literal[_MissingType.MISSING_OBJ]
 
 
 ARG_NAME_IN_FILE: Final = 'in_file'
+ARG_NAME_IDENTITY_KEY: Final = 'identity_key'
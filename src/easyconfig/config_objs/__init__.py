@@ -1,4 +1,12 @@
+from .change_event import ConfigChangeEvent, ValueChange
+from .change_stream import ConfigChangeStream
 from .subscription import ConfigNodeSubscriptionManager, ConfigObjSubscription
+from .view import ConfigView
+
+
+# isort: split
+
+from .dispatch import ConcurrentDispatch, ThreadDispatch
 
 
 # isort: split
@@ -1,33 +1,85 @@
 from __future__ import annotations
 
-from asyncio import Lock
+from asyncio import Lock, to_thread
 from io import StringIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final
+from threading import Lock as ThreadLock
+from threading import RLock
+from typing import TYPE_CHECKING, Any, ClassVar, Final, cast
 
 from easyconfig.__const__ import MISSING, MISSING_TYPE
+from easyconfig.config_objs.change_stream import ConfigChangeStream
+from easyconfig.config_objs.dispatch import ConcurrentDispatch, ThreadDispatch, get_waiting_load
+from easyconfig.config_objs.fragments import ConfigFragments, merge_dicts
+from easyconfig.config_objs.incremental import IncrementalResult, IncrementalValidation
 from easyconfig.config_objs.object_config import ConfigObj
-from easyconfig.errors import FileDefaultsNotSetError
-from easyconfig.expansion import expand_obj
+from easyconfig.config_objs.reload_cache import FileState, ReloadCache
+from easyconfig.config_objs.snapshot import ConfigSnapshot
+from easyconfig.config_objs.subscription_stats import SubscriptionStats
+from easyconfig.config_objs.transaction import ConfigTransaction
+from easyconfig.errors import FileDefaultsNotSetError, LoadInSubscriptionError
+from easyconfig.expansion import ExpansionReferences, expand_obj
 from easyconfig.pre_process import PreProcess
-from easyconfig.yaml import CommentedMap, cmap_from_model, write_aligned_yaml, yaml_rt
+from easyconfig.watcher import AsyncConfigFileWatcher, ThreadConfigFileWatcher
+from easyconfig.yaml import CommentedMap, cmap_from_model, get_yaml_loader, write_aligned_yaml
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from pydantic import BaseModel
     from typing_extensions import Self
 
-    from easyconfig.config_objs import ConfigNodeSubscriptionManager
+    from easyconfig.config_objs import ConfigNodeSubscriptionManager, ConfigObjSubscription
+    from easyconfig.config_objs.change_event import ConfigChangeEvent
+    from easyconfig.config_objs.change_stream import OverflowPolicyType
+    from easyconfig.config_objs.reload_cache import ReloadCacheStats
+    from easyconfig.config_objs.view import ConfigView
+    from easyconfig.watcher import ConfigFileWatcher
+    from easyconfig.yaml import YamlLoaderType
 
 
 class AppConfigBase(ConfigObj):
-    def __init__(self, model: BaseModel, path: tuple[str, ...] = ('__root__',),
-                 parent: MISSING_TYPE | Self = MISSING, file_defaults: BaseModel | None = None, **kwargs: Any) -> None:
+    _dispatch_type: ClassVar[type[ConcurrentDispatch | ThreadDispatch]]
+
+    def __init__(self, model: BaseModel, path: tuple[str, ...] = ('__root__',),  # noqa: PLR0913
+                 parent: MISSING_TYPE | Self = MISSING, file_defaults: BaseModel | None = None, *,
+                 reload_cache: bool = False, loader: YamlLoaderType = 'rt', snapshot: bool = False,
+                 fragments: bool = False, incremental: bool = False,
+                 dispatch: ConcurrentDispatch | ThreadDispatch | None = None, subscription_stats: bool = False,
+                 slow_subscription: float | None = None, **kwargs: Any) -> None:
         super().__init__(model, path, parent, **kwargs)
 
         self._file_defaults: Final = file_defaults
         self._preprocess: Final = PreProcess(self._file_defaults)
         self._file_path: Path | None = None
+        self._reload_cache: Final = ReloadCache() if reload_cache else None
+        # the yaml instances are not thread safe, so every load creates its own instance
+        self._yaml_loader_type: Final = loader
+        get_yaml_loader(loader)     # raises for an unknown loader
+        self._expansion_files: tuple[Path, ...] = ()
+        self._snapshot: Final = ConfigSnapshot(self._obj_model_class, self._preprocess) if snapshot else None
+        self._fragments: Final = ConfigFragments(loader) if fragments else None
+        self._incremental: Final = IncrementalValidation(self) if incremental else None
+        if dispatch is not None and not isinstance(dispatch, self._dispatch_type):
+            msg = f'{self.__class__.__name__} requires a {self._dispatch_type.__name__}, got {dispatch}'
+            raise TypeError(msg)
+        self._dispatch: Final = dispatch
+        self._subscription_stats: Final = SubscriptionStats(slow_subscription) \
+            if subscription_stats or slow_subscription is not None else None
+
+        # The view is only created once it's requested and then replaced after every load.
+        # The lock is only taken by the loads and the first request, reading the published view is lock free.
+        self._view: ConfigView | None = None
+        self._view_lock: Final = ThreadLock()
+        # loads which were applied but whose subscription functions did not finish yet.
+        # A subscription function can load again, so there can be more than one.
+        # The view of an inner load is published together with the outermost load.
+        self._view_transactions: Final[list[ConfigTransaction]] = []
+        self._view_deferred = False
+
+        # streams of the changes, they are fed after the subscription functions have been called
+        self._streams: tuple[ConfigChangeStream, ...] = ()
 
     @property
     def config_file_path(self) -> Path:
@@ -43,6 +95,117 @@ class AppConfigBase(ConfigObj):
         """A preprocessor which can be used to preprocess the configuration data before it is loaded"""
         return self._preprocess
 
+    @property
+    def reload_cache_stats(self) -> ReloadCacheStats | None:
+        """Hits and misses of the reload cache or None if the reload cache is not enabled"""
+        if self._reload_cache is None:
+            return None
+        return self._reload_cache.stats
+
+    @property
+    def subscription_stats(self) -> SubscriptionStats | None:
+        """Duration of the calls of the subscription functions or None if the stats are not enabled"""
+        return self._subscription_stats
+
+    def snapshot(self) -> ConfigView:
+        """Return an immutable view of the current configuration values.
+        The view is consistent and does not change when the configuration is reloaded,
+        a reload publishes a new view which shares the unchanged parts with the previous one.
+        """
+        if (view := self._view) is None:
+            with self._view_lock:
+                if (view := self._view) is None:
+                    if not (transactions := self._view_transactions):
+                        self._view = view = self._get_view()
+                    else:
+                        # the values of the loads might still be rolled back, so the view has the previous values
+                        previous: dict[int, dict[str, Any]] = {}
+                        for transaction in transactions:
+                            transaction.get_previous_values(previous)
+                        view = self._get_view(previous)
+        return view
+
+    def subscribe(self, path: str, func: Callable[[], Any], *, prepare: bool = False,  # noqa: PLR0913
+                  debounce: float | None = None, max_rate: float | None = None,
+                  weak: bool = False) -> ConfigObjSubscription:
+        """Call the function when the value or the sub model at the path changes.
+        The names in the path are separated by dots, entries of tuples and dicts are selected
+        by their index or identity key respectively by their key, e.g. ``db.pool.size`` or ``servers.main.port``.
+
+        :param path: path to the value or sub model
+        :param func: function which will be called. If it has a required parameter it gets the change event.
+        :param prepare: Call the function before all functions which are not prepare functions
+        :param debounce: Call the function only after there was no change for this time in seconds
+        :param max_rate: Call the function at most this many times per second
+        :param weak: Only keep a weak reference to the function (or the object of a bound method).
+                     The subscription is removed when the function is garbage collected.
+        :return: object which can be used to cancel the subscription
+        """
+        obj, name = self._get_path_obj(path)
+        if not isinstance(obj, ConfigObj):
+            msg = f'{path} is a tuple or dict of sub models, subscribe to the entries instead'
+            raise TypeError(msg)
+        return obj.subscribe_for_changes(func, prepare=prepare, fields=() if name is None else (name, ),
+                                         debounce=debounce, max_rate=max_rate, weak=weak)
+
+    def changes(self, path: str | None = None, *, maxsize: int = 16, coalesce: bool = False,
+                overflow: OverflowPolicyType = 'drop_oldest') -> ConfigChangeStream:
+        """Stream of the changes of the configuration which can be used with ``async for``.
+        Every load which changes values at the path is reported with one change event after all subscription
+        functions have been called successfully, so the changes can be processed in a task of the consumer.
+        The stream has to be created in the event loop of the consumer.
+
+        :param path: path to the value or sub model, None reports all changes
+        :param maxsize: Maximum number of events which are queued until they are consumed
+        :param coalesce: Merge the new event into the queued event if the consumer has not picked it up yet
+        :param overflow: ``drop_oldest`` removes the oldest queued event if the queue is full,
+                         ``block`` lets the load wait until the consumer picks up an event (async app config only)
+        :return: the stream, closing it stops the stream
+        """
+        if path is not None:
+            self._get_path_obj(path)
+        if overflow == 'block' and not self._obj_async:
+            msg = f'{self.__class__.__name__} can not wait for the consumer, use the async app config instead'
+            raise ValueError(msg)
+
+        stream = ConfigChangeStream(path, maxsize=maxsize, coalesce=coalesce, overflow=overflow)
+        self._streams = (*(s for s in self._streams if not s.closed), stream)
+        return stream
+
+    def _get_path_obj(self, path: str
+                      ) -> tuple[ConfigObj | tuple[ConfigObj, ...] | Mapping[Any, ConfigObj], str | None]:
+        # object at the path and the name of the value if the path ends at a value
+        names = path.split('.')
+
+        obj: ConfigObj | tuple[ConfigObj, ...] | Mapping[Any, ConfigObj] = self
+        for i, name in enumerate(names, 1):
+            if isinstance(obj, ConfigObj):
+                if (child := obj._obj_children.get(name)) is None:
+                    # values can only be at the end of the path
+                    if i != len(names) or name not in obj._obj_keys:
+                        msg = f'{obj._full_obj_path} has no sub model {name} (path: {path})'
+                        raise ValueError(msg)
+                    return obj, name
+            else:
+                # entries are named by their index, their identity key or their key
+                for child in (obj if isinstance(obj, tuple) else obj.values()):
+                    if child._obj_path[-1] == name:
+                        break
+                else:
+                    msg = f'No entry {name} (path: {path})'
+                    raise ValueError(msg)
+            obj = child
+        return obj, None
+
+    def _get_stream_event(self, transaction: ConfigTransaction) -> ConfigChangeEvent | None:
+        if not self._streams:
+            return None
+        if any(s.closed for s in self._streams):
+            self._streams = tuple(s for s in self._streams if not s.closed)
+
+        event = transaction.create_event(self._obj_path)
+        return event if event.changes else None
+
     def set_file_path(self, path: Path | str) -> Self:
         """Set the path to the configuration file.
         If no file extension is specified ``.yml`` will be automatically appended.
@@ -61,21 +224,107 @@ class AppConfigBase(ConfigObj):
 
         return self
 
-    def _update_from_dict(self, cfg: dict, *, expansion: bool = True) -> list[ConfigNodeSubscriptionManager]:
+    def _validate_dict(self, cfg: dict, *, expansion: bool = True,
+                       refs: ExpansionReferences | None = None) -> BaseModel | IncrementalResult:
         self._preprocess.run(cfg)
 
         if expansion:
-            expand_obj(cfg)
+            expand_obj(cfg, refs=refs)
 
         # validate data
-        model_obj = self._obj_model_class.model_validate(cfg)
+        if self._incremental is not None:
+            return self._incremental.validate(cfg)
+        return self._obj_model_class.model_validate(cfg)
+
+    def _set_child_values(self, result: IncrementalResult, subscriptions: list[ConfigNodeSubscriptionManager]) -> bool:
+        value_changed = False
+        for name, (model_obj, raw) in result.children.items():
+            # only sub models are validated on their own, so the child is always a config object
+            child = cast('ConfigObj', self._obj_children[name])
+            value_changed = child._set_values(model_obj, subscriptions, raw) or value_changed
+
+        # all other keys are unchanged, so the tree matches the whole raw data again
+        self._obj_raw = result.raw
+
+        # Notify subscribers
+        if sub_manager := self._obj_subscriptions:
+            return sub_manager.notify(value_changed, subscriptions)
+        return value_changed
+
+    def _apply_model(self, model_obj: BaseModel | IncrementalResult) -> ConfigTransaction:
+        transaction = ConfigTransaction(self._subscription_stats)
+        with self._view_lock:
+            self._obj_transaction = transaction
+            try:
+                self._apply_model_values(model_obj, transaction.subscriptions)
+            except Exception:
+                transaction.rollback()
+                self._invalidate_caches()
+                raise
+            finally:
+                self._obj_transaction = None
+
+            # the new view is published when all subscription functions succeeded
+            self._view_transactions.append(transaction)
+        return transaction
+
+    def _publish_view(self, transaction: ConfigTransaction) -> None:
+        with self._view_lock:
+            self._view_transactions.remove(transaction)
+            if self._view_transactions:
+                self._view_deferred = True
+                return None
+
+            # publish the new view with a single assignment, so readers always get a consistent view
+            self._view_deferred = False
+            if self._view is not None:
+                self._view = self._get_view()
+        return None
+
+    def _invalidate_caches(self) -> None:
+        # the values do not match the file any more
+        if self._reload_cache is not None:
+            self._reload_cache.invalidate()
+        if self._incremental is not None:
+            self._incremental.applied(None)
+
+    def _rollback(self, transaction: ConfigTransaction) -> None:
+        # the view was not published yet, so it still has the restored values
+        with self._view_lock:
+            self._view_transactions.remove(transaction)
+            transaction.rollback()
+            self._invalidate_caches()
+
+            # unless the values of a successful inner load are still waiting to be published
+            if self._view_deferred and not self._view_transactions:
+                self._view_deferred = False
+                if self._view is not None:
+                    self._view = self._get_view()
+
+    def _apply_model_values(self, model_obj: BaseModel | IncrementalResult,
+                            subscriptions: list[ConfigNodeSubscriptionManager]) -> None:
+        # values might not match the file any more
+        self._invalidate_caches()
 
         # update mutable objects
-        subscriptions: list[ConfigNodeSubscriptionManager] = []
-        self._set_values(model_obj, subscriptions)
-        return subscriptions
+        if not isinstance(model_obj, IncrementalResult):
+            self._set_values(model_obj, subscriptions)
+            return None
+
+        if model_obj.model is not None:
+            self._set_values(model_obj.model, subscriptions, model_obj.raw)
+        else:
+            self._set_child_values(model_obj, subscriptions)
+
+        if self._incremental is not None:
+            self._incremental.applied(model_obj.raw)
+        return None
+
+    def _update_from_dict(self, cfg: dict, *, expansion: bool = True) -> ConfigTransaction:
+        model_obj = self._validate_dict(cfg, expansion=expansion)
+        return self._apply_model(model_obj)
 
-    def _read_create_file(self) -> CommentedMap:
+    def _read_create_file(self) -> str:
         if self._file_path is None:
             msg = 'File path not set'
             raise ValueError(msg)
@@ -88,11 +337,71 @@ class AppConfigBase(ConfigObj):
 
         # Load data from file
         with self._file_path.open('r', encoding='utf-8') as file:
-            cfg = yaml_rt.load(file)
+            return file.read()
+
+    def _validate_file(
+            self, *, expansion: bool
+    ) -> tuple[BaseModel | IncrementalResult, FileState | None, ExpansionReferences | None] | None:
+        """Read, parse and validate the configuration file. This does not modify the config object,
+        so it's safe to run in a worker thread. Returns None if the reload cache is enabled and nothing has changed."""
+
+        content = self._read_create_file()
+        fragments = self._fragments.get_state(self.config_file_path) if self._fragments is not None else ()
+
+        state: FileState | None = None
+        if (cache := self._reload_cache) is not None:
+            state = FileState.from_file(self.config_file_path, content, fragments)
+            if cache.is_current(state, expansion=expansion):
+                return None
+
+        snapshot_key = b''
+        if (snapshot := self._snapshot) is not None:
+            snapshot_key = snapshot.get_key(content, fragments, expansion=expansion)
+            if (stored := snapshot.load(self.config_file_path, snapshot_key)) is not None:
+                return stored, state, None
+
+        cfg = get_yaml_loader(self._yaml_loader_type).load(content)
         if cfg is None:
             cfg = CommentedMap()
 
-        return cfg
+        # merge the override fragments before the preprocessing and the expansion
+        if self._fragments is not None and fragments:
+            for fragment in self._fragments.load(fragments):
+                merge_dicts(cfg, fragment)
+
+        refs = ExpansionReferences() if expansion else None
+        model_obj = self._validate_dict(cfg, expansion=expansion, refs=refs)
+
+        # Values from environment variables or files must not be persisted
+        if snapshot is not None and not refs:
+            full_model = model_obj.model if isinstance(model_obj, IncrementalResult) else model_obj
+            if full_model is not None:
+                snapshot.store(self.config_file_path, snapshot_key, full_model)
+
+        return model_obj, state, refs
+
+    def _apply_file(self, model_obj: BaseModel | IncrementalResult, state: FileState | None,
+                    refs: ExpansionReferences | None, *, expansion: bool) -> ConfigTransaction:
+        transaction = self._apply_model(model_obj)
+        self._expansion_files = tuple(Path(name) for name in refs.files) if refs is not None else ()
+
+        if state is not None and self._reload_cache is not None:
+            self._reload_cache.update(state, refs, expansion=expansion)
+        return transaction
+
+    def _update_from_file(self, *, expansion: bool) -> ConfigTransaction | None:
+        if (result := self._validate_file(expansion=expansion)) is None:
+            return None
+        return self._apply_file(*result, expansion=expansion)
+
+    def _get_watched_files(self) -> tuple[Path, ...]:
+        if (fragments := self._fragments) is None:
+            return self.config_file_path, *self._expansion_files
+
+        # the directory is watched, too, so new fragments are picked up
+        config_path = self.config_file_path
+        return (config_path, fragments.get_dir(config_path), *fragments.get_files(config_path),
+                *self._expansion_files)
 
     def generate_default_yaml(self) -> str:
         """Generate the default YAML structure
@@ -112,6 +421,21 @@ class AppConfigBase(ConfigObj):
 
 
 class AppConfig(AppConfigBase):
+    _dispatch_type: ClassVar[type[ThreadDispatch]] = ThreadDispatch
+
+    def __init__(self, model: BaseModel, path: tuple[str, ...] = ('__root__',),  # noqa: PLR0913
+                 parent: MISSING_TYPE | Self = MISSING, file_defaults: BaseModel | None = None, *,
+                 reload_cache: bool = False, loader: YamlLoaderType = 'rt', snapshot: bool = False,
+                 fragments: bool = False, incremental: bool = False,
+                 dispatch: ConcurrentDispatch | ThreadDispatch | None = None, subscription_stats: bool = False,
+                 slow_subscription: float | None = None, **kwargs: Any) -> None:
+        super().__init__(model=model, path=path, parent=parent, file_defaults=file_defaults,
+                         reload_cache=reload_cache, loader=loader, snapshot=snapshot,
+                         fragments=fragments, incremental=incremental, dispatch=dispatch,
+                         subscription_stats=subscription_stats, slow_subscription=slow_subscription, **kwargs)
+        # the watcher loads from another thread. The lock is reentrant so a subscription function
+        # can still load the configuration from the thread which is doing the load.
+        self._lock: Final = RLock()
 
     def load_config_dict(self, cfg: dict, *, expansion: bool = True) -> Self:
         """Load the configuration from a dictionary
@@ -119,9 +443,10 @@ class AppConfig(AppConfigBase):
         :param cfg: config dict which will be loaded
         :param expansion: Expand ${...} in strings
         """
-        subscriptions = self._update_from_dict(cfg, expansion=expansion)
-        for sub in subscriptions:
-            sub.call()
+        self._check_waiting_load()
+        with self._lock:
+            transaction = self._update_from_dict(cfg, expansion=expansion)
+            self._call_subscriptions(transaction)
         return self
 
     def load_config_file(self, path: Path | str | None = None, *, expansion: bool = True) -> Self:
@@ -130,18 +455,65 @@ class AppConfig(AppConfigBase):
         :param path: Path to file
         :param expansion: Expand ${...} in strings
         """
+        self._check_waiting_load()
         if path is not None:
             self.set_file_path(path)
 
-        cfg = self._read_create_file()
-        self.load_config_dict(cfg, expansion=expansion)
+        with self._lock:
+            if (transaction := self._update_from_file(expansion=expansion)) is None:
+                return self
+
+            self._call_subscriptions(transaction)
         return self
 
+    def _check_waiting_load(self) -> None:
+        # A function in the thread pool of the dispatch would wait for the lock of the load which waits for it.
+        # The loading thread itself can load again because the lock is reentrant.
+        if (transaction := get_waiting_load()) is not None and transaction in self._view_transactions:
+            msg = ('The configuration can not be loaded from a subscription function in the thread pool '
+                   'because the load waits for the function')
+            raise LoadInSubscriptionError(msg)
+
+    def _call_subscriptions(self, transaction: ConfigTransaction) -> None:
+        try:
+            # the type of the dispatch is checked in __init__
+            transaction.call(cast('ThreadDispatch | None', self._dispatch))
+        except Exception:
+            self._rollback(transaction)
+            raise
+        self._publish_view(transaction)
+
+        # the load might run in another thread than the consumers
+        if (event := self._get_stream_event(transaction)) is not None:
+            for stream in self._streams:
+                stream.publish_threadsafe(event)
+
+    def watch(self, *, interval: float = 1, debounce: float = 0.2) -> ConfigFileWatcher:
+        """Watch the configuration file and all files that are used in the expansion for changes
+        and reload the configuration. Multiple changes in quick succession result in only one reload.
+        If the reload fails the error is logged and the current values are kept.
+
+        :param interval: Interval in seconds to check for changes if inotify is not available
+        :param debounce: Time in seconds without changes before the configuration is reloaded
+        :return: object which can be used to stop watching the files
+        """
+        return ThreadConfigFileWatcher(self, interval=interval, debounce=debounce)
+
 
 class AsyncAppConfig(AppConfigBase):
-    def __init__(self, model: BaseModel, path: tuple[str, ...] = ('__root__',),
-                 parent: MISSING_TYPE | Self = MISSING, file_defaults: BaseModel | None = None, **kwargs: Any) -> None:
-        super().__init__(model=model, path=path, parent=parent, file_defaults=file_defaults, **kwargs)
+    _dispatch_type: ClassVar[type[ConcurrentDispatch]] = ConcurrentDispatch
+    _obj_async: ClassVar[bool] = True
+
+    def __init__(self, model: BaseModel, path: tuple[str, ...] = ('__root__',),  # noqa: PLR0913
+                 parent: MISSING_TYPE | Self = MISSING, file_defaults: BaseModel | None = None, *,
+                 reload_cache: bool = False, loader: YamlLoaderType = 'rt', snapshot: bool = False,
+                 fragments: bool = False, incremental: bool = False,
+                 dispatch: ConcurrentDispatch | ThreadDispatch | None = None, subscription_stats: bool = False,
+                 slow_subscription: float | None = None, **kwargs: Any) -> None:
+        super().__init__(model=model, path=path, parent=parent, file_defaults=file_defaults,
+                         reload_cache=reload_cache, loader=loader, snapshot=snapshot,
+                         fragments=fragments, incremental=incremental, dispatch=dispatch,
+                         subscription_stats=subscription_stats, slow_subscription=slow_subscription, **kwargs)
         self._lock: Final = Lock()
 
     async def load_config_dict(self, cfg: dict, *, expansion: bool = True) -> Self:
@@ -151,9 +523,8 @@ class AsyncAppConfig(AppConfigBase):
         :param expansion: Expand ${...} in strings
         """
         async with self._lock:
-            subscriptions = self._update_from_dict(cfg, expansion=expansion)
-            for sub in subscriptions:
-                await sub.call_async()
+            transaction = self._update_from_dict(cfg, expansion=expansion)
+            await self._call_subscriptions(transaction)
         return self
 
     async def load_config_file(self, path: Path | str | None = None, *, expansion: bool = True) -> Self:
@@ -165,6 +536,35 @@ class AsyncAppConfig(AppConfigBase):
         if path is not None:
             self.set_file_path(path)
 
-        cfg = self._read_create_file()
-        await self.load_config_dict(cfg, expansion=expansion)
+        async with self._lock:
+            # file io, parsing and validation run in the default executor of the event loop
+            if (result := await to_thread(self._validate_file, expansion=expansion)) is None:
+                return self
+
+            transaction = self._apply_file(*result, expansion=expansion)
+            await self._call_subscriptions(transaction)
         return self
+
+    async def _call_subscriptions(self, transaction: ConfigTransaction) -> None:
+        try:
+            # the type of the dispatch is checked in __init__
+            await transaction.call_async(cast('ConcurrentDispatch | None', self._dispatch))
+        except Exception:
+            self._rollback(transaction)
+            raise
+        self._publish_view(transaction)
+
+        if (event := self._get_stream_event(transaction)) is not None:
+            for stream in self._streams:
+                await stream.publish(event)
+
+    def watch(self, *, interval: float = 1, debounce: float = 0.2) -> ConfigFileWatcher:
+        """Watch the configuration file and all files that are used in the expansion for changes
+        and reload the configuration. Multiple changes in quick succession result in only one reload.
+        If the reload fails the error is logged and the current values are kept.
+
+        :param interval: Interval in seconds to check for changes if inotify is not available
+        :param debounce: Time in seconds without changes before the configuration is reloaded
+        :return: object which can be used to stop watching the files
+        """
+        return AsyncConfigFileWatcher(self, interval=interval, debounce=debounce)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from enum import Enum
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Final, TypeAlias, get_args
+from weakref import WeakKeyDictionary
+
+from easyconfig.__const__ import ARG_NAME_IDENTITY_KEY, MISSING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic import BaseModel
+    from pydantic.fields import FieldInfo
+
+
+class ChildKind(Enum):
+    MODEL = 'model'
+    TUPLE = 'tuple'
+    MAPPING = 'mapping'
+
+
+def get_child_kind(child: Any) -> ChildKind:
+    if isinstance(child, tuple):
+        return ChildKind.TUPLE
+    if isinstance(child, Mapping):
+        return ChildKind.MAPPING
+    return ChildKind.MODEL
+
+
+def has_validators(model_cls: type[BaseModel]) -> bool:
+    decorators = model_cls.__pydantic_decorators__
+    return bool(
+        decorators.validators or decorators.field_validators or
+        decorators.root_validators or decorators.model_validators
+    )
+
+
+def get_validation_key(name: str, field: FieldInfo) -> str | None:
+    """Key of the field in the data which gets validated or None if it's not a simple key"""
+    if (key := field.validation_alias if field.validation_alias is not None else field.alias) is None:
+        return name
+    return key if isinstance(key, str) else None
+
+
+def get_identity_key(field: FieldInfo) -> str | None:
+    """Name of the field which identifies the entries of a tuple of models"""
+    if isinstance(extra := field.json_schema_extra, dict) and isinstance(key := extra.get(ARG_NAME_IDENTITY_KEY), str):
+        return key
+    return None
+
+
+def _no_values(obj: Any) -> tuple[Any, ...]:  # noqa: ARG001
+    return ()
+
+
+def _create_getter(keys: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    if not keys:
+        return _no_values
+    # attrgetter with one key returns the value instead of a tuple. Duplicating the key
+    # keeps the C implementation and the surplus value is dropped when zipped with the keys.
+    if len(keys) == 1:
+        return attrgetter(keys[0], keys[0])
+    return attrgetter(*keys)
+
+
+class ApplyPlan:
+    """Precompiled accessors to get the values and the child values from a model instance.
+    The plan is shared between all nodes of the same model class with the same keys.
+
+    The getters raise an AttributeError if a value is missing (e.g. a private attribute without default),
+    in that case ``get_missing`` has to be used."""
+
+    __slots__ = ('child_getter', 'child_identity_keys', 'child_keys', 'child_kinds', 'child_raw_keys',
+                 'value_getter', 'value_keys')
+
+    def __init__(self, child_keys: tuple[str, ...], child_kinds: tuple[ChildKind, ...],
+                 child_identity_keys: tuple[str | None, ...], child_raw_keys: tuple[str | None, ...],
+                 value_keys: tuple[str, ...]) -> None:
+        self.child_keys: Final = child_keys
+        self.child_kinds: Final = child_kinds
+        # field which identifies the entries of a tuple of models or None if the entries are matched by position
+        self.child_identity_keys: Final = child_identity_keys
+        # key of the child in the raw data or None if the child can not be skipped when its raw data is unchanged
+        self.child_raw_keys: Final = child_raw_keys
+        self.value_keys: Final = value_keys
+
+        self.child_getter: Final = _create_getter(child_keys)
+        self.value_getter: Final = _create_getter(value_keys)
+
+    @staticmethod
+    def get_missing(obj: BaseModel, keys: tuple[str, ...]) -> tuple[Any, ...]:
+        return tuple(getattr(obj, key, MISSING) for key in keys)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} children: {len(self.child_keys):d}, values: {len(self.value_keys):d}>'
+
+
+def _get_child_raw_key(model_cls: type[BaseModel], name: str, child: Any) -> str | None:
+    # Validators of the parent and additional constraints (e.g. BeforeValidator) might modify
+    # the data of the child, so the child depends on more than just its raw data
+    if has_validators(model_cls):
+        return None
+    if (field := model_cls.model_fields.get(name)) is None or field.metadata:
+        return None
+
+    kind = get_child_kind(child)
+    if kind is ChildKind.TUPLE:
+        if not all(get_args(field.annotation) == (c._obj_model_class, ...) for c in child):
+            return None
+    elif kind is ChildKind.MAPPING:
+        if not all(get_args(field.annotation)[1:] == (c._obj_model_class, ) for c in child.values()):
+            return None
+    elif field.annotation is not child._obj_model_class:
+        return None
+    return get_validation_key(name, field)
+
+
+_PlanKeyType: TypeAlias = tuple[
+    tuple[str, ...], tuple[ChildKind, ...], tuple[str | None, ...], tuple[str | None, ...], tuple[str, ...]
+]
+
+# model class -> (child keys, child kinds, child identity keys, child raw keys, value keys) -> plan
+_PLAN_CACHE: WeakKeyDictionary[type[BaseModel], dict[_PlanKeyType, ApplyPlan]] = WeakKeyDictionary()
+
+
+def get_apply_plan(model_cls: type[BaseModel], children: Mapping[str, Any], value_keys: tuple[str, ...]) -> ApplyPlan:
+    fields = model_cls.model_fields
+    key: _PlanKeyType = (
+        tuple(children),
+        tuple(get_child_kind(c) for c in children.values()),
+        tuple(get_identity_key(fields[name]) if name in fields else None for name in children),
+        tuple(_get_child_raw_key(model_cls, name, c) for name, c in children.items()),
+        value_keys
+    )
+
+    if (plans := _PLAN_CACHE.get(model_cls)) is None:
+        _PLAN_CACHE[model_cls] = plans = {}
+    if (plan := plans.get(key)) is None:
+        plans[key] = plan = ApplyPlan(*key)
+    return plan
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@dataclass(frozen=True)
+class ValueChange:
+    path: str
+    old: Any
+    new: Any
+
+
+@dataclass(frozen=True)
+class ConfigChangeEvent:
+    """Values which were changed by a load. Functions which have a required parameter get the event as an argument.
+
+    The paths are separated by dots and start at the root of the configuration, e.g. ``db.pool.size``.
+    If entries of a tuple or a dict of sub models were added or removed the tuple or dict is reported as changed.
+    """
+
+    changes: tuple[ValueChange, ...]
+
+    @classmethod
+    def merge(cls, events: Iterable[ConfigChangeEvent]) -> ConfigChangeEvent:
+        """Merge the events of several loads into one event.
+        Every path is reported once with the value before the first load and the value after the last load.
+
+        :param events: events in the order of the loads
+        """
+        changes: dict[str, ValueChange] = {}
+        for event in events:
+            for change in event.changes:
+                if (prev := changes.get(change.path)) is None:
+                    changes[change.path] = change
+                else:
+                    changes[change.path] = ValueChange(change.path, prev.old, change.new)
+        return cls(tuple(changes.values()))
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        """Paths of the changed values"""
+        return tuple(change.path for change in self.changes)
+
+    def get(self, path: str) -> ValueChange | None:
+        """Change of the value at the path or None if the value did not change
+
+        :param path: path of the value
+        """
+        for change in self.changes:
+            if change.path == path:
+                return change
+        return None
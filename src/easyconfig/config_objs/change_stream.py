@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from asyncio import Event, get_running_loop
+from collections import deque
+from typing import TYPE_CHECKING, Final, Literal, TypeAlias
+
+from easyconfig.config_objs.change_event import ConfigChangeEvent
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+OverflowPolicyType: TypeAlias = Literal['drop_oldest', 'block']
+
+
+class ConfigChangeStream:
+    """Async iterator over the changes of the configuration. Every load which changes values below the path
+    is reported with one ``ConfigChangeEvent`` after all subscription functions have been called successfully.
+
+    :param path: Only report changes of the value or the sub model at this path. None reports all changes.
+    :param maxsize: Maximum number of events which are queued until they are consumed
+    :param coalesce: Merge the new event into the queued event if the consumer has not picked it up yet
+    :param overflow: ``drop_oldest`` removes the oldest queued event if the queue is full,
+                     ``block`` waits until the consumer picks up an event
+    """
+
+    def __init__(self, path: str | None = None, *, maxsize: int = 16, coalesce: bool = False,
+                 overflow: OverflowPolicyType = 'drop_oldest') -> None:
+        if maxsize <= 0:
+            msg = f'Maxsize must be greater than 0: {maxsize}'
+            raise ValueError(msg)
+        if overflow not in ('drop_oldest', 'block'):
+            msg = f'Unknown overflow policy: {overflow}'
+            raise ValueError(msg)
+
+        self.path: Final = path
+        self._maxsize: Final = maxsize
+        self._coalesce: Final = coalesce
+        self._overflow: Final = overflow
+        # number of events which were dropped because the queue was full
+        self.dropped: int = 0
+
+        # the stream is used by the consumer in the event loop, so events are always queued in the loop
+        self._loop: Final = get_running_loop()
+        self._events: Final[deque[ConfigChangeEvent]] = deque()
+        self._not_empty: Final = Event()
+        self._not_full: Final = Event()
+        self._closed: bool = False
+
+    def _select(self, event: ConfigChangeEvent) -> ConfigChangeEvent | None:
+        if (path := self.path) is None:
+            return event
+        prefix = f'{path}.'
+        changes = tuple(change for change in event.changes if change.path == path or change.path.startswith(prefix))
+        return ConfigChangeEvent(changes) if changes else None
+
+    def _put_nowait(self, event: ConfigChangeEvent) -> None:
+        if self._closed:
+            return None
+
+        events = self._events
+        if self._coalesce and events:
+            events[-1] = ConfigChangeEvent.merge((events[-1], event))
+        else:
+            if len(events) >= self._maxsize:
+                events.popleft()
+                self.dropped += 1
+            events.append(event)
+        self._not_empty.set()
+        return None
+
+    async def _put(self, event: ConfigChangeEvent) -> None:
+        if self._overflow == 'block' and not self._coalesce:
+            while len(self._events) >= self._maxsize and not self._closed:
+                self._not_full.clear()
+                await self._not_full.wait()
+        self._put_nowait(event)
+
+    async def publish(self, event: ConfigChangeEvent) -> None:
+        if (selected := self._select(event)) is not None:
+            await self._put(selected)
+
+    def publish_threadsafe(self, event: ConfigChangeEvent) -> None:
+        if (selected := self._select(event)) is None:
+            return None
+
+        try:
+            in_loop = get_running_loop() is self._loop
+        except RuntimeError:
+            in_loop = False
+
+        if in_loop:
+            self._put_nowait(selected)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._put_nowait, selected)
+        return None
+
+    def close(self) -> None:
+        """Stop the stream. Events which are already queued are still returned by the iterator."""
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
+    @property
+    def closed(self) -> bool:
+        """True if the stream has been closed"""
+        return self._closed
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> ConfigChangeEvent:
+        while not self._events:
+            if self._closed:
+                raise StopAsyncIteration()
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        event = self._events.popleft()
+        self._not_full.set()
+        return event
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None,
+                        exc_tb: TracebackType | None) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f'<{self.__class__.__name__} path: {self.path} queued: {len(self._events):d} '
+                f'dropped: {self.dropped:d}>')
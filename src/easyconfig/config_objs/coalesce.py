@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import logging
+from asyncio import ensure_future, get_running_loop
+from functools import partial
+from inspect import isawaitable
+from threading import Lock, Timer
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from easyconfig.config_objs.change_event import ConfigChangeEvent
+from easyconfig.errors.handler import process_exception
+
+
+if TYPE_CHECKING:
+    from asyncio import Future, TimerHandle
+    from collections.abc import Callable
+    from weakref import ReferenceType
+
+    from easyconfig.config_objs.subscription import SubscriptionTargetType
+    from easyconfig.config_objs.subscription_stats import SubscriptionStats
+    from easyconfig.config_objs.transaction import ConfigTransaction
+
+
+log = logging.getLogger('easyconfig.coalesce')
+
+
+def _report(e: Exception) -> None:
+    # There is no load which could restore the values, so errors from the exception handler can only be logged
+    try:
+        process_exception(e)
+    except Exception as handler_e:
+        log.error(f'Error in subscription function: {handler_e}')
+
+
+def _report_future(future: Future) -> None:
+    if not future.cancelled() and (e := future.exception()) is not None:
+        _report(e)  # type: ignore[arg-type]
+
+
+class CoalescedCall:
+    """Delay the call of a subscription function and merge the changes of all loads until the function is called.
+
+    :param func: subscription function
+    :param name: name of the subscription
+    :param debounce: Call the function only after there was no change for this time in seconds
+    :param max_rate: Call the function at most this many times per second
+    :param in_loop: Schedule the delayed calls in the running event loop instead of a timer thread
+    :param weak: The function is a weak reference to the subscription function
+    """
+
+    def __init__(self, func: SubscriptionTargetType, name: str, *, debounce: float | None = None,  # noqa: PLR0913
+                 max_rate: float | None = None, in_loop: bool = False, weak: bool = False) -> None:
+        if debounce is not None and debounce <= 0:
+            msg = f'Debounce must be greater than 0: {debounce}'
+            raise ValueError(msg)
+        if max_rate is not None and max_rate <= 0:
+            msg = f'Max rate must be greater than 0: {max_rate}'
+            raise ValueError(msg)
+
+        self._func: Final = func
+        self._name: Final = name
+        self._debounce: Final = debounce
+        self._interval: Final = 1 / max_rate if max_rate is not None else None
+        self._in_loop: Final = in_loop
+        self._weak: Final = weak
+
+        self._lock: Final = Lock()
+        # the loads which are reported by the pending call, the event is None if the function does not accept it
+        self._queued: list[tuple[ConfigTransaction, ConfigChangeEvent | None]] = []
+        self._pending: TimerHandle | Timer | None = None
+        self._last_call: float | None = None
+        self._stats: SubscriptionStats | None = None
+
+    def __call__(self, transaction: ConfigTransaction, event: ConfigChangeEvent | None = None) -> Any:
+        with self._lock:
+            self._queued.append((transaction, event))
+            self._stats = transaction.stats
+
+            now = monotonic()
+            delay = 0.0
+            if self._interval is not None and self._last_call is not None:
+                delay = self._last_call + self._interval - now
+            if self._debounce is not None:
+                delay = max(delay, self._debounce)
+            elif self._pending is not None:
+                # the pending call will report the change
+                transaction.delayed.append(self)
+                return None
+
+            if self._pending is not None:
+                self._pending.cancel()
+                self._pending = None
+
+            if delay > 0:
+                if self._in_loop:
+                    self._pending = get_running_loop().call_later(delay, self._call_later)
+                else:
+                    self._pending = timer = Timer(delay, self._call_later)
+                    timer.daemon = True
+                    timer.start()
+                transaction.delayed.append(self)
+                return None
+
+            # The first call within the rate limit is not delayed.
+            # It is part of the load, so errors restore the previous values like for all other functions.
+            self._last_call = now
+            event = self._take_event()
+        return self._run(event)
+
+    def _take_event(self) -> ConfigChangeEvent | None:
+        events = [event for _, event in self._queued if event is not None]
+        self._queued = []
+        if not events:
+            return None
+        return events[0] if len(events) == 1 else ConfigChangeEvent.merge(events)
+
+    def _run(self, event: ConfigChangeEvent | None) -> Any:
+        func: Callable[..., Any] | None
+        if self._weak:
+            func = cast('ReferenceType[Callable[..., Any]]', self._func)()
+        else:
+            func = cast('Callable[..., Any]', self._func)
+        if func is None:
+            return None
+        if event is not None:
+            func = partial(func, event)
+        if (stats := self._stats) is not None:
+            return stats.call(func, self._name)
+        return func()
+
+    def _call_later(self) -> None:
+        with self._lock:
+            # the timer might have fired while the only queued load was rolled back
+            if not self._queued:
+                return None
+            self._pending = None
+            self._last_call = monotonic()
+            event = self._take_event()
+
+        try:
+            result = self._run(event)
+        except Exception as e:
+            _report(e)
+            return None
+
+        if not isawaitable(result):
+            return None
+        if not self._in_loop:
+            if (close := getattr(result, 'close', None)) is not None:
+                close()
+            msg = (f'Subscription target {self._name} is an async function! '
+                   f'Use the async app config instead.')
+            _report(TypeError(msg))
+            return None
+
+        ensure_future(result).add_done_callback(_report_future)
+        return None
+
+    def discard(self, transaction: ConfigTransaction) -> None:
+        """Remove the changes of a load which was rolled back.
+        The pending call is canceled if no other load is waiting for it."""
+        with self._lock:
+            self._queued = [entry for entry in self._queued if entry[0] is not transaction]
+            if not self._queued and self._pending is not None:
+                self._pending.cancel()
+                self._pending = None
+
+    def cancel(self) -> None:
+        """Cancel the pending call"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.cancel()
+                self._pending = None
+            self._queued = []
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self._name} debounce: {self._debounce} interval: {self._interval}>'
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import logging
+from asyncio import Semaphore, gather, wait_for
+from asyncio import TimeoutError as AsyncTimeoutError
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from inspect import isawaitable
+from threading import local
+from typing import TYPE_CHECKING, Any, Final
+
+from easyconfig.errors import SubscriptionTimeoutError
+from easyconfig.errors.handler import process_exception
+
+
+if TYPE_CHECKING:
+    from easyconfig.config_objs import ConfigObjSubscription
+    from easyconfig.config_objs.subscription import SubscriptionCallbackType
+    from easyconfig.config_objs.transaction import ConfigTransaction
+
+
+log = logging.getLogger('easyconfig.dispatch')
+
+# the load which waits for the function that runs in the current thread of the pool
+_waiting_load: Final = local()
+
+
+def get_waiting_load() -> ConfigTransaction | None:
+    """Load which waits for the subscription function that runs in the current thread"""
+    return getattr(_waiting_load, 'transaction', None)
+
+
+class ConcurrentDispatch:
+    """Run the async subscription functions concurrently instead of one after another.
+    The prepare functions still finish before the other functions are started.
+
+    Errors do not stop the other functions. After all functions are done every error
+    is passed to the exception handler (see ``easyconfig.errors.set_exception_handler``).
+    The default handler raises the error which restores the previous values.
+
+    :param limit: Maximum number of functions which run at the same time
+    :param timeout: Time in seconds after which a function is canceled
+    """
+
+    def __init__(self, *, limit: int | None = None, timeout: float | None = None) -> None:
+        if limit is not None and limit <= 0:
+            msg = f'Limit must be greater than 0: {limit}'
+            raise ValueError(msg)
+        if timeout is not None and timeout <= 0:
+            msg = f'Timeout must be greater than 0: {timeout}'
+            raise ValueError(msg)
+
+        self._limit: Final = limit
+        self._timeout: Final = timeout
+
+    async def _run(self, target: SubscriptionCallbackType, sub: ConfigObjSubscription,
+                   semaphore: Semaphore | None) -> None:
+        if semaphore is not None:
+            async with semaphore:
+                return await self._run(target, sub, None)
+
+        if not isawaitable(result := target()):
+            return None
+        if (timeout := self._timeout) is None:
+            await result
+            return None
+
+        try:
+            await wait_for(result, timeout)
+        except AsyncTimeoutError:
+            msg = f'{sub.name} did not finish within {timeout}s'
+            raise SubscriptionTimeoutError(msg) from None
+        return None
+
+    async def call(self, transaction: ConfigTransaction, *, prepare: bool = False) -> None:
+        targets = transaction.get_targets(prepare=prepare)
+        if not targets:
+            return None
+
+        semaphore = Semaphore(self._limit) if self._limit is not None and self._limit < len(targets) else None
+        results: list[Any] = await gather(
+            *(self._run(target, sub, semaphore) for target, sub in targets), return_exceptions=True)
+
+        for result in results:
+            # e.g. CancelledError
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        for result in results:
+            if isinstance(result, Exception):
+                process_exception(result)
+        return None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} limit: {self._limit} timeout: {self._timeout}>'
+
+
+class ThreadDispatch:
+    """Run the subscription functions in a thread pool instead of the thread which loads the configuration.
+    The prepare functions are always awaited and still finish before the other functions are started.
+
+    Errors do not stop the other functions. Every error is passed to the exception handler
+    (see ``easyconfig.errors.set_exception_handler``). If the functions are awaited the default handler raises
+    the error which restores the previous values. Otherwise errors from the exception handler are logged.
+    A function can not load the configuration while the load waits for it, this raises a ``LoadInSubscriptionError``.
+
+    :param executor: Executor which runs the functions. If not set a new thread pool will be created.
+    :param wait: Wait for the functions to finish before the load returns
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor | None = None, *, wait: bool = True) -> None:
+        self._executor: Final = executor if executor is not None else ThreadPoolExecutor(
+            thread_name_prefix='easyconfig')
+        self._wait: Final = wait
+        # subscription -> subscriptions which have to finish before
+        self._after: Final[dict[ConfigObjSubscription, tuple[ConfigObjSubscription, ...]]] = {}
+
+    def run_after(self, subscription: ConfigObjSubscription, *after: ConfigObjSubscription) -> None:
+        """Run the function of the subscription after the functions of the other subscriptions have finished.
+        If one of these functions fails the function of the subscription will not be called.
+        The order only applies if the functions are called for the same load.
+
+        :param subscription: subscription of the dependent function
+        :param after: subscriptions of the functions which have to run before
+        """
+        # prevent cycles
+        stack = list(after)
+        while stack:
+            if (sub := stack.pop()) is subscription:
+                msg = f'Cyclic order: {subscription.name} would have to run after itself'
+                raise ValueError(msg)
+            stack.extend(self._after.get(sub, ()))
+
+        self._after[subscription] = (*self._after.get(subscription, ()), *after)
+
+        # the order is removed with the subscriptions, so they can be garbage collected
+        for sub in (subscription, *after):
+            if self._forget not in sub._sub_on_cancel:
+                sub._sub_on_cancel = (*sub._sub_on_cancel, self._forget)
+
+    def _forget(self, subscription: ConfigObjSubscription) -> None:
+        self._after.pop(subscription, None)
+        for sub, after in tuple(self._after.items()):
+            if subscription not in after:
+                continue
+            if remaining := tuple(b for b in after if b is not subscription):
+                self._after[sub] = remaining
+            else:
+                del self._after[sub]
+
+    def _sort(self, targets: list[tuple[SubscriptionCallbackType, ConfigObjSubscription]]
+              ) -> list[tuple[SubscriptionCallbackType, ConfigObjSubscription]]:
+        if not self._after:
+            return targets
+
+        # stable topological sort, so functions which run after others are submitted after them
+        by_sub = {sub: (target, sub) for target, sub in targets}
+        done: set[ConfigObjSubscription] = set()
+        ret: list[tuple[SubscriptionCallbackType, ConfigObjSubscription]] = []
+
+        def add(sub: ConfigObjSubscription) -> None:
+            if sub in done:
+                return None
+            done.add(sub)
+            for before in self._after.get(sub, ()):
+                if before in by_sub:
+                    add(before)
+            ret.append(by_sub[sub])
+            return None
+
+        for _, sub in targets:
+            add(sub)
+        return ret
+
+    @staticmethod
+    def _run(target: SubscriptionCallbackType, sub: ConfigObjSubscription, before: list[Future],
+             waiting: ConfigTransaction | None) -> None:
+        # The executor starts the functions in the order they were submitted so the functions
+        # which have to run before are already running and waiting for them can not block the pool
+        for future in before:
+            if future.exception() is not None:
+                return None
+
+        # a load from within the function would wait for the load which waits for the function
+        _waiting_load.transaction = waiting
+        try:
+            result = target()
+        finally:
+            _waiting_load.transaction = None
+
+        if isawaitable(result):
+            msg = f'Subscription target {target} @ {sub.name} is an async function! Use the async app config instead.'
+            raise TypeError(msg)
+        return None
+
+    @staticmethod
+    def _report(future: Future) -> None:
+        if (e := future.exception()) is None:
+            return None
+        try:
+            process_exception(e)  # type: ignore[arg-type]
+        except Exception as e:
+            log.error(f'Error in subscription function: {e}')
+        return None
+
+    def call(self, transaction: ConfigTransaction, *, prepare: bool = False) -> None:
+        targets = transaction.get_targets(prepare=prepare)
+        if not targets:
+            return None
+
+        wait = prepare or self._wait
+        waiting = transaction if wait else None
+
+        futures: dict[ConfigObjSubscription, Future] = {}
+        for target, sub in self._sort(targets):
+            before = [futures[b] for b in self._after.get(sub, ()) if b in futures]
+            futures[sub] = self._executor.submit(self._run, target, sub, before, waiting)
+
+        if not wait:
+            for future in futures.values():
+                future.add_done_callback(self._report)
+            return None
+
+        wait_futures(futures.values())
+        for future in futures.values():
+            if (e := future.exception()) is not None:
+                process_exception(e)  # type: ignore[arg-type]
+        return None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} wait: {self._wait}>'
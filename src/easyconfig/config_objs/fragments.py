@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Final, TypeAlias
+
+from easyconfig.watcher.backend import FileSignatureType, get_file_signature
+from easyconfig.yaml import get_yaml_loader
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from easyconfig.yaml import YamlLoaderType
+
+
+FragmentStateType: TypeAlias = tuple[tuple['Path', FileSignatureType], ...]
+
+FRAGMENT_SUFFIXES: Final = ('.yml', '.yaml')
+
+
+def merge_dicts(base: MutableMapping, override: Mapping) -> MutableMapping:
+    """Deep merge override into base. Mappings are merged, all other values are replaced."""
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(existing := base.get(key), MutableMapping):
+            merge_dicts(existing, value)
+        else:
+            base[key] = deepcopy(value)
+    return base
+
+
+class ConfigFragments:
+    """Override fragments in the directory ``<name>.d`` next to the configuration file ``<name>.yml``.
+    The fragments are applied in the order of their file names.
+    Each fragment is parsed only once as long as it does not change."""
+
+    def __init__(self, loader: YamlLoaderType) -> None:
+        self._loader: Final = loader
+        self._cache: dict[Path, tuple[FileSignatureType, Any]] = {}
+
+    @staticmethod
+    def get_dir(config_path: Path) -> Path:
+        return config_path.with_name(f'{config_path.stem}.d')
+
+    def get_files(self, config_path: Path) -> tuple[Path, ...]:
+        try:
+            files = [p for p in self.get_dir(config_path).iterdir() if p.suffix in FRAGMENT_SUFFIXES and p.is_file()]
+        except OSError:
+            return ()
+        return tuple(sorted(files, key=lambda p: p.name))
+
+    def get_state(self, config_path: Path) -> FragmentStateType:
+        return tuple((p, get_file_signature(p)) for p in self.get_files(config_path))
+
+    def _parse(self, path: Path) -> Any:
+        # the fragments are parsed in parallel and the yaml instances are not thread safe
+        with path.open('r', encoding='utf-8') as file:
+            data = get_yaml_loader(self._loader).load(file)
+        if data is not None and not isinstance(data, Mapping):
+            msg = f'Configuration fragment {path} must contain a mapping, got {type(data).__name__}'
+            raise TypeError(msg)
+        return data
+
+    def load(self, state: FragmentStateType) -> list[Mapping]:
+        """Return the parsed fragments. Only new or changed fragments are parsed."""
+        cache = self._cache
+
+        todo = [p for p, signature in state if (entry := cache.get(p)) is None or entry[0] != signature]
+        if len(todo) == 1:
+            parsed = [self._parse(todo[0])]
+        elif todo:
+            with ThreadPoolExecutor(max_workers=min(len(todo), os.cpu_count() or 1)) as executor:
+                parsed = list(executor.map(self._parse, todo))
+        else:
+            parsed = []
+
+        signatures = dict(state)
+        for path, data in zip(todo, parsed, strict=True):
+            cache[path] = signatures[path], data
+
+        # remove fragments that don't exist any more
+        for path in tuple(cache):
+            if path not in signatures:
+                cache.pop(path)
+
+        return [data for p, _ in state if (data := cache[p][1]) is not None]
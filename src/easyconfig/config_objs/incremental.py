@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from copy import deepcopy
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any, Final
+
+from easyconfig.__const__ import MISSING
+from easyconfig.config_objs.apply_plan import get_validation_key, has_validators
+from easyconfig.config_objs.object_config import ConfigObj
+
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+# values from yaml which can not be modified, so they don't need to be copied
+_IMMUTABLE: Final = (str, int, float, bool, bytes, date, datetime, time, timedelta, type(None))
+
+
+def copy_raw(obj: Any) -> Any:
+    """Copy the raw data, so later modifications of the loaded dict by the caller are not missed.
+    Only the containers are copied, this is much faster than a deepcopy."""
+    if isinstance(obj, _IMMUTABLE):
+        return obj
+    if isinstance(obj, dict):
+        return {key: copy_raw(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [copy_raw(value) for value in obj]
+    if isinstance(obj, tuple):
+        return tuple(copy_raw(value) for value in obj)
+    if isinstance(obj, Mapping):
+        return {key: copy_raw(value) for key, value in obj.items()}
+    return deepcopy(obj)
+
+
+class IncrementalResult:
+    """Either the completely validated model or the validated child models (with their raw data)
+    of the keys that changed since the last load"""
+
+    def __init__(self, raw: Mapping[str, Any], model: BaseModel | None = None,
+                 children: dict[str, tuple[BaseModel, Any]] | None = None) -> None:
+        self.raw: Final = raw
+        self.model: Final = model
+        self.children: Final = children if children is not None else {}
+
+    def __repr__(self) -> str:
+        if self.model is not None:
+            return f'<{self.__class__.__name__} {self.model.__class__.__name__}>'
+        return f'<{self.__class__.__name__} {", ".join(self.children)}>'
+
+
+class IncrementalValidation:
+    """Compares the loaded data with the data of the last load and validates only the child models that changed.
+    If something else changed or the root model has validators that might depend on other fields
+    the whole model is validated."""
+
+    def __init__(self, obj: ConfigObj) -> None:
+        self._obj: Final = obj
+        self._last: Mapping[str, Any] | None = None
+
+        # raw key -> name and object of the child, created lazily because the children are created after __init__
+        self._children: dict[str, tuple[str, ConfigObj]] | None = None
+
+    def _get_children(self) -> dict[str, tuple[str, ConfigObj]]:
+        if self._children is not None:
+            return self._children
+
+        obj = self._obj
+        children: dict[str, tuple[str, ConfigObj]] = {}
+        if not has_validators(obj._obj_model_class):
+            for name, field in obj._obj_model_fields.items():
+                child = obj._obj_children.get(name)
+                # tuples of sub models and fields with additional constraints are always validated with the parent
+                if not isinstance(child, ConfigObj) or field.annotation is not child._obj_model_class or field.metadata:
+                    continue
+                if (key := get_validation_key(name, field)) is not None:
+                    children[key] = name, child
+
+        self._children = children
+        return children
+
+    def validate(self, cfg: Mapping[str, Any]) -> IncrementalResult:
+        # the raw data is kept for the comparison with the next load, so it must not be the dict of the caller
+        raw = copy_raw(cfg)
+
+        # A pending on_next_value subscription removes the raw data of its node and of all parents.
+        # The whole model is applied then, which still skips the subtrees with unchanged raw data.
+        if (last := self._last) is None or raw.keys() != last.keys() or self._obj._obj_raw is MISSING:
+            return IncrementalResult(raw, model=self._obj._obj_model_class.model_validate(cfg))
+
+        children = self._get_children()
+        changed = [key for key, value in raw.items() if value != last[key]]
+        if any(key not in children for key in changed):
+            return IncrementalResult(raw, model=self._obj._obj_model_class.model_validate(cfg))
+
+        # pydantic caches the validator on the model class so we can use it directly
+        validated: dict[str, tuple[BaseModel, Any]] = {}
+        for key in changed:
+            name, child = children[key]
+            validated[name] = child._obj_model_class.model_validate(cfg[key]), raw[key]
+        return IncrementalResult(raw, children=validated)
+
+    def applied(self, raw: Mapping[str, Any] | None) -> None:
+        """Set the data which was applied. None forces a full validation on the next load."""
+        self._last = raw
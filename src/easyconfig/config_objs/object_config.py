@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from inspect import getmembers, isfunction
-from typing import TYPE_CHECKING, Any, Final, NoReturn
+from itertools import repeat
+from types import MappingProxyType, NoneType
+from typing import TYPE_CHECKING, Any, ClassVar, Final, NoReturn, TypeAlias, cast, get_args
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -9,24 +13,117 @@ from typing_extensions import Self
 from easyconfig import AppConfigMixin
 from easyconfig.__const__ import MISSING, MISSING_TYPE
 from easyconfig.config_objs import ConfigNodeSubscriptionManager, ConfigObjSubscription
+from easyconfig.config_objs.apply_plan import ChildKind, get_apply_plan, get_identity_key
+from easyconfig.config_objs.view import ConfigView
 from easyconfig.errors import FunctionCallNotAllowedError
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from pathlib import Path
 
     from pydantic.fields import FieldInfo
 
+    from easyconfig.config_objs.apply_plan import ApplyPlan
+    from easyconfig.config_objs.transaction import ConfigTransaction
+
 
 def should_be_copied(o: object) -> bool:
     return isfunction(o) or isinstance(o, property)
 
 
+def _is_model_type(obj: Any) -> bool:
+    return isinstance(obj, type) and issubclass(obj, BaseModel)
+
+
+def is_model_tuple(field: FieldInfo, value: Any) -> bool:
+    if not isinstance(value, tuple):
+        return False
+    if value:
+        return all(isinstance(x, BaseModel) for x in value)
+
+    # an empty tuple can only be identified by the type hint
+    args = get_args(field.annotation)
+    return bool(args) and _is_model_type(args[0])
+
+
+def is_model_dict(field: FieldInfo, value: Any) -> bool:
+    # a dict which can be None is a plain value, because the children can not be replaced by None
+    if not isinstance(value, dict) or NoneType in get_args(field.annotation):
+        return False
+    if value:
+        return all(isinstance(x, BaseModel) for x in value.values())
+
+    # an empty dict can only be identified by the type hint
+    args = get_args(field.annotation)
+    return len(args) == 2 and _is_model_type(args[1])  # noqa: PLR2004
+
+
+def check_identity_keys(values: tuple[BaseModel, ...], identity_key: str, path: str) -> None:
+    # the entries are named after the identity key, so duplicates would result in ambiguous paths
+    names: set[str] = set()
+    for value in values:
+        if (name := str(getattr(value, identity_key))) in names:
+            msg = f'Duplicate identity key {identity_key}={name} in {path}'
+            raise ValueError(msg)
+        names.add(name)
+
+
 NO_COPY = tuple(n for n, o in getmembers(AppConfigMixin) if should_be_copied(o))
 
 
+def get_copied_members(model_cls: type[BaseModel]) -> dict[str, Any]:
+    """User defined functions and properties of the model"""
+    members: dict[str, Any] = {}
+    for name, member in getmembers(model_cls):
+        if not name.startswith('_') and name not in NO_COPY and should_be_copied(member):
+            members[name] = member  # noqa: PERF403
+    return members
+
+
+# model class -> (config obj class, compact) -> generated class
+# weak keys so models which are created dynamically (e.g. in functions) can be garbage collected
+_OBJ_CLASS_CACHE: WeakKeyDictionary[
+    type[BaseModel], dict[tuple[type[ConfigObj], bool], type[ConfigObj]]
+] = WeakKeyDictionary()
+
+
+# nodes of the same model share the tuples with the keys and nodes without children share an empty mapping
+# model class -> generated view class
+_VIEW_CLASS_CACHE: WeakKeyDictionary[type[BaseModel], type[ConfigView]] = WeakKeyDictionary()
+
+
+def get_view_class(model_cls: type[BaseModel]) -> type[ConfigView]:
+    """Return the view class for the model. The view has the same functions and properties as the config object"""
+    if (view_cls := _VIEW_CLASS_CACHE.get(model_cls)) is None:
+        namespace = get_copied_members(model_cls)
+        namespace['__slots__'] = (*model_cls.model_fields, *model_cls.__private_attributes__)
+        _VIEW_CLASS_CACHE[model_cls] = view_cls = type(f'{model_cls.__name__}{ConfigView.__name__}',
+                                                       (ConfigView, ), namespace)
+    return view_cls
+
+
+_KEY_TUPLES: dict[tuple[str, ...], tuple[str, ...]] = {}
+_NO_CHILDREN: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# a child is a sub model, a tuple of sub models or a dict of sub models
+ConfigChildType: TypeAlias = 'ConfigObj | tuple[ConfigObj, ...] | Mapping[Any, ConfigObj]'
+
+
 class ConfigObj:
+    # the values are stored in the __dict__ or in the slots of the generated class for the model
+    __slots__ = (
+        '__weakref__',
+        '_obj_children', '_obj_generation', '_obj_keys', '_obj_model_class', '_obj_model_fields',
+        '_obj_model_private_attrs', '_obj_parent', '_obj_path', '_obj_plan', '_obj_raw', '_obj_subscriptions',
+        '_obj_transaction', '_obj_value_keys', '_obj_view',
+    )
+
+    # set on the generated classes with slots for the values, so new entries of tuples are created the same way
+    _obj_compact: ClassVar[bool] = False
+    # the root of the async app config is loaded in the event loop, so delayed calls are scheduled there
+    _obj_async: ClassVar[bool] = False
+
     def __init__(self, model: BaseModel, path: tuple[str, ...] = ('__root__',),
                  parent: MISSING_TYPE | ConfigObj = MISSING, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -39,36 +136,68 @@ class ConfigObj:
         self._obj_model_private_attrs: Final[tuple[str, ...]] = tuple(model.__private_attributes__.keys())
 
         self._obj_keys: tuple[str, ...] = ()
-        self._obj_values: dict[str, Any] = {}
-        self._obj_children: dict[str, ConfigObj | tuple[ConfigObj, ...]] = {}
+        # the values are only stored as attributes
+        self._obj_value_keys: tuple[str, ...] = ()
+        self._obj_children: Mapping[str, ConfigChildType] = _NO_CHILDREN
 
         self._obj_subscriptions: ConfigNodeSubscriptionManager | None = None
+        self._obj_plan: ApplyPlan | None = None
+        # raw data of the last applied values
+        self._obj_raw: Any = MISSING
+        # immutable view of the current values, it's created on demand and dropped when the values change
+        self._obj_view: ConfigView | None = None
+        # increases every time a value of this object or of one of its children changes
+        self._obj_generation: int = 0
+        # set on the root object while a load is applied, it collects the previous values of the changed objects
+        self._obj_transaction: ConfigTransaction | None = None
 
     @property
     def _full_obj_path(self) -> str:
         return '.'.join(self._obj_path)
 
+    @property
+    def _obj_values(self) -> dict[str, Any]:
+        return {key: getattr(self, key) for key in self._obj_value_keys}
+
     @classmethod
-    def from_model(cls, model: BaseModel, path: tuple[str, ...] = ('__root__',),
-                   parent: MISSING_TYPE | ConfigObj = MISSING, **kwargs) -> Self:
+    def _get_obj_class(cls, model_cls: type[BaseModel], *, compact: bool = False) -> type[Self]:
+        """Return the class for the model. The classes are cached so identical models share the same class.
+        Compact classes store the values of the model in slots instead of the instance dict,
+        so the instances have no dict at all."""
+        if (classes := _OBJ_CLASS_CACHE.get(model_cls)) is None:
+            _OBJ_CLASS_CACHE[model_cls] = classes = {}
+        if (obj_cls := classes.get((cls, compact))) is not None:
+            # the cache is keyed by the class, so the cached class is always a subclass of cls
+            return cast('type[Self]', obj_cls)
 
         # Copy functions from the class definition to the child class
-        functions = {}
-        for name, member in getmembers(model.__class__):
-            if not name.startswith('_') and name not in NO_COPY and should_be_copied(member):
-                functions[name] = member  # noqa: PERF403
+        namespace = get_copied_members(model_cls)
+
+        if compact:
+            namespace['__slots__'] = (*model_cls.model_fields, *model_cls.__private_attributes__)
+            namespace['_obj_compact'] = True
+        elif not cls.__dictoffset__:
+            # subclasses like the app config already have an instance dict
+            namespace['__slots__'] = ('__dict__', )
 
         # Create a new class that pulls down the user defined functions if there are any
         # It's not possible to attach the functions to the existing class instance
-        if functions:
-            new_cls = type(f'{model.__class__.__name__}{cls.__name__}', (cls,), functions)
-            ret = new_cls(model, path, parent, **kwargs)
-        else:
-            ret = cls(model, path, parent, **kwargs)
+        new_cls = type(f'{model_cls.__name__}{cls.__name__}', (cls,), namespace) if namespace else cls
+        classes[(cls, compact)] = new_cls
+        return new_cls
+
+    @classmethod
+    def from_model(cls, model: BaseModel, path: tuple[str, ...] = ('__root__',),
+                   parent: MISSING_TYPE | ConfigObj = MISSING, *, compact: bool = False, **kwargs) -> Self:
+
+        ret = cls._get_obj_class(model.__class__, compact=compact)(model, path, parent, **kwargs)
 
         # Set the values or create corresponding subclasses
         keys = []
-        for key in ret._obj_model_fields:
+        value_keys = []
+        children: dict[str, ConfigChildType] = {}
+        attrib: Any
+        for key, field in ret._obj_model_fields.items():
             value = getattr(model, key, MISSING)
             if value is MISSING:
                 continue
@@ -76,13 +205,23 @@ class ConfigObj:
             keys.append(key)
 
             if isinstance(value, BaseModel):
-                ret._obj_children[key] = attrib = ConfigObj.from_model(value, path=(*path, key), parent=ret)
-            elif isinstance(value, tuple) and all(isinstance(x, BaseModel) for x in value):
-                ret._obj_children[key] = attrib = tuple(
-                    ConfigObj.from_model(o, path=(*path, key, str(i)), parent=ret) for i, o in enumerate(value)
+                children[key] = attrib = ConfigObj.from_model(
+                    value, path=(*path, key), parent=ret, compact=compact)
+            elif is_model_tuple(field, value):
+                if (identity_key := get_identity_key(field)) is not None:
+                    check_identity_keys(value, identity_key, '.'.join((*path, key)))
+                children[key] = attrib = tuple(
+                    ret._create_entry(key, str(getattr(o, identity_key)) if identity_key is not None else str(i), o)
+                    for i, o in enumerate(value)
+                )
+            elif is_model_dict(field, value):
+                # the mapping is read only, it gets replaced if entries are added or removed
+                children[key] = attrib = MappingProxyType(
+                    {k: ret._create_entry(key, str(k), o) for k, o in value.items()}
                 )
             else:
-                ret._obj_values[key] = attrib = value
+                value_keys.append(key)
+                attrib = value
 
             # set child and values
             setattr(ret, key, attrib)
@@ -94,49 +233,227 @@ class ConfigObj:
                 continue
 
             keys.append(key)
-
-            ret._obj_values[key] = value
+            value_keys.append(key)
             setattr(ret, key, value)
 
-        ret._obj_keys = tuple(keys)
+        if children:
+            ret._obj_children = children
+        ret._obj_keys = _KEY_TUPLES.setdefault(obj_keys := tuple(keys), obj_keys)
+        ret._obj_value_keys = _KEY_TUPLES.setdefault(obj_keys := tuple(value_keys), obj_keys)
         return ret
 
-    def _set_values(self, obj: BaseModel, subscriptions: list[ConfigNodeSubscriptionManager]) -> bool:
-        if not isinstance(obj, BaseModel):
-            msg = f'Instance of {BaseModel.__class__.__name__} expected, got {obj} ({type(obj)})!'
-            raise TypeError(msg)
+    def _create_entry(self, name: str, entry: str, model: BaseModel) -> ConfigObj:
+        """Create the node for an entry of a tuple or a dict of models"""
+        return ConfigObj.from_model(model, path=(*self._obj_path, name, entry), parent=self, compact=self._obj_compact)
+
+    def _get_view(self, previous: Mapping[int, Mapping[str, Any]] | None = None) -> ConfigView:
+        """Immutable view of the current values. Views of unchanged children are reused.
+
+        :param previous: id of the objects which were changed by an unfinished load -> name and previous value
+                         of the changed attributes. The view has the previous values then and is not cached.
+        """
+        if (view := self._obj_view) is not None:
+            return view
+
+        values = {key: getattr(self, key) for key in self._obj_keys}
+        children = self._obj_children
+        if previous is not None and (old := previous.get(id(self))) is not None:
+            values.update(old)
+            children = {name: old.get(name, child) for name, child in children.items()}
+
+        for name, child in children.items():
+            if isinstance(child, ConfigObj):
+                values[name] = child._get_view(previous)
+            elif isinstance(child, tuple):
+                values[name] = tuple(c._get_view(previous) for c in child)
+            else:
+                values[name] = MappingProxyType({k: c._get_view(previous) for k, c in child.items()})
+
+        view = get_view_class(self._obj_model_class)(self._obj_path, values)
+        if previous is None:
+            self._obj_view = view
+        return view
+
+    def _set_changed(self, changes: list[tuple[str, Any]] | None = None) -> None:
+        """Mark the object as changed.
+
+        :param changes: name and previous value of the changed attributes
+        """
+        # the parents contain this object so their generation and their view change, too
+        root = self
+        obj: ConfigObj | MISSING_TYPE = self
+        while obj is not MISSING:
+            obj._obj_generation += 1
+            obj._obj_view = None
+            root = obj
+            obj = obj._obj_parent
+
+        if changes and (transaction := root._obj_transaction) is not None:
+            transaction.add(self, changes)
+
+    def _set_child(self, name: str, child: ConfigChildType) -> None:
+        # only nodes without children share the read only mapping, all others have their own dict
+        cast('dict[str, ConfigChildType]', self._obj_children)[name] = child
+        setattr(self, name, child)
+
+    def _restore_values(self, changes: list[tuple[str, Any]]) -> None:
+        for name, value in changes:
+            if name in self._obj_children:
+                self._set_child(name, value)
+            else:
+                setattr(self, name, value)
+        self._set_changed()
+
+        # the values do not match the last applied raw data any more
+        obj: ConfigObj | MISSING_TYPE = self
+        while obj is not MISSING:
+            obj._obj_raw = MISSING
+            obj = obj._obj_parent
+
+    def _set_tuple_values(self, name: str, nodes: tuple[ConfigObj, ...], values: tuple[BaseModel, ...],  # noqa: PLR0913
+                          subscriptions: list[ConfigNodeSubscriptionManager], *,
+                          raw: Any, identity_key: str | None) -> bool:
+        raws = raw if isinstance(raw, (list, tuple)) and len(raw) == len(values) else repeat(MISSING)
 
+        # Entries are matched by position or by their identity key.
+        # Matched entries keep their node and subscriptions, entries without a match get a new node
+        # and nodes without a matching entry are dropped.
         value_changed = False
+        if identity_key is None:
+            for node, value, value_raw in zip(nodes, values, raws, strict=False):
+                value_changed = node._set_values(value, subscriptions, value_raw) or value_changed
+            if len(nodes) == len(values):
+                return value_changed
+
+            new_nodes = nodes[:len(values)] + tuple(
+                self._create_entry(name, str(i), values[i]) for i in range(len(nodes), len(values))
+            )
+        else:
+            check_identity_keys(values, identity_key, f'{self._full_obj_path}.{name}')
+
+            by_key: dict[Any, ConfigObj] = {}
+            for node in reversed(nodes):
+                by_key[getattr(node, identity_key)] = node
+
+            new_list: list[ConfigObj] = []
+            for value, value_raw in zip(values, raws, strict=False):
+                # entries are named after the identity key, so the path stays the same if the entries move
+                if (match := by_key.pop(key := getattr(value, identity_key), None)) is None:
+                    match = self._create_entry(name, str(key), value)
+                else:
+                    value_changed = match._set_values(value, subscriptions, value_raw) or value_changed
+                new_list.append(match)
+
+            new_nodes = tuple(new_list)
+            if len(new_nodes) == len(nodes) and all(a is b for a, b in zip(new_nodes, nodes, strict=True)):
+                return value_changed
+
+        self._set_child(name, new_nodes)
+        self._set_changed([(name, nodes)])
+        return True
+
+    def _set_mapping_values(self, name: str, nodes: Mapping[Any, ConfigObj], values: dict[Any, BaseModel],
+                            subscriptions: list[ConfigNodeSubscriptionManager], *, raw: Any) -> bool:
+        raws = raw if isinstance(raw, Mapping) else _NO_CHILDREN
+
+        # Existing keys keep their node and subscriptions, new keys get a new node and removed keys are dropped
+        value_changed = False
+        new_nodes: dict[Any, ConfigObj] = {}
+        for key, value in values.items():
+            if (node := nodes.get(key)) is None:
+                node = self._create_entry(name, str(key), value)
+            else:
+                value_changed = node._set_values(value, subscriptions, raws.get(key, MISSING)) or value_changed
+            new_nodes[key] = node
 
-        # Values of child objects
-        for key, child in self._obj_children.items():
-            value = getattr(obj, key, MISSING)
+        if len(new_nodes) == len(nodes) and all(a == b for a, b in zip(new_nodes, nodes, strict=True)):
+            return value_changed
+
+        self._set_child(name, MappingProxyType(new_nodes))
+        self._set_changed([(name, nodes)])
+        return True
+
+    def _set_child_objs(self, plan: ApplyPlan, obj: BaseModel, subscriptions: list[ConfigNodeSubscriptionManager],
+                        raw: Any) -> bool:
+        try:
+            child_values = plan.child_getter(obj)
+        except AttributeError:
+            child_values = plan.get_missing(obj, plan.child_keys)
+
+        child_raws: Iterable[Any] = repeat(MISSING)
+        if isinstance(raw, Mapping):
+            child_raws = (raw.get(key, MISSING) if key is not None else MISSING for key in plan.child_raw_keys)
+
+        value_changed = False
+        for (name, child), kind, identity_key, value, child_raw in zip(
+                self._obj_children.items(), plan.child_kinds, plan.child_identity_keys, child_values, child_raws,
+                strict=False):
             if value is MISSING:
                 continue
 
-            if isinstance(child, tuple):
-                for i, c in enumerate(child):
-                    value_changed = c._set_values(value[i], subscriptions=subscriptions) or value_changed
+            # the kind of the child is known from the plan, so the type is only narrowed for the type checker
+            if kind is ChildKind.MODEL:
+                value_changed = cast('ConfigObj', child)._set_values(value, subscriptions, child_raw) or value_changed
+            elif kind is ChildKind.TUPLE:
+                value_changed = self._set_tuple_values(
+                    name, cast('tuple[ConfigObj, ...]', child), value, subscriptions,
+                    raw=child_raw, identity_key=identity_key) or value_changed
             else:
-                value_changed = child._set_values(value, subscriptions=subscriptions) or value_changed
+                value_changed = self._set_mapping_values(
+                    name, cast('Mapping[Any, ConfigObj]', child), value, subscriptions, raw=child_raw) or value_changed
 
-        # Values of this object
-        for key in self._obj_values:
-            if (value := getattr(obj, key, MISSING)) is MISSING:
-                continue
+        return value_changed
 
-            old_value = self._obj_values.get(key, MISSING)
-            self._obj_values[key] = value
+    def _set_own_values(self, plan: ApplyPlan, obj: BaseModel) -> list[tuple[str, Any]]:
+        """Returns the name and the previous value of the changed values"""
+        try:
+            values = plan.value_getter(obj)
+        except AttributeError:
+            values = plan.get_missing(obj, plan.value_keys)
+
+        changes: list[tuple[str, Any]] = []
+        for key, value in zip(plan.value_keys, values, strict=False):
+            if value is MISSING:
+                continue
 
             # Update only values, child objects change in place
+            old_value = getattr(self, key)
             setattr(self, key, value)
 
             if old_value != value:
-                value_changed = True
+                changes.append((key, old_value))
+        return changes
+
+    def _set_values(self, obj: BaseModel, subscriptions: list[ConfigNodeSubscriptionManager],
+                    raw: Any = MISSING) -> bool:
+        # Identity check first because isinstance is slow for pydantic models
+        if obj.__class__ is not self._obj_model_class and not isinstance(obj, BaseModel):
+            msg = f'Instance of {BaseModel.__class__.__name__} expected, got {obj} ({type(obj)})!'
+            raise TypeError(msg)
+
+        # Skip the whole subtree if the raw data did not change since the last time.
+        # Nodes with a pending on_next_value subscription have no raw data, so they are never skipped.
+        # The raw data is part of the copy made by the incremental validation, so it can be kept by reference
+        # and modifications of the loaded dict by the caller are still detected.
+        if raw is not MISSING and (last_raw := self._obj_raw) is not MISSING and raw == last_raw:
+            return False
+        self._obj_raw = raw
+
+        if (plan := self._obj_plan) is None:
+            plan = self._obj_plan = get_apply_plan(self._obj_model_class, self._obj_children, self._obj_value_keys)
+
+        # Values of child objects
+        value_changed = self._set_child_objs(plan, obj, subscriptions, raw) if plan.child_keys else False
+
+        # Values of this object
+        changes: list[tuple[str, Any]] = []
+        if plan.value_keys and (changes := self._set_own_values(plan, obj)):
+            self._set_changed(changes)
+            value_changed = True
 
         # Notify subscribers
         if sub_manager := self._obj_subscriptions:
-            return sub_manager.notify(value_changed, subscriptions)
+            return sub_manager.notify(value_changed, subscriptions, changes)
 
         return value_changed
 
@@ -158,6 +475,11 @@ class ConfigObj:
                 raise ValueError(msg)
         return obj.config_file_path
 
+    @property
+    def config_generation(self) -> int:
+        """Number which increases every time a value of this object or of one of its children changes"""
+        return self._obj_generation
+
     def subscribe_set_options(self, *, propagate: bool | None = None, on_next_value: bool | None = None) -> Self:
         """Set options for the subscription of this object.
 
@@ -166,23 +488,70 @@ class ConfigObj:
         """
 
         if self._obj_subscriptions is None:
-            self._obj_subscriptions = ConfigNodeSubscriptionManager()
+            self._obj_subscriptions = ConfigNodeSubscriptionManager(self._obj_path)
 
         self._obj_subscriptions.set_options(propagate=propagate, on_next_value=on_next_value)
+
+        # the subscription has to be called on the next load, so this node and its parents can not be skipped
+        if on_next_value:
+            obj: ConfigObj | MISSING_TYPE = self
+            while obj is not MISSING:
+                obj._obj_raw = MISSING
+                obj = obj._obj_parent
         return self
 
-    def subscribe_for_changes(self, func: Callable[[], Any]) -> ConfigObjSubscription:
+    def subscribe_for_changes(self, func: Callable[[], Any], *, prepare: bool = False,  # noqa: PLR0913
+                              fields: Iterable[str] | None = None, debounce: float | None = None,
+                              max_rate: float | None = None, weak: bool = False) -> ConfigObjSubscription:
         """When a value in this container changes the passed function will be called.
-
-        :param func: function which will be called
+        If a function raises an error the previous values will be restored.
+
+        :param func: function which will be called. If it has a required parameter it gets the change event.
+        :param prepare: Call the function before all functions which are not prepare functions
+        :param fields: Call the function only if one of these values changes
+        :param debounce: Call the function only after there was no change for this time in seconds
+        :param max_rate: Call the function at most this many times per second
+        :param weak: Only keep a weak reference to the function (or the object of a bound method).
+                     The subscription is removed when the function is garbage collected.
         :return: object which can be used to cancel the subscription
         """
+        return self.subscribe_many((func, ), prepare=prepare, fields=fields,
+                                   debounce=debounce, max_rate=max_rate, weak=weak)[0]
+
+    def subscribe_many(self, funcs: Iterable[Callable[[], Any]], *, prepare: bool = False,  # noqa: PLR0913
+                       fields: Iterable[str] | None = None, debounce: float | None = None,
+                       max_rate: float | None = None, weak: bool = False) -> list[ConfigObjSubscription]:
+        """Subscribe several functions with the same options at once, see ``subscribe_for_changes``.
+        If one of the functions is already subscribed none of the functions will be subscribed.
+
+        :param funcs: functions which will be called
+        :return: objects which can be used to cancel the subscriptions, in the order of the functions
+        """
+
+        if fields is None:
+            fields = ()
+        elif isinstance(fields, str):
+            fields = (fields, )
+
+        for name in fields:
+            if name not in self._obj_model_fields and name not in self._obj_model_private_attrs:
+                msg = f'{self._full_obj_path} has no field {name}'
+                raise ValueError(msg)
+            if name in self._obj_children:
+                msg = f'{self._full_obj_path}.{name} is a sub model, subscribe to the sub model instead'
+                raise ValueError(msg)
 
         if self._obj_subscriptions is None:
-            self._obj_subscriptions = ConfigNodeSubscriptionManager()
+            self._obj_subscriptions = ConfigNodeSubscriptionManager(self._obj_path)
+
+        root: ConfigObj = self
+        while root._obj_parent is not MISSING:
+            root = root._obj_parent
 
-        target_name = f'{func.__name__} @ {self._full_obj_path}'
-        return self._obj_subscriptions.subscribe(func, target_name)
+        path = self._full_obj_path
+        return self._obj_subscriptions.subscribe_many(
+            ((func, f'{func.__name__} @ {path}') for func in funcs), prepare=prepare, fields=fields,
+            debounce=debounce, max_rate=max_rate, in_loop=root._obj_async, weak=weak)
 
     # -----------------------------------------------------
     # pydantic 1
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from easyconfig.expansion.references import get_digest
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from easyconfig.config_objs.fragments import FragmentStateType
+    from easyconfig.expansion import ExpansionReferences
+
+
+@dataclass(frozen=True)
+class FileState:
+    path: Path
+    mtime_ns: int
+    size: int
+    inode: int
+    digest: bytes | None
+    fragments: FragmentStateType = ()
+
+    @classmethod
+    def from_file(cls, path: Path, content: str, fragments: FragmentStateType = ()) -> FileState:
+        stat = path.stat()
+        return cls(path, stat.st_mtime_ns, stat.st_size, stat.st_ino, get_digest(content), fragments)
+
+
+class ReloadCacheStats:
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def reset(self) -> None:
+        """Reset the counters"""
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} hits: {self.hits:d}, misses: {self.misses:d}>'
+
+
+class ReloadCache:
+    def __init__(self) -> None:
+        self.stats: ReloadCacheStats = ReloadCacheStats()
+
+        self._state: FileState | None = None
+        self._expansion: bool = True
+        self._refs: ExpansionReferences | None = None
+
+    @property
+    def references(self) -> ExpansionReferences | None:
+        return self._refs
+
+    def invalidate(self) -> None:
+        self._state = None
+        self._refs = None
+
+    def update(self, state: FileState, refs: ExpansionReferences | None, *, expansion: bool) -> None:
+        self._state = state
+        self._refs = refs
+        self._expansion = expansion
+
+    def is_current(self, state: FileState, *, expansion: bool) -> bool:
+        if (
+            self._state is not None and self._state == state and self._expansion == expansion and
+            (self._refs is None or self._refs.is_current())
+        ):
+            self.stats.hits += 1
+            return True
+
+        self.stats.misses += 1
+        return False
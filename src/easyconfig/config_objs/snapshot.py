@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import sys
+from hashlib import blake2b
+from inspect import isclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, get_args
+
+from pydantic import BaseModel
+
+from easyconfig.__version__ import __version__
+
+
+if TYPE_CHECKING:
+    from easyconfig.config_objs.fragments import FragmentStateType
+    from easyconfig.pre_process import PreProcess
+
+
+log = logging.getLogger('easyconfig.snapshot')
+
+
+def _get_module_signature(cls: type) -> str:
+    # changes in the validators are not part of the fields so we also use the source file
+    if (module := sys.modules.get(cls.__module__)) is None or (file := getattr(module, '__file__', None)) is None:
+        return ''
+    try:
+        stat = Path(file).stat()
+    except OSError:
+        return ''
+    return f'{file}:{stat.st_mtime_ns:d}:{stat.st_size:d}'
+
+
+def _get_sub_models(annotation: Any) -> list[type[BaseModel]]:
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return [annotation]
+
+    ret = []
+    for arg in get_args(annotation):
+        ret.extend(_get_sub_models(arg))
+    return ret
+
+
+def get_model_fingerprint(model_cls: type[BaseModel]) -> bytes:
+    """Fingerprint of the model class including all sub models"""
+
+    parts: list[str] = []
+    todo: list[type[BaseModel]] = [model_cls]
+    done: set[type[BaseModel]] = set()
+
+    while todo:
+        cls = todo.pop()
+        if cls in done:
+            continue
+        done.add(cls)
+
+        parts.append(f'{cls.__module__}.{cls.__qualname__}|{_get_module_signature(cls)}')
+        for name, field in cls.model_fields.items():
+            parts.append(f'{name}:{field.annotation!r}:{field.alias}:{field.default!r}')
+            todo.extend(_get_sub_models(field.annotation))
+
+    return blake2b('\n'.join(parts).encode('utf-8'), digest_size=16).digest()
+
+
+def get_preprocess_description(preprocess: PreProcess) -> str:
+    return repr([
+        (op.__class__.__name__, {k: getattr(v, 'path', v) for k, v in vars(op).items()})
+        for op in preprocess._operations
+    ])
+
+
+class ConfigSnapshot:
+    """Sidecar file next to the configuration file which contains the validated model.
+    The snapshot is only valid if the file content, the model, the preprocessing and the easyconfig version match.
+
+    The snapshot is a pickle file so it must be in the same trust domain as the configuration file."""
+
+    def __init__(self, model_cls: type[BaseModel], preprocess: PreProcess) -> None:
+        self._model_cls: Final = model_cls
+        self._preprocess: Final = preprocess
+        self._fingerprint: bytes | None = None
+
+    @staticmethod
+    def get_path(config_path: Path) -> Path:
+        return config_path.with_name(f'.{config_path.name}.snapshot')
+
+    def get_key(self, content: str, fragments: FragmentStateType = (), *, expansion: bool) -> bytes:
+        # only needed when a file is loaded
+        if self._fingerprint is None:
+            self._fingerprint = get_model_fingerprint(self._model_cls)
+
+        h = blake2b(digest_size=16)
+        h.update(__version__.encode('utf-8'))
+        h.update(self._fingerprint)
+        h.update(get_preprocess_description(self._preprocess).encode('utf-8'))
+        h.update(b'1' if expansion else b'0')
+        h.update(content.encode('utf-8'))
+        for path, signature in fragments:
+            h.update(f'{path}:{signature}'.encode())
+        return h.digest()
+
+    def load(self, config_path: Path, key: bytes) -> BaseModel | None:
+        path = self.get_path(config_path)
+        try:
+            with path.open('rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            file_key, model_obj = pickle.loads(data)  # noqa: S301
+        except Exception as e:
+            log.debug(f'Could not load snapshot {path}: {e}')
+            return None
+
+        if file_key != key or not isinstance(model_obj, self._model_cls):
+            return None
+        return model_obj
+
+    def store(self, config_path: Path, key: bytes, model_obj: BaseModel) -> None:
+        path = self.get_path(config_path)
+        try:
+            data = pickle.dumps((key, model_obj), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            log.debug(f'Could not create snapshot for {config_path}: {e}')
+            return None
+
+        tmp = path.with_name(f'{path.name}.tmp')
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            tmp.replace(path)
+        except OSError as e:
+            log.debug(f'Could not write snapshot {path}: {e}')
+            tmp.unlink(missing_ok=True)
+        return None
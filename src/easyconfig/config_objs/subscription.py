@@ -1,21 +1,70 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
-from typing import Any, Final, TypeAlias
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
+from inspect import Parameter, ismethod, signature
+from typing import TYPE_CHECKING, Any, Final, TypeAlias, cast
+from weakref import ReferenceType, WeakMethod, ref
 
 from typing_extensions import Self
 
+from easyconfig.config_objs.coalesce import CoalescedCall
 from easyconfig.errors import DuplicateSubscriptionError, SubscriptionAlreadyCanceledError
 
 
+if TYPE_CHECKING:
+    from easyconfig.config_objs.transaction import ConfigTransaction
+
+
 SubscriptionCallbackType: TypeAlias = Callable | Callable[[], Awaitable[Any]]
+# weak subscriptions store a reference to the function
+SubscriptionTargetType: TypeAlias = SubscriptionCallbackType | ReferenceType
+
+
+def resolve_target(target: SubscriptionTargetType, *, weak: bool) -> SubscriptionCallbackType | None:
+    """Return the function of the subscription or None if the function of a weak subscription is gone"""
+    if weak:
+        return cast('ReferenceType[SubscriptionCallbackType]', target)()
+    return cast('SubscriptionCallbackType', target)
+
+
+def accepts_event(cb: SubscriptionCallbackType) -> bool:
+    """True if the function has a required positional parameter for the change event.
+    Parameters with a default value are left alone, so existing functions like ``rebuild(force=False)``
+    are still called without arguments."""
+    try:
+        parameters = signature(cb).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD) and p.default is Parameter.empty
+        for p in parameters
+    )
 
 
 class ConfigNodeSubscriptionManager:
-    def __init__(self) -> None:
+    def __init__(self, path: tuple[str, ...] = ('__root__', ), fields: tuple[str, ...] = ()) -> None:
+        # location of the object and the watched fields, used to create the change event
+        self.path: Final = path
+        self.fields: Final = fields
+
         self._propagate: bool = False
         self._on_next_value: bool = False
-        self._subscriptions: tuple[tuple[SubscriptionCallbackType, ConfigObjSubscription], ...] = ()
+
+        # Insertion ordered, so subscribe and cancel are O(1) and the functions are still called in order.
+        # The values are the function (or the weak reference to it) and the id of the function.
+        self._subscriptions: dict[ConfigObjSubscription, tuple[SubscriptionTargetType, int]] = {}
+        self._prepare_subscriptions: dict[ConfigObjSubscription, tuple[SubscriptionTargetType, int]] = {}
+        # id of the function -> subscription, used to detect duplicates
+        self._targets: dict[int, ConfigObjSubscription] = {}
+        # id of the weak reference -> subscription. The references of collected functions are added to the dead list.
+        self._weak: dict[int, ConfigObjSubscription] = {}
+        self._dead: list[ReferenceType] = []
+
+        # Subscriptions for fields have their own manager per combination of fields.
+        # The index maps the name of the field to the managers which have to be notified if the field changes.
+        self._field_managers: dict[tuple[str, ...], ConfigNodeSubscriptionManager] = {}
+        self._field_index: dict[str, tuple[ConfigNodeSubscriptionManager, ...]] = {}
 
     def set_options(self, *, propagate: bool | None = None, on_next_value: bool | None = None) -> Self:
         if propagate is not None:
@@ -24,24 +73,106 @@ class ConfigNodeSubscriptionManager:
             self._on_next_value = on_next_value
         return self
 
-    def subscribe(self, cb: SubscriptionCallbackType, node_name: str) -> ConfigObjSubscription:
-        for target, _ in self._subscriptions:
-            if target is cb:
+    def subscribe(self, cb: SubscriptionCallbackType, node_name: str, *, prepare: bool = False,  # noqa: PLR0913
+                  fields: Iterable[str] = (), debounce: float | None = None,
+                  max_rate: float | None = None, in_loop: bool = False, weak: bool = False) -> ConfigObjSubscription:
+        return self.subscribe_many(((cb, node_name), ), prepare=prepare, fields=fields,
+                                   debounce=debounce, max_rate=max_rate, in_loop=in_loop, weak=weak)[0]
+
+    def subscribe_many(self, targets: Iterable[tuple[SubscriptionCallbackType, str]], *,  # noqa: PLR0913
+                       prepare: bool = False, fields: Iterable[str] = (), debounce: float | None = None,
+                       max_rate: float | None = None, in_loop: bool = False,
+                       weak: bool = False) -> list[ConfigObjSubscription]:
+        if fields_key := tuple(sorted(set(fields))):
+            if (manager := self._field_managers.get(fields_key)) is None:
+                self._field_managers[fields_key] = manager = ConfigNodeSubscriptionManager(self.path, fields_key)
+                for name in fields_key:
+                    self._field_index[name] = (*self._field_index.get(name, ()), manager)
+            return manager.subscribe_many(targets, prepare=prepare,
+                                          debounce=debounce, max_rate=max_rate, in_loop=in_loop, weak=weak)
+
+        if (debounce is not None or max_rate is not None) and prepare:
+            msg = 'Prepare functions can not be delayed'
+            raise ValueError(msg)
+        if self._dead:
+            self._prune()
+
+        # check all functions before the first one is subscribed
+        targets = tuple(targets)
+        self._check_duplicates(cb for cb, _ in targets)
+
+        subscriptions = self._prepare_subscriptions if prepare else self._subscriptions
+        ret: list[ConfigObjSubscription] = []
+        for cb, node_name in targets:
+            # a bound method is created on every access, so the reference has to be to the object and the function
+            target: SubscriptionTargetType = cb
+            if weak:
+                target = WeakMethod(cb, self._dead.append) if ismethod(cb) else ref(cb, self._dead.append)
+
+            coalesce: CoalescedCall | None = None
+            if debounce is not None or max_rate is not None:
+                coalesce = CoalescedCall(target, node_name, debounce=debounce, max_rate=max_rate, in_loop=in_loop,
+                                         weak=weak)
+
+            obj = ConfigObjSubscription(self, node_name, event=accepts_event(cb), coalesce=coalesce, weak=weak)
+            subscriptions[obj] = (target, id(cb))
+            self._targets[id(cb)] = obj
+            if weak:
+                self._weak[id(target)] = obj
+            ret.append(obj)
+        return ret
+
+    def _check_duplicates(self, cbs: Iterable[SubscriptionCallbackType]) -> None:
+        ids: set[int] = set()
+        for cb in cbs:
+            if (cb_id := id(cb)) in ids or self._get_func(self._targets.get(cb_id)) is cb:
                 msg = f'{cb} is already subscribed!'
                 raise DuplicateSubscriptionError(msg)
+            ids.add(cb_id)
+        return None
 
-        obj = ConfigObjSubscription(self, node_name)
-        self._subscriptions += ((cb, obj), )
-        return obj
+    def _get_func(self, sub: ConfigObjSubscription | None) -> SubscriptionCallbackType | None:
+        if sub is None:
+            return None
+        if (entry := self._subscriptions.get(sub)) is None and (entry := self._prepare_subscriptions.get(sub)) is None:
+            return None
+        return resolve_target(entry[0], weak=sub._sub_weak)
+
+    def _prune(self) -> None:
+        # remove the weak subscriptions of functions which have been garbage collected
+        while self._dead:
+            if (sub := self._weak.get(id(self._dead.pop()))) is not None:
+                self.cancel(sub)
+        return None
 
     def cancel(self, subscription: ConfigObjSubscription) -> None:
-        self._subscriptions = tuple((target, sub) for target, sub in self._subscriptions if sub is not subscription)
+        if (entry := self._subscriptions.pop(subscription, None)) is None:
+            entry = self._prepare_subscriptions.pop(subscription, None)
+        if entry is None:
+            return None
+
+        target, cb_id = entry
+        if self._targets.get(cb_id) is subscription:
+            del self._targets[cb_id]
+        if subscription._sub_weak:
+            self._weak.pop(id(target), None)
+        if subscription._sub_coalesce is not None:
+            subscription._sub_coalesce.cancel()
+        for func in subscription._sub_on_cancel:
+            func(subscription)
         return None
 
     def __bool__(self) -> bool:
-        return bool(self._subscriptions)
+        return bool(self._subscriptions or self._prepare_subscriptions or self._field_index)
+
+    def notify(self, value_changed: bool, call_stack: list[ConfigNodeSubscriptionManager],  # noqa: FBT001
+               changes: Iterable[tuple[str, Any]] = ()) -> bool:
+        if index := self._field_index:
+            for name, _ in changes:
+                for manager in index.get(name, ()):
+                    if manager and manager not in call_stack:
+                        call_stack.append(manager)
 
-    def notify(self, value_changed: bool, call_stack: list[ConfigNodeSubscriptionManager]) -> bool:  # noqa: FBT001
         if self._on_next_value:
             self._on_next_value = False
             call_stack.append(self)
@@ -52,25 +183,62 @@ class ConfigNodeSubscriptionManager:
             return self._propagate
         return False
 
-    def call(self) -> None:
-        for target, sub in self._subscriptions:
+    def get_targets(self, transaction: ConfigTransaction, *, prepare: bool = False
+                    ) -> list[tuple[SubscriptionCallbackType, ConfigObjSubscription]]:
+        """Functions which have to be called. The change event is only created if a function accepts it."""
+        stats = transaction.stats
+        targets: list[tuple[SubscriptionCallbackType, ConfigObjSubscription]] = []
+        # a copy, functions can subscribe or cancel while the functions of another thread are collected
+        for sub, (target, _) in tuple((self._prepare_subscriptions if prepare else self._subscriptions).items()):
+            if (func := resolve_target(target, weak=sub._sub_weak)) is None:
+                continue
+
+            event = transaction.get_event(self) if sub._sub_event else None
+
+            # delayed functions are measured when they are called
+            if (coalesce := sub._sub_coalesce) is not None:
+                targets.append((partial(coalesce, transaction, event), sub))
+                continue
+
+            if event is not None:
+                # the event is only created for functions which accept it
+                func = partial(cast('Callable[..., Any]', func), event)
+            if stats is not None:
+                func = partial(stats.call, func, sub.name)
+            targets.append((func, sub))
+
+        if self._dead:
+            self._prune()
+        return targets
+
+    def call(self, transaction: ConfigTransaction, *, prepare: bool = False) -> None:
+        for target, sub in self.get_targets(transaction, prepare=prepare):
             result = target()
             if isinstance(result, Awaitable):
                 msg = (f'Subscription target {target} @ {sub.name} is an async function! '
                        f'Use the async app config instead.')
                 raise TypeError(msg)
 
-    async def call_async(self) -> None:
-        for target, _ in self._subscriptions:
+    async def call_async(self, transaction: ConfigTransaction, *, prepare: bool = False) -> None:
+        for target, _ in self.get_targets(transaction, prepare=prepare):
             result = target()
             if isinstance(result, Awaitable):
                 await result
 
 
 class ConfigObjSubscription:
-    def __init__(self, sub_obj: ConfigNodeSubscriptionManager, location: str) -> None:
+    def __init__(self, sub_obj: ConfigNodeSubscriptionManager, location: str, *, event: bool = False,
+                 coalesce: CoalescedCall | None = None, weak: bool = False) -> None:
         self._sub_manager: ConfigNodeSubscriptionManager | None = sub_obj
         self._sub_name: Final = location
+        # the function gets the change event as an argument
+        self._sub_event: Final = event
+        # the function is called delayed with the merged changes
+        self._sub_coalesce: Final = coalesce
+        # the manager only holds a weak reference to the function
+        self._sub_weak: Final = weak
+        # called when the subscription is canceled, e.g. to remove it from the order of a dispatch
+        self._sub_on_cancel: tuple[Callable[[ConfigObjSubscription], Any], ...] = ()
 
     @property
     def name(self) -> str:
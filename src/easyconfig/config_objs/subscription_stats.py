@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from inspect import isawaitable
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Final
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+log = logging.getLogger('easyconfig.subscription_stats')
+
+
+# upper bounds of the histogram buckets in seconds, the last bucket counts all longer calls
+HISTOGRAM_BUCKETS: Final = (0.001, 0.01, 0.1, 1.0, 10.0)
+
+
+class SubscriptionTimes:
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.histogram: list[int] = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+    @property
+    def mean(self) -> float:
+        """Mean duration of the calls in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.histogram[bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+
+    def __repr__(self) -> str:
+        return (f'<{self.__class__.__name__} count: {self.count:d}, mean: {self.mean:.6f}s, '
+                f'max: {self.max:.6f}s>')
+
+
+class SubscriptionStats:
+    """Duration of the calls of the subscription functions, keyed by the name of the subscription.
+    Async functions are measured until they are done.
+
+    :param slow: Log a warning for every call which takes longer than this time in seconds
+    """
+
+    def __init__(self, slow: float | None = None) -> None:
+        if slow is not None and slow <= 0:
+            msg = f'Slow subscription threshold must be greater than 0: {slow}'
+            raise ValueError(msg)
+
+        self._slow: Final = slow
+        self._times: dict[str, SubscriptionTimes] = {}
+        # functions can run in a thread pool
+        self._lock: Final = Lock()
+
+    @property
+    def buckets(self) -> tuple[float, ...]:
+        """Upper bounds of the histogram buckets in seconds. The last bucket of a histogram counts all longer calls."""
+        return HISTOGRAM_BUCKETS
+
+    def get(self, name: str) -> SubscriptionTimes | None:
+        """Times of the subscription or None if the function was not called yet
+
+        :param name: name of the subscription
+        """
+        return self._times.get(name)
+
+    def times(self) -> dict[str, SubscriptionTimes]:
+        """Times of all subscriptions which were called"""
+        return self._times.copy()
+
+    def reset(self) -> None:
+        """Reset the times"""
+        with self._lock:
+            self._times = {}
+
+    def add(self, name: str, duration: float) -> None:
+        with self._lock:
+            if (times := self._times.get(name)) is None:
+                self._times[name] = times = SubscriptionTimes()
+            times.add(duration)
+
+        if self._slow is not None and duration > self._slow:
+            log.warning(f'Subscription {name} took {duration:.3f}s (threshold {self._slow}s)')
+
+    def call(self, target: Callable[[], Any], name: str) -> Any:
+        start = perf_counter()
+        try:
+            result = target()
+        except Exception:
+            self.add(name, perf_counter() - start)
+            raise
+
+        if isawaitable(result):
+            return self._wait(result, name, start)
+
+        self.add(name, perf_counter() - start)
+        return result
+
+    async def _wait(self, result: Awaitable[Any], name: str, start: float) -> Any:
+        try:
+            return await result
+        finally:
+            self.add(name, perf_counter() - start)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} subscriptions: {len(self._times):d}>'
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final
+
+from easyconfig.config_objs.change_event import ConfigChangeEvent, ValueChange
+
+
+if TYPE_CHECKING:
+    from easyconfig.config_objs import ConfigNodeSubscriptionManager, ConfigObjSubscription
+    from easyconfig.config_objs.coalesce import CoalescedCall
+    from easyconfig.config_objs.dispatch import ConcurrentDispatch, ThreadDispatch
+    from easyconfig.config_objs.object_config import ConfigObj
+    from easyconfig.config_objs.subscription import SubscriptionCallbackType
+    from easyconfig.config_objs.subscription_stats import SubscriptionStats
+
+
+class ConfigTransaction:
+    """Previous values of all objects which were changed by a load.
+    Only the changed values are stored, so rolling back does not require a validation of the previous values."""
+
+    def __init__(self, stats: SubscriptionStats | None = None) -> None:
+        self.stats: Final = stats
+        self.subscriptions: Final[list[ConfigNodeSubscriptionManager]] = []
+        self._changes: Final[list[tuple[ConfigObj, list[tuple[str, Any]]]]] = []
+        self._events: Final[dict[ConfigNodeSubscriptionManager, ConfigChangeEvent]] = {}
+        # delayed calls which were scheduled by this load
+        self.delayed: Final[list[CoalescedCall]] = []
+
+    def add(self, obj: ConfigObj, changes: list[tuple[str, Any]]) -> None:
+        self._changes.append((obj, changes))
+
+    def rollback(self) -> None:
+        # reverse order, so every object ends up with the oldest value
+        for obj, changes in reversed(self._changes):
+            obj._restore_values(changes)
+        self._changes.clear()
+        self._events.clear()
+
+        # the delayed calls must not report the changes which were just reverted
+        for call in self.delayed:
+            call.discard(self)
+        self.delayed.clear()
+
+    def get_previous_values(self, previous: dict[int, dict[str, Any]] | None = None) -> dict[int, dict[str, Any]]:
+        """Values before the load: id of the changed object -> name and previous value of the changed attributes
+
+        :param previous: previous values of an earlier load which take precedence
+        """
+        if previous is None:
+            previous = {}
+        for obj, changes in self._changes:
+            values = previous.setdefault(id(obj), {})
+            for name, value in changes:
+                # the first change has the value before the load
+                values.setdefault(name, value)
+        return previous
+
+    def get_event(self, manager: ConfigNodeSubscriptionManager) -> ConfigChangeEvent:
+        """Change event with the changes of the object of the subscription manager and its children"""
+        if (event := self._events.get(manager)) is None:
+            self._events[manager] = event = self.create_event(manager.path, manager.fields)
+        return event
+
+    def create_event(self, path: tuple[str, ...], fields: tuple[str, ...] = ()) -> ConfigChangeEvent:
+        """Change event with the changes of the object at the path and its children
+        respectively only with the changes of the fields of the object"""
+        size = len(path)
+
+        changes: list[ValueChange] = []
+        for obj, obj_changes in self._changes:
+            if (obj_path := obj._obj_path)[:size] != path or (fields and len(obj_path) != size):
+                continue
+            for name, old in obj_changes:
+                if fields and name not in fields:
+                    continue
+                # the root is not part of the path
+                changes.append(ValueChange('.'.join((*obj_path[1:], name)), old, getattr(obj, name)))
+        return ConfigChangeEvent(tuple(changes))
+
+    def get_targets(self, *, prepare: bool = False
+                    ) -> list[tuple[SubscriptionCallbackType, ConfigObjSubscription]]:
+        """Functions of all subscription managers which have to be called"""
+        return [target for manager in self.subscriptions for target in manager.get_targets(self, prepare=prepare)]
+
+    def call(self, dispatch: ThreadDispatch | None = None) -> None:
+        # two phases: all prepare functions are called before the change is reported to the other functions
+        if dispatch is not None:
+            dispatch.call(self, prepare=True)
+            dispatch.call(self)
+            return None
+
+        for sub in self.subscriptions:
+            sub.call(self, prepare=True)
+        for sub in self.subscriptions:
+            sub.call(self)
+        return None
+
+    async def call_async(self, dispatch: ConcurrentDispatch | None = None) -> None:
+        if dispatch is not None:
+            await dispatch.call(self, prepare=True)
+            await dispatch.call(self)
+            return None
+
+        for sub in self.subscriptions:
+            await sub.call_async(self, prepare=True)
+        for sub in self.subscriptions:
+            await sub.call_async(self)
+        return None
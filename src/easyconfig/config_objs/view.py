@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NoReturn
+
+
+class ConfigView:
+    """Immutable view of the values of a config object at the time it was created.
+    Views of unchanged config objects are shared between the views of the different loads."""
+
+    __slots__ = ('_view_path', )
+
+    _view_path: tuple[str, ...]
+
+    def __init__(self, path: tuple[str, ...], values: dict[str, Any]) -> None:
+        set_attr = object.__setattr__
+        set_attr(self, '_view_path', path)
+        for key, value in values.items():
+            set_attr(self, key, value)
+
+    def __setattr__(self, key: str, value: Any) -> NoReturn:
+        msg = f'{self.__class__.__name__} is immutable, can not set {key}'
+        raise AttributeError(msg)
+
+    def __delattr__(self, key: str) -> NoReturn:
+        msg = f'{self.__class__.__name__} is immutable, can not delete {key}'
+        raise AttributeError(msg)
+
+    if TYPE_CHECKING:
+        # the values are set by the generated subclass of the model, they can not be known statically
+        def __getattr__(self, name: str) -> Any: ...
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {".".join(self._view_path)}>'
+
@@ -1,12 +1,14 @@
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from inspect import isfunction
 from typing import Any, TypeAlias, TypeVar
 
 from pydantic import BaseModel
 
-from easyconfig.__const__ import ARG_NAME_IN_FILE, MISSING, MISSING_TYPE
-from easyconfig.config_objs.app_config import AppConfig, AsyncAppConfig, ConfigObj, yaml_rt
+from easyconfig.__const__ import ARG_NAME_IDENTITY_KEY, ARG_NAME_IN_FILE, MISSING, MISSING_TYPE
+from easyconfig.config_objs.app_config import AppConfig, AsyncAppConfig, ConfigObj
+from easyconfig.config_objs.dispatch import ConcurrentDispatch, ThreadDispatch
 from easyconfig.errors import ExtraKwArgsNotAllowedError
+from easyconfig.yaml import YamlLoaderType, yaml_rt
 
 
 TYPE_WRAPPED = TypeVar('TYPE_WRAPPED', bound=BaseModel)
@@ -33,7 +35,10 @@ def check_field_args(model: ConfigObj, allowed: frozenset[str]) -> None:
     for sub_model in model._obj_children.values():
         if isinstance(sub_model, tuple):
             for _sub_model in sub_model:
-                check_field_args(model, allowed)
+                check_field_args(_sub_model, allowed)
+        elif isinstance(sub_model, Mapping):
+            for _sub_model in sub_model.values():
+                check_field_args(_sub_model, allowed)
         else:
             check_field_args(sub_model, allowed)
 
@@ -60,16 +65,28 @@ def get_file_values(
     return file_values
 
 
-def _create_app_config(
+def _create_app_config(  # noqa: PLR0913
     app_cls: type[AppConfig] | type[AsyncAppConfig],
     model: BaseModel,
     file_values: MISSING_TYPE | None | TYPE_DEFAULTS | Callable[[], TYPE_DEFAULTS] = MISSING, *,
     validate_file_values: bool = True,
-    check_field_extra_args: Iterable[str] | None = (ARG_NAME_IN_FILE,),
+    check_field_extra_args: Iterable[str] | None = (ARG_NAME_IN_FILE, ARG_NAME_IDENTITY_KEY),
+    reload_cache: bool = False,
+    loader: YamlLoaderType = 'rt',
+    snapshot: bool = False,
+    fragments: bool = False,
+    incremental: bool = False,
+    compact: bool = False,
+    dispatch: ConcurrentDispatch | ThreadDispatch | None = None,
+    subscription_stats: bool = False,
+    slow_subscription: float | None = None,
 ) -> AppConfig | AsyncAppConfig:
 
     file_defaults = get_file_values(model, file_values)
-    app_cfg = app_cls.from_model(model, file_defaults=file_defaults)
+    app_cfg = app_cls.from_model(model, file_defaults=file_defaults, reload_cache=reload_cache, loader=loader,
+                                 snapshot=snapshot, fragments=fragments, incremental=incremental, compact=compact,
+                                 dispatch=dispatch, subscription_stats=subscription_stats,
+                                 slow_subscription=slow_subscription)
 
     # ensure that the extra args have no typos
     if check_field_extra_args is not None:
@@ -88,12 +105,24 @@ def create_app_config(
     model: TYPE_WRAPPED,
     file_values: MISSING_TYPE | None | TYPE_DEFAULTS | Callable[[], TYPE_DEFAULTS] = MISSING, *,
     validate_file_values: bool = True,
-    check_field_extra_args: Iterable[str] | None = (ARG_NAME_IN_FILE,),
+    check_field_extra_args: Iterable[str] | None = (ARG_NAME_IN_FILE, ARG_NAME_IDENTITY_KEY),
+    reload_cache: bool = False,
+    loader: YamlLoaderType = 'rt',
+    snapshot: bool = False,
+    fragments: bool = False,
+    incremental: bool = False,
+    compact: bool = False,
+    dispatch: ThreadDispatch | None = None,
+    subscription_stats: bool = False,
+    slow_subscription: float | None = None,
 ) -> TYPE_WRAPPED:
 
     return _create_app_config(
         AppConfig, model=model, file_values=file_values,
-        validate_file_values=validate_file_values, check_field_extra_args=check_field_extra_args
+        validate_file_values=validate_file_values, check_field_extra_args=check_field_extra_args,
+        reload_cache=reload_cache, loader=loader, snapshot=snapshot, fragments=fragments, incremental=incremental,
+        compact=compact, dispatch=dispatch, subscription_stats=subscription_stats,
+        slow_subscription=slow_subscription
     )
 
 
@@ -101,10 +130,22 @@ def create_async_app_config(
     model: TYPE_WRAPPED,
     file_values: MISSING_TYPE | None | TYPE_DEFAULTS | Callable[[], TYPE_DEFAULTS] = MISSING, *,
     validate_file_values: bool = True,
-    check_field_extra_args: Iterable[str] | None = (ARG_NAME_IN_FILE,),
+    check_field_extra_args: Iterable[str] | None = (ARG_NAME_IN_FILE, ARG_NAME_IDENTITY_KEY),
+    reload_cache: bool = False,
+    loader: YamlLoaderType = 'rt',
+    snapshot: bool = False,
+    fragments: bool = False,
+    incremental: bool = False,
+    compact: bool = False,
+    dispatch: ConcurrentDispatch | None = None,
+    subscription_stats: bool = False,
+    slow_subscription: float | None = None,
 ) -> TYPE_WRAPPED:
 
     return _create_app_config(
         AsyncAppConfig, model=model, file_values=file_values,
-        validate_file_values=validate_file_values, check_field_extra_args=check_field_extra_args
+        validate_file_values=validate_file_values, check_field_extra_args=check_field_extra_args,
+        reload_cache=reload_cache, loader=loader, snapshot=snapshot, fragments=fragments, incremental=incremental,
+        compact=compact, dispatch=dispatch, subscription_stats=subscription_stats,
+        slow_subscription=slow_subscription
     )
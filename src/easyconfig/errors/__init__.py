@@ -3,6 +3,8 @@ from .errors import (
     ExtraKwArgsNotAllowedError,
     FileDefaultsNotSetError,
     FunctionCallNotAllowedError,
+    LoadInSubscriptionError,
     SubscriptionAlreadyCanceledError,
+    SubscriptionTimeoutError,
 )
 from .handler import set_exception_handler
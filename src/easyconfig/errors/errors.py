@@ -18,6 +18,14 @@ class FileDefaultsNotSetError(EasyConfigError):
     pass
 
 
+class SubscriptionTimeoutError(EasyConfigError):
+    pass
+
+
+class LoadInSubscriptionError(EasyConfigError):
+    pass
+
+
 class FunctionCallNotAllowedError(EasyConfigError):
     def __init__(self) -> None:
         super().__init__('Call "load_config_dict" or "load_config_file" on the app config instance!')
@@ -1 +1,2 @@
 from .expand import expand_obj
+from .references import ExpansionReferences
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .load_file import is_path, read_file_contents
 from .load_var import read_env_var
 from .location import ExpansionLocation
 
 
+if TYPE_CHECKING:
+    from .references import ExpansionReferences
+
+
 RE_REPLACE = re.compile(r'''
     (?<!\$)\$\{
         (?P<value>.*?[^$])?
@@ -57,9 +61,9 @@ def expand_text(text: str, /, loc: ExpansionLocation) -> Any:
     return text
 
 
-def expand_obj(obj: Any, loc: ExpansionLocation | None = None) -> Any:
+def expand_obj(obj: Any, loc: ExpansionLocation | None = None, *, refs: ExpansionReferences | None = None) -> Any:
     if loc is None:
-        loc = ExpansionLocation((), ())
+        loc = ExpansionLocation((), (), refs)
 
     if isinstance(obj, dict):
         for key, value in obj.items():
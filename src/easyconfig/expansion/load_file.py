@@ -66,8 +66,11 @@ def read_file_contents(key: str, loc: ExpansionLocation) -> tuple[str, str | Non
     name, default = parse_path_key(key)
 
     try:
-        return name, read_file(name)
+        value = read_file(name)
     except Exception as e:
+        if loc.refs is not None:
+            loc.refs.add_file(name, None)
+
         msg = f'Error while reading from file "{name:s}": ({e}) {loc.location_str()}'
 
         if default is not None:
@@ -76,3 +79,7 @@ def read_file_contents(key: str, loc: ExpansionLocation) -> tuple[str, str | Non
 
         log.error(msg)
         return name, None
+
+    if loc.refs is not None:
+        loc.refs.add_file(name, value)
+    return name, value
@@ -17,7 +17,11 @@ def parse_env_key(key: str) -> tuple[str, str | None]:
 def read_env_var(key: str, loc: ExpansionLocation) -> tuple[str, str | None]:
     name, default = parse_env_key(key)
 
-    if (value := environ.get(name)) is not None:
+    value = environ.get(name)
+    if loc.refs is not None:
+        loc.refs.add_env_var(name, value)
+
+    if value is not None:
         return name, value
 
     msg = f'Environment variable "{name:s}" is not set or empty! {loc.location_str()}'
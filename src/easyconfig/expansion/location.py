@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from typing_extensions import Self
 
 from easyconfig.errors.errors import CyclicEnvironmentVariableReferenceError
 
 
+if TYPE_CHECKING:
+    from easyconfig.expansion.references import ExpansionReferences
+
+
 log = logging.getLogger('easyconfig.expansion')
 
 
@@ -15,6 +20,7 @@ log = logging.getLogger('easyconfig.expansion')
 class ExpansionLocation:
     loc: tuple[str, ...]        # location in the yaml
     stack: tuple[str, ...]      # stack for expansion of values
+    refs: ExpansionReferences | None = field(default=None, compare=False, repr=False)  # collects read values
 
     def expand_value(self, name: str) -> Self:
         # value is valid
@@ -22,7 +28,7 @@ class ExpansionLocation:
         if name in self.stack:
             msg = f'Cyclic environment variable reference: {" -> ".join(new_stack):s} {self.location_str()}'
             raise CyclicEnvironmentVariableReferenceError(msg)
-        return self.__class__(loc=self.loc, stack=new_stack)
+        return self.__class__(loc=self.loc, stack=new_stack, refs=self.refs)
 
     def process_obj(self, name: str) -> Self:
         return self.__class__(
@@ -31,6 +37,7 @@ class ExpansionLocation:
                 name,
             ),
             stack=(),
+            refs=self.refs,
         )
 
     def location_str(self) -> str:
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+
+from easyconfig.expansion import load_file, load_var
+
+
+def get_digest(value: str | bytes | None) -> bytes | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    return blake2b(value, digest_size=16).digest()
+
+
+class ExpansionReferences:
+    """Environment variables and files that were read during the expansion.
+    Only the digests of the values are stored so secrets are not kept in memory."""
+
+    def __init__(self) -> None:
+        self.env_vars: dict[str, bytes | None] = {}
+        self.files: dict[str, bytes | None] = {}
+
+    def add_env_var(self, name: str, value: str | None) -> None:
+        self.env_vars[name] = get_digest(value)
+
+    def add_file(self, name: str, value: str | None) -> None:
+        self.files[name] = get_digest(value)
+
+    def is_current(self) -> bool:
+        for name, digest in self.env_vars.items():
+            if get_digest(load_var.environ.get(name)) != digest:
+                return False
+
+        for name, digest in self.files.items():
+            try:
+                value: str | None = load_file.read_file(name)
+            except Exception:
+                value = None
+            if get_digest(value) != digest:
+                return False
+
+        return True
+
+    def __bool__(self) -> bool:
+        return bool(self.env_vars or self.files)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} env_vars: {len(self.env_vars):d}, files: {len(self.files):d}>'
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
@@ -8,9 +8,16 @@ from easyconfig.models.config import ConfigMixin
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+    from easyconfig.config_objs import ConfigObjSubscription
+    from easyconfig.config_objs.change_stream import ConfigChangeStream, OverflowPolicyType
+    from easyconfig.config_objs.reload_cache import ReloadCacheStats
+    from easyconfig.config_objs.subscription_stats import SubscriptionStats
+    from easyconfig.config_objs.view import ConfigView
     from easyconfig.pre_process import PreProcess
+    from easyconfig.watcher import ConfigFileWatcher
 
 
 class AppConfigMixin(ConfigMixin):
@@ -22,6 +29,52 @@ class AppConfigMixin(ConfigMixin):
     def load_preprocess(self) -> PreProcess:
         """A preprocessor which can be used to preprocess the configuration data before it is loaded"""
 
+    @property
+    def reload_cache_stats(self) -> ReloadCacheStats | None:
+        """Hits and misses of the reload cache or None if the reload cache is not enabled"""
+
+    @property
+    def subscription_stats(self) -> SubscriptionStats | None:
+        """Duration of the calls of the subscription functions or None if the stats are not enabled"""
+
+    def snapshot(self) -> ConfigView:
+        """Return an immutable view of the current configuration values.
+        The view is consistent and does not change when the configuration is reloaded,
+        a reload publishes a new view which shares the unchanged parts with the previous one.
+        """
+
+    def subscribe(self, path: str, func: Callable[[], Any], *, prepare: bool = False,  # noqa: PLR0913
+                  debounce: float | None = None, max_rate: float | None = None,
+                  weak: bool = False) -> ConfigObjSubscription:
+        """Call the function when the value or the sub model at the path changes.
+        The names in the path are separated by dots, entries of tuples and dicts are selected
+        by their index or identity key respectively by their key, e.g. ``db.pool.size`` or ``servers.main.port``.
+
+        :param path: path to the value or sub model
+        :param func: function which will be called. If it has a required parameter it gets the change event.
+        :param prepare: Call the function before all functions which are not prepare functions
+        :param debounce: Call the function only after there was no change for this time in seconds
+        :param max_rate: Call the function at most this many times per second
+        :param weak: Only keep a weak reference to the function (or the object of a bound method).
+                     The subscription is removed when the function is garbage collected.
+        :return: object which can be used to cancel the subscription
+        """
+
+    def changes(self, path: str | None = None, *, maxsize: int = 16, coalesce: bool = False,
+                overflow: OverflowPolicyType = 'drop_oldest') -> ConfigChangeStream:
+        """Stream of the changes of the configuration which can be used with ``async for``.
+        Every load which changes values at the path is reported with one change event after all subscription
+        functions have been called successfully, so the changes can be processed in a task of the consumer.
+        The stream has to be created in the event loop of the consumer.
+
+        :param path: path to the value or sub model, None reports all changes
+        :param maxsize: Maximum number of events which are queued until they are consumed
+        :param coalesce: Merge the new event into the queued event if the consumer has not picked it up yet
+        :param overflow: ``drop_oldest`` removes the oldest queued event if the queue is full,
+                         ``block`` lets the load wait until the consumer picks up an event (async app config only)
+        :return: the stream, closing it stops the stream
+        """
+
     def set_file_path(self, path: Path | str) -> Self:
         """Set the path to the configuration file.
         If no file extension is specified ``.yml`` will be automatically appended.
@@ -43,6 +96,16 @@ class AppConfigMixin(ConfigMixin):
         :param expansion: Expand ${...} in strings
         """
 
+    def watch(self, *, interval: float = 1, debounce: float = 0.2) -> ConfigFileWatcher:
+        """Watch the configuration file and all files that are used in the expansion for changes
+        and reload the configuration. Multiple changes in quick succession result in only one reload.
+        If the reload fails the error is logged and the current values are kept.
+
+        :param interval: Interval in seconds to check for changes if inotify is not available
+        :param debounce: Time in seconds without changes before the configuration is reloaded
+        :return: object which can be used to stop watching the files
+        """
+
     def generate_default_yaml(self) -> str:
         """Generate the default YAML structure
 
@@ -59,6 +122,52 @@ class AsyncAppConfigMixin(ConfigMixin):
     def load_preprocess(self) -> PreProcess:
         """A preprocessor which can be used to preprocess the configuration data before it is loaded"""
 
+    @property
+    def reload_cache_stats(self) -> ReloadCacheStats | None:
+        """Hits and misses of the reload cache or None if the reload cache is not enabled"""
+
+    @property
+    def subscription_stats(self) -> SubscriptionStats | None:
+        """Duration of the calls of the subscription functions or None if the stats are not enabled"""
+
+    def snapshot(self) -> ConfigView:
+        """Return an immutable view of the current configuration values.
+        The view is consistent and does not change when the configuration is reloaded,
+        a reload publishes a new view which shares the unchanged parts with the previous one.
+        """
+
+    def subscribe(self, path: str, func: Callable[[], Any], *, prepare: bool = False,  # noqa: PLR0913
+                  debounce: float | None = None, max_rate: float | None = None,
+                  weak: bool = False) -> ConfigObjSubscription:
+        """Call the function when the value or the sub model at the path changes.
+        The names in the path are separated by dots, entries of tuples and dicts are selected
+        by their index or identity key respectively by their key, e.g. ``db.pool.size`` or ``servers.main.port``.
+
+        :param path: path to the value or sub model
+        :param func: function which will be called. If it has a required parameter it gets the change event.
+        :param prepare: Call the function before all functions which are not prepare functions
+        :param debounce: Call the function only after there was no change for this time in seconds
+        :param max_rate: Call the function at most this many times per second
+        :param weak: Only keep a weak reference to the function (or the object of a bound method).
+                     The subscription is removed when the function is garbage collected.
+        :return: object which can be used to cancel the subscription
+        """
+
+    def changes(self, path: str | None = None, *, maxsize: int = 16, coalesce: bool = False,
+                overflow: OverflowPolicyType = 'drop_oldest') -> ConfigChangeStream:
+        """Stream of the changes of the configuration which can be used with ``async for``.
+        Every load which changes values at the path is reported with one change event after all subscription
+        functions have been called successfully, so the changes can be processed in a task of the consumer.
+        The stream has to be created in the event loop of the consumer.
+
+        :param path: path to the value or sub model, None reports all changes
+        :param maxsize: Maximum number of events which are queued until they are consumed
+        :param coalesce: Merge the new event into the queued event if the consumer has not picked it up yet
+        :param overflow: ``drop_oldest`` removes the oldest queued event if the queue is full,
+                         ``block`` lets the load wait until the consumer picks up an event (async app config only)
+        :return: the stream, closing it stops the stream
+        """
+
     def set_file_path(self, path: Path | str) -> Self:
         """Set the path to the configuration file.
         If no file extension is specified ``.yml`` will be automatically appended.
@@ -80,6 +189,16 @@ class AsyncAppConfigMixin(ConfigMixin):
         :param expansion: Expand ${...} in strings
         """
 
+    def watch(self, *, interval: float = 1, debounce: float = 0.2) -> ConfigFileWatcher:
+        """Watch the configuration file and all files that are used in the expansion for changes
+        and reload the configuration. Multiple changes in quick succession result in only one reload.
+        If the reload fails the error is logged and the current values are kept.
+
+        :param interval: Interval in seconds to check for changes if inotify is not available
+        :param debounce: Time in seconds without changes before the configuration is reloaded
+        :return: object which can be used to stop watching the files
+        """
+
     def generate_default_yaml(self) -> str:
         """Generate the default YAML structure
 
@@ -8,7 +8,7 @@ from easyconfig.errors import FunctionCallNotAllowedError
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from pathlib import Path
 
     from easyconfig.config_objs import ConfigObjSubscription
@@ -19,6 +19,10 @@ class ConfigMixin:
     def config_file_path(self) -> Path:
         """Path to the loaded configuration file"""
 
+    @property
+    def config_generation(self) -> int:
+        """Number which increases every time a value of this object or of one of its children changes"""
+
     def subscribe_set_options(self, *, propagate: bool | None = None, on_next_value: bool | None = None) -> Self:
         """Set options for the subscription of this object.
 
@@ -26,13 +30,32 @@ class ConfigMixin:
         :param on_next_value: Call the function the next time when values get loaded even if there is no value change
         """
 
-    def subscribe_for_changes(self, func: Callable[[], Any]) -> ConfigObjSubscription:
+    def subscribe_for_changes(self, func: Callable[[], Any], *, prepare: bool = False,  # noqa: PLR0913
+                              fields: Iterable[str] | None = None, debounce: float | None = None,
+                              max_rate: float | None = None, weak: bool = False) -> ConfigObjSubscription:
         """When a value in this container changes the passed function will be called.
-
-        :param func: function which will be called
+        If a function raises an error the previous values will be restored.
+
+        :param func: function which will be called. If it has a required parameter it gets the change event.
+        :param prepare: Call the function before all functions which are not prepare functions
+        :param fields: Call the function only if one of these values changes
+        :param debounce: Call the function only after there was no change for this time in seconds
+        :param max_rate: Call the function at most this many times per second
+        :param weak: Only keep a weak reference to the function (or the object of a bound method).
+                     The subscription is removed when the function is garbage collected.
         :return: object which can be used to cancel the subscription
         """
 
+    def subscribe_many(self, funcs: Iterable[Callable[[], Any]], *, prepare: bool = False,  # noqa: PLR0913
+                       fields: Iterable[str] | None = None, debounce: float | None = None,
+                       max_rate: float | None = None, weak: bool = False) -> list[ConfigObjSubscription]:
+        """Subscribe several functions with the same options at once, see ``subscribe_for_changes``.
+        If one of the functions is already subscribed none of the functions will be subscribed.
+
+        :param funcs: functions which will be called
+        :return: objects which can be used to cancel the subscriptions, in the order of the functions
+        """
+
     # -----------------------------------------------------
     # pydantic 1
     @classmethod
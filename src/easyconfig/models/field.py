@@ -64,6 +64,7 @@ def Field(
     union_mode: Literal['smart', 'left_to_right'] = _Unset,
     fail_fast: bool | None = _Unset,
     in_file: bool = True,
+    identity_key: str | None = None,
     **extra: Unpack[_EmptyKwargs],
 ) -> Any: ...
 @overload  # `default` argument set, validate_default=True (no type checking on the default value)
@@ -105,6 +106,7 @@ def Field(
     union_mode: Literal['smart', 'left_to_right'] = _Unset,
     fail_fast: bool | None = _Unset,
     in_file: bool = True,
+    identity_key: str | None = None,
     **extra: Unpack[_EmptyKwargs],
 ) -> Any: ...
 
@@ -151,6 +153,7 @@ def Field(
     union_mode: Literal['smart', 'left_to_right'] = _Unset,
     fail_fast: bool | None = _Unset,
     in_file: bool = True,
+    identity_key: str | None = None,
     **extra: Unpack[_EmptyKwargs],
 ) -> _T: ...
 
@@ -194,6 +197,7 @@ def Field(  # pyright: ignore[reportOverlappingOverload]
     union_mode: Literal['smart', 'left_to_right'] = _Unset,
     fail_fast: bool | None = _Unset,
     in_file: bool = True,
+    identity_key: str | None = None,
     **extra: Unpack[_EmptyKwargs],
 ) -> Any: ...
 
@@ -240,6 +244,7 @@ def Field(
     union_mode: Literal['smart', 'left_to_right'] = _Unset,
     fail_fast: bool | None = _Unset,
     in_file: bool = True,
+    identity_key: str | None = None,
     **extra: Unpack[_EmptyKwargs],
 ) -> _T: ...
 
@@ -282,17 +287,20 @@ def Field(  # No default set
     union_mode: Literal['smart', 'left_to_right'] = _Unset,
     fail_fast: bool | None = _Unset,
     in_file: bool = True,
+    identity_key: str | None = None,
     **extra: Unpack[_EmptyKwargs],
 ) -> Any: ...
 
 
-def Field(*args, in_file: bool = True, **kwargs):  # noqa: N802
-    """Custom pydantic.Field that adds 'in_file' to json_schema_extra.
+def Field(*args, in_file: bool = True, identity_key: str | None = None, **kwargs):  # noqa: N802
+    """Custom pydantic.Field that adds 'in_file' and 'identity_key' to json_schema_extra.
     Pydantic usage docs: https://docs.pydantic.dev/2.12/concepts/fields/
 
     The `in_file` parameter is used by easyconfig to skip entries from appearing in the default file.
+    The `identity_key` parameter is used by easyconfig to match the entries of a tuple of models on reload.
     :param args: Positional arguments for the pydantic.Field constructor.
     :param in_file: Boolean that defines whether the field should be visible in the default file.
+    :param identity_key: Name of the field of the sub models which identifies an entry of a tuple of models.
     :param kwargs: Keyword arguments for the pydantic.Field constructor.
     """
     json_schema_extra = kwargs.get('json_schema_extra')
@@ -304,4 +312,7 @@ def Field(*args, in_file: bool = True, **kwargs):  # noqa: N802
         msg = f'json_schema_extra must be a dict, not {type(json_schema_extra).__name__}'
         raise TypeError(msg)
 
+    if identity_key is not None:
+        json_schema_extra['identity_key'] = identity_key
+
     return PydanticField(*args, json_schema_extra=json_schema_extra, **kwargs)
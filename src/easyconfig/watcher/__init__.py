@@ -0,0 +1 @@
+from .watcher import AsyncConfigFileWatcher, ConfigFileWatcher, ThreadConfigFileWatcher
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+from time import monotonic
+from typing import TYPE_CHECKING, Final, TypeAlias
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+    from threading import Event
+
+
+FileSignatureType: TypeAlias = tuple[int, int, int] | None
+
+
+def get_file_signature(path: Path) -> FileSignatureType:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class PollingBackend:
+    """Detects changes by comparing mtime, size and inode of the files"""
+
+    def __init__(self, stop: Event) -> None:
+        self._stop: Final = stop
+        self._files: dict[Path, FileSignatureType] = {}
+
+    def set_paths(self, paths: Iterable[Path]) -> None:
+        # Keep the signatures of the known files so changes which happen during a reload are not lost
+        self._files = {p: self._files[p] if p in self._files else get_file_signature(p) for p in paths}
+
+    def _files_changed(self) -> bool:
+        changed = False
+        for path, signature in self._files.items():
+            if (new := get_file_signature(path)) != signature:
+                self._files[path] = new
+                changed = True
+        return changed
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for the timeout and return True if a file changed"""
+        self._stop.wait(timeout)
+        return self._files_changed()
+
+    def close(self) -> None:
+        pass
+
+
+# https://man7.org/linux/man-pages/man7/inotify.7.html
+IN_MODIFY: Final = 0x00000002
+IN_ATTRIB: Final = 0x00000004
+IN_CLOSE_WRITE: Final = 0x00000008
+IN_MOVED_FROM: Final = 0x00000040
+IN_MOVED_TO: Final = 0x00000080
+IN_CREATE: Final = 0x00000100
+IN_DELETE: Final = 0x00000200
+
+IN_NONBLOCK: Final = 0o4000
+IN_CLOEXEC: Final = 0o2000000
+
+IN_DIR_MASK: Final = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, 'inotify_init1'):
+        return None
+    return libc
+
+
+class InotifyBackend(PollingBackend):
+    """Uses inotify to wake up on changes in the directories of the watched files.
+    The directories are watched instead of the files, so editors that replace the file
+    and symlink swaps (e.g. kubernetes secrets) are picked up, too.
+    The events are only used as a trigger, the actual change is detected through the file signature."""
+
+    # max time between checks of the stop event
+    STOP_CHECK_INTERVAL: Final = 0.25
+
+    def __init__(self, stop: Event, libc: ctypes.CDLL) -> None:
+        super().__init__(stop)
+        self._libc: Final = libc
+        self._fd: int | None = None
+        self._dirs: dict[Path, int] = {}
+
+        if (fd := libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)) < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+
+    def set_paths(self, paths: Iterable[Path]) -> None:
+        super().set_paths(paths)
+
+        if (fd := self._fd) is None:
+            return None
+
+        dirs = {p.parent for p in self._files}
+        for name in tuple(self._dirs):
+            if name not in dirs:
+                self._libc.inotify_rm_watch(fd, self._dirs.pop(name))
+
+        for name in dirs:
+            if name in self._dirs:
+                continue
+            # if the directory does not exist we can still detect the change through polling
+            if (wd := self._libc.inotify_add_watch(fd, os.fsencode(name), IN_DIR_MASK)) >= 0:
+                self._dirs[name] = wd
+        return None
+
+    def _drain_events(self) -> None:
+        if (fd := self._fd) is None:
+            return None
+        try:
+            while os.read(fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for the timeout and return True if a file changed"""
+        if self._fd is None:
+            return super().wait(timeout)
+
+        deadline = monotonic() + timeout
+        while not self._stop.is_set() and (remaining := deadline - monotonic()) > 0:
+            readable, _, _ = select.select([self._fd], [], [], min(remaining, self.STOP_CHECK_INTERVAL))
+            if not readable:
+                continue
+            self._drain_events()
+            if self._files_changed():
+                return True
+
+        # Directories which could not be watched
+        return self._files_changed()
+
+    def close(self) -> None:
+        if (fd := self._fd) is None:
+            return None
+        self._fd = None
+        self._dirs.clear()
+        os.close(fd)
+        return None
+
+
+def create_backend(stop: Event) -> PollingBackend:
+    if (libc := _load_libc()) is not None:
+        try:
+            return InotifyBackend(stop, libc)
+        except OSError:
+            pass
+    return PollingBackend(stop)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import logging
+from asyncio import create_task, to_thread
+from threading import Event, Thread, current_thread
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from easyconfig.watcher.backend import create_backend
+
+
+if TYPE_CHECKING:
+    from easyconfig.config_objs.app_config import AppConfig, AppConfigBase, AsyncAppConfig
+
+
+log = logging.getLogger('easyconfig.watcher')
+
+
+_APP_TYPE = TypeVar('_APP_TYPE', bound='AppConfigBase')
+
+
+class ConfigFileWatcher(Generic[_APP_TYPE]):
+    def __init__(self, app: _APP_TYPE, *, interval: float, debounce: float) -> None:
+        if interval <= 0:
+            msg = f'Interval must be > 0, got {interval}'
+            raise ValueError(msg)
+        if debounce < 0:
+            msg = f'Debounce must be >= 0, got {debounce}'
+            raise ValueError(msg)
+
+        self._app: Final = app
+        self._interval: Final = interval
+        self._debounce: Final = debounce
+
+        self._stop: Final = Event()
+        self._backend: Final = create_backend(self._stop)
+        self._backend.set_paths(app._get_watched_files())
+
+    @property
+    def is_running(self) -> bool:
+        """True if the files are still being watched"""
+        return not self._stop.is_set()
+
+    def _wait_for_change(self) -> bool:
+        """Block until a file changed. Returns False and closes the backend if the watcher was stopped"""
+        while not self._stop.is_set():
+            if not self._backend.wait(self._interval):
+                continue
+
+            # editors typically write multiple times, so we wait until the changes have settled
+            if self._debounce:
+                while not self._stop.is_set() and self._backend.wait(self._debounce):
+                    pass
+            if not self._stop.is_set():
+                return True
+
+        self._backend.close()
+        return False
+
+    def _reload_failed(self, e: Exception) -> None:
+        log.error(f'Error while reloading {self._app.config_file_path}: {e}')
+
+    def _reload_done(self) -> None:
+        # files used for the expansion might have changed
+        self._backend.set_paths(self._app._get_watched_files())
+
+    def cancel(self) -> None:
+        """Stop watching the files"""
+        self._stop.set()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self._app.config_file_path}>'
+
+
+class ThreadConfigFileWatcher(ConfigFileWatcher['AppConfig']):
+    def __init__(self, app: AppConfig, *, interval: float, debounce: float) -> None:
+        super().__init__(app, interval=interval, debounce=debounce)
+        self._thread: Final = Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            while self._wait_for_change():
+                try:
+                    self._app.load_config_file()
+                except Exception as e:
+                    self._reload_failed(e)
+                self._reload_done()
+        finally:
+            self._stop.set()
+            self._backend.close()
+
+    def cancel(self) -> None:
+        """Stop watching the files"""
+        super().cancel()
+        if current_thread() is not self._thread:
+            self._thread.join()
+
+
+class AsyncConfigFileWatcher(ConfigFileWatcher['AsyncAppConfig']):
+    def __init__(self, app: AsyncAppConfig, *, interval: float, debounce: float) -> None:
+        super().__init__(app, interval=interval, debounce=debounce)
+        self._task: Final = create_task(self._run(), name=self.__class__.__name__)
+
+    async def _run(self) -> None:
+        waiting = False
+        try:
+            while True:
+                # blocking wait runs in the default executor of the event loop
+                waiting = True
+                changed = await to_thread(self._wait_for_change)
+                waiting = False
+                if not changed:
+                    break
+
+                try:
+                    await self._app.load_config_file()
+                except Exception as e:
+                    self._reload_failed(e)
+                self._reload_done()
+        finally:
+            self._stop.set()
+            # if the task was canceled during the wait the worker thread will close the backend
+            if not waiting:
+                self._backend.close()
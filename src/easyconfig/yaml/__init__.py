@@ -1,4 +1,14 @@
-from easyconfig.yaml.yaml import CommentedMap, CommentedSeq, yaml_rt, yaml_safe
+from easyconfig.yaml.yaml import (
+    HAS_C_LOADER,
+    CommentedMap,
+    CommentedSeq,
+    YamlLoaderType,
+    create_yaml,
+    get_yaml_loader,
+    yaml_rt,
+    yaml_safe,
+    yaml_safe_pure,
+)
 
 
 # isort: split
@@ -3,7 +3,7 @@ from typing import Any
 
 from ruamel.yaml import CommentToken
 
-from easyconfig.yaml import yaml_rt
+from easyconfig.yaml import create_yaml
 
 
 def get_column(obj: tuple[Any, Any, CommentToken | None, Any]):
@@ -66,6 +66,9 @@ def remove_none(obj: dict) -> None:
 def write_aligned_yaml(obj, file_obj, extra_indent: int = 0):
     assert extra_indent >= 0, extra_indent
 
+    # the default file might be created in a worker thread, so the shared instance can't be used
+    yaml_rt = create_yaml('rt')
+
     buffer = StringIO()
     yaml_rt.dump(obj, buffer)
 
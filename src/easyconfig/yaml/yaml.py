@@ -1,16 +1,49 @@
+from typing import Final, Literal, TypeAlias
+
 import ruamel.yaml
 import ruamel.yaml.comments
+import ruamel.yaml.main
+
+
+def create_yaml(typ: str, *, pure: bool = False) -> ruamel.yaml.YAML:
+    """Create a new yaml instance. The instance keeps the state of the parser and the emitter,
+    so it must not be used by multiple threads at the same time."""
+    yaml = ruamel.yaml.YAML(typ=typ, pure=pure)
+    yaml.default_flow_style = False
+    yaml.default_style = False  # type: ignore[assignment]
+    yaml.width = 1_000_000
+    yaml.allow_unicode = True
+    yaml.sort_base_mapping_type_on_output = False   # type: ignore[assignment]
+    return yaml
 
 
-yaml_rt = ruamel.yaml.YAML(typ='rt')
-yaml_safe = ruamel.yaml.YAML(typ='safe')
+yaml_rt = create_yaml('rt')
+yaml_safe = create_yaml('safe')
+yaml_safe_pure = create_yaml('safe', pure=True)
 
 CommentedMap = ruamel.yaml.comments.CommentedMap
 CommentedSeq = ruamel.yaml.comments.CommentedSeq
 
-for __loader in (yaml_rt, yaml_safe):
-    __loader.default_flow_style = False
-    __loader.default_style = False  # type: ignore[assignment]
-    __loader.width = 1_000_000
-    __loader.allow_unicode = True
-    __loader.sort_base_mapping_type_on_output = False   # type: ignore[assignment]
+
+# yaml_safe automatically uses the C extension (ruamel.yaml.clib) if it is installed
+HAS_C_LOADER: Final = ruamel.yaml.main.CParser is not None
+
+YamlLoaderType: TypeAlias = Literal['rt', 'safe', 'c']
+
+
+def get_yaml_loader(name: YamlLoaderType) -> ruamel.yaml.YAML:
+    """Create a new yaml instance which is used to load the configuration file.
+
+    - ``rt``: round trip loader, keeps comments
+    - ``safe``: pure python safe loader, drops comments
+    - ``c``: safe loader from the C extension, falls back to the pure python loader if it's not installed
+    """
+    if name == 'rt':
+        return create_yaml('rt')
+    if name == 'safe':
+        return create_yaml('safe', pure=True)
+    if name == 'c':
+        return create_yaml('safe')
+
+    msg = f'Unknown yaml loader "{name}"! Must be one of "rt", "safe" or "c"'
+    raise ValueError(msg)
@@ -53,3 +53,59 @@ def test_attr_access() -> None:
     assert test_list == [True]
 
     assert o.value_10 == 10
+
+
+def test_apply_plan() -> None:
+    class SubModel(BaseModel):
+        a: int = 5
+
+    class SimpleModel(BaseModel):
+        b: int = 6
+        sub1: SubModel = SubModel()
+        sub2: SubModel = SubModel()
+
+    o = ConfigObj.from_model(SimpleModel())
+    o._set_values(SimpleModel(b=7, sub1=SubModel(a=1), sub2=SubModel(a=2)), [])
+    assert (o.b, o.sub1.a, o.sub2.a) == (7, 1, 2)
+
+    # the plan is shared between nodes of the same model
+    assert o.sub1._obj_plan is o.sub2._obj_plan
+    assert o._obj_plan.child_keys == ('sub1', 'sub2')
+    assert o._obj_plan.value_keys == ('b', )
+
+
+def test_generation() -> None:
+    class SubModel(BaseModel):
+        a: int = 5
+
+    class SimpleModel(BaseModel):
+        b: int = 5
+        sub: SubModel = SubModel()
+        other: SubModel = SubModel()
+        entries: tuple[SubModel, ...] = ()
+
+    o = ConfigObj.from_model(SimpleModel())
+    assert o.config_generation == 0
+
+    # child changed
+    o._set_values(SimpleModel(sub=SubModel(a=6)), [])
+    assert o.config_generation > 0
+    assert o.sub.config_generation == 1
+    assert o.other.config_generation == 0
+
+    # nothing changed
+    generation = o.config_generation
+    o._set_values(SimpleModel(sub=SubModel(a=6)), [])
+    assert o.config_generation == generation
+    assert o.sub.config_generation == 1
+
+    # value changed
+    o._set_values(SimpleModel(b=6, sub=SubModel(a=6)), [])
+    assert o.config_generation > generation
+    assert o.sub.config_generation == 1
+
+    # entry added
+    generation = o.config_generation
+    o._set_values(SimpleModel(b=6, sub=SubModel(a=6), entries=(SubModel(), )), [])
+    assert o.config_generation > generation
+    assert o.entries[0].config_generation == 0
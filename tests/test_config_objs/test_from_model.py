@@ -1,6 +1,7 @@
+import pytest
 from pydantic import BaseModel, PrivateAttr
 
-from easyconfig.config_objs import ConfigObj
+from easyconfig.config_objs import AppConfig, ConfigObj
 from easyconfig.models import ConfigMixin
 
 
@@ -98,3 +99,61 @@ def test_private_attr() -> None:
 
     o.set_vars()
     assert o._b == 99
+
+
+def test_class_cache() -> None:
+    class SubModel(BaseModel):
+        a: int = 5
+
+        def get_a(self) -> int:
+            return self.a
+
+    class SimpleModel(BaseModel):
+        a: tuple[SubModel, ...] = (SubModel(), SubModel(a=7))
+        b: SubModel = SubModel()
+
+    o = ConfigObj.from_model(SimpleModel())
+    assert type(o).__name__ == 'SimpleModelConfigObj'
+
+    cls = type(o.b)
+    assert cls.__name__ == 'SubModelConfigObj'
+    assert type(o.a[0]) is cls
+    assert type(o.a[1]) is cls
+    assert o.a[1].get_a() == 7
+
+    # different base class results in a different class
+    app_cls = AppConfig._get_obj_class(SubModel)
+    assert app_cls is not cls
+    assert issubclass(app_cls, AppConfig)
+    assert AppConfig._get_obj_class(SubModel) is app_cls
+
+
+def test_compact() -> None:
+    class SubModel(BaseModel):
+        a: int = 5
+        _b: int = PrivateAttr(6)
+
+    class SimpleModel(BaseModel):
+        c: tuple[SubModel, ...] = (SubModel(), SubModel(a=7))
+
+    o = AppConfig.from_model(SimpleModel(), compact=True)
+    sub0, sub1 = o.c
+    assert type(sub0) is type(sub1)
+    assert type(sub0).__slots__ == ('a', '_b')
+
+    # values are stored only once
+    assert (sub0.a, sub0._b, sub1.a) == (5, 6, 7)
+    assert sub1._obj_values == {'a': 7, '_b': 6}
+    assert not hasattr(sub1, '__dict__')
+    with pytest.raises(AttributeError):
+        sub1.other = 1
+
+    # the default nodes store the values in the instance dict
+    default = AppConfig.from_model(SimpleModel()).c[0]
+    assert vars(default) == {'a': 5, '_b': 6}
+
+    # nodes of the same model share the keys
+    assert sub0._obj_keys is sub1._obj_keys
+
+    o._set_values(SimpleModel(c=(SubModel(a=1), SubModel(a=2))), [])
+    assert (sub0.a, sub1.a) == (1, 2)
@@ -1,3 +1,5 @@
+import asyncio
+import gc
 from typing import Final
 from unittest.mock import AsyncMock, Mock, call
 
@@ -6,6 +8,8 @@ from pydantic import BaseModel
 
 from easyconfig.config_objs import AppConfig
 from easyconfig.config_objs.app_config import AsyncAppConfig
+from easyconfig.config_objs.change_event import ConfigChangeEvent, ValueChange
+from easyconfig.errors import DuplicateSubscriptionError
 from easyconfig.models import ConfigMixin
 
 
@@ -131,3 +135,389 @@ async def test_sub_sub_propagate(helper) -> None:
     mock_parent.assert_has_calls([call(), call()])
 
     sub_parent.cancel()
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_rollback(helper) -> None:
+    class SubModel(BaseModel, ConfigMixin):
+        a: int = 5
+
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+        sub: SubModel = SubModel()
+        entries: tuple[SubModel, ...] = ()
+
+    mock_prepare = helper.get_mock(name='prepare_mock')
+    mock_parent = helper.get_mock(name='parent_mock')
+    mock_child = helper.get_mock(name='child_mock')
+
+    o = helper.from_model(SimpleModel())
+    o.subscribe_for_changes(mock_parent)
+    o.sub.subscribe_for_changes(mock_prepare, prepare=True)
+    o.sub.subscribe_for_changes(mock_child)
+
+    await helper.load_config_dict(o, {'a': 1, 'sub': {'a': 2}, 'entries': [{'a': 3}]})
+    mock_prepare.assert_called_once_with()
+    mock_child.assert_called_once_with()
+    entries = o.entries
+    view = o.snapshot()
+    generation = o.config_generation
+
+    # a failing prepare function restores the values before any other function is called
+    mock_prepare.side_effect = ValueError()
+    with pytest.raises(ValueError):  # noqa: PT011
+        await helper.load_config_dict(o, {'a': 7, 'sub': {'a': 8}, 'entries': [{'a': 9}, {'a': 10}]})
+    assert mock_prepare.call_count == 2
+    mock_child.assert_called_once_with()
+    assert o.a == 1
+    assert o.sub.a == 2
+    assert o.entries is entries
+    assert o.entries[0].a == 3
+    assert o.config_generation > generation
+    # the view of the failed load was never published
+    assert o.snapshot() is view
+    assert o.snapshot().sub.a == 2
+
+    # a failing function restores the values, too
+    mock_prepare.side_effect = None
+    mock_parent.side_effect = ValueError()
+    with pytest.raises(ValueError):  # noqa: PT011
+        await helper.load_config_dict(o, {'a': 7, 'sub': {'a': 8}})
+    assert o.a == 1
+    assert o.sub.a == 2
+
+    # the same values can be loaded again
+    mock_parent.side_effect = None
+    await helper.load_config_dict(o, {'a': 7, 'sub': {'a': 8}, 'entries': [{'a': 9}, {'a': 10}]})
+    assert o.a == 7
+    assert o.sub.a == 8
+    assert o.entries[0] is entries[0]
+    assert [e.a for e in o.entries] == [9, 10]
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_fields(helper) -> None:
+    class SubModel(BaseModel, ConfigMixin):
+        host: str = 'localhost'
+        port: int = 80
+        user: str = ''
+
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+        db: SubModel = SubModel()
+        servers: dict[str, SubModel] = {}
+
+    mock_host = helper.get_mock(name='host_mock')
+    mock_both = helper.get_mock(name='both_mock')
+    mock_node = helper.get_mock(name='node_mock')
+
+    o = helper.from_model(SimpleModel())
+    o.db.subscribe_for_changes(mock_host, fields='host')
+    sub_both = o.db.subscribe_for_changes(mock_both, fields=('host', 'port'))
+    o.db.subscribe_for_changes(mock_node)
+
+    await helper.load_config_dict(o, {'db': {'user': 'x'}})
+    mock_host.assert_not_called()
+    mock_both.assert_not_called()
+    mock_node.assert_called_once_with()
+
+    await helper.load_config_dict(o, {'db': {'user': 'x', 'port': 81}})
+    mock_host.assert_not_called()
+    mock_both.assert_called_once_with()
+
+    await helper.load_config_dict(o, {'db': {'user': 'x', 'host': 'y', 'port': 82}})
+    mock_host.assert_called_once_with()
+    assert mock_both.call_count == 2
+    assert mock_node.call_count == 3
+
+    sub_both.cancel()
+    await helper.load_config_dict(o, {'db': {'user': 'x', 'host': 'z'}})
+    assert mock_host.call_count == 2
+    assert mock_both.call_count == 2
+
+    with pytest.raises(ValueError, match='has no field'):
+        o.db.subscribe_for_changes(mock_host, fields=('invalid', ))
+    with pytest.raises(ValueError, match='is a sub model'):
+        o.subscribe_for_changes(mock_host, fields=('db', ))
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_path(helper) -> None:
+    class SubModel(BaseModel, ConfigMixin):
+        host: str = 'localhost'
+        port: int = 80
+
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+        db: SubModel = SubModel()
+        servers: dict[str, SubModel] = {}
+        entries: tuple[SubModel, ...] = ()
+
+    mock_a = helper.get_mock(name='a_mock')
+    mock_db = helper.get_mock(name='db_mock')
+    mock_port = helper.get_mock(name='port_mock')
+    mock_server = helper.get_mock(name='server_mock')
+    mock_entry = helper.get_mock(name='entry_mock')
+
+    o = helper.from_model(SimpleModel())
+    await helper.load_config_dict(o, {'servers': {'main': {}}, 'entries': [{}, {}]})
+
+    o.subscribe('a', mock_a)
+    o.subscribe('db', mock_db)
+    o.subscribe('db.port', mock_port)
+    assert o.subscribe('servers.main.port', mock_server).name.endswith(' @ __root__.servers.main')
+    o.subscribe('entries.1', mock_entry)
+
+    await helper.load_config_dict(o, {'db': {'host': 'x'}, 'servers': {'main': {'port': 1}}, 'entries': [{}, {}]})
+    mock_a.assert_not_called()
+    mock_db.assert_called_once_with()
+    mock_port.assert_not_called()
+    mock_server.assert_called_once_with()
+    mock_entry.assert_not_called()
+
+    await helper.load_config_dict(o, {'a': 1, 'db': {'port': 1}, 'servers': {'main': {'port': 1}},
+                                      'entries': [{}, {'port': 1}]})
+    mock_a.assert_called_once_with()
+    mock_port.assert_called_once_with()
+    mock_entry.assert_called_once_with()
+
+    for path in ('b', 'a.b', 'servers.backup', 'entries.2', 'db.port.x'):
+        with pytest.raises(ValueError):  # noqa: PT011
+            o.subscribe(path, mock_a)
+    with pytest.raises(TypeError):
+        o.subscribe('servers', mock_a)
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_event(helper) -> None:
+    class SubModel(BaseModel, ConfigMixin):
+        host: str = 'localhost'
+        port: int = 80
+
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+        db: SubModel = SubModel()
+
+    events = {}
+
+    def get_func(name: str):
+        def func(event: ConfigChangeEvent) -> None:
+            events[name] = event
+        return func
+
+    calls = []
+
+    class Pool:
+        def rebuild(self, force=False) -> None:  # noqa: FBT002
+            calls.append(force)
+
+    def optional(event=None) -> None:
+        calls.append(event)
+
+    pool = Pool()
+    mock = helper.get_mock(name='my_mock')
+    o = helper.from_model(SimpleModel())
+    o.subscribe_set_options(propagate=True)
+    o.db.subscribe_set_options(propagate=True)
+    o.subscribe_for_changes(get_func('root'))
+    o.db.subscribe_for_changes(get_func('db'))
+    o.db.subscribe_for_changes(get_func('port'), fields='port')
+    o.db.subscribe_for_changes(mock)
+    o.db.subscribe_for_changes(pool.rebuild)
+    o.db.subscribe_for_changes(optional)
+
+    await helper.load_config_dict(o, {'a': 6, 'db': {'host': 'x', 'port': 81}})
+    assert events['root'].changes == (ValueChange('db.host', 'localhost', 'x'), ValueChange('db.port', 80, 81),
+                                      ValueChange('a', 5, 6))
+    assert events['db'].paths == ('db.host', 'db.port')
+    assert events['port'].changes == (ValueChange('db.port', 80, 81), )
+    assert events['port'].get('db.port').old == 80
+    assert events['port'].get('db.host') is None
+
+    # functions without a parameter or with only optional parameters are called without the event
+    mock.assert_called_once_with()
+    assert calls == [False, None]
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_debounce(helper) -> None:
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+        b: int = 6
+
+    events = []
+    mock = helper.get_mock(name='my_mock')
+
+    o = helper.from_model(SimpleModel())
+    o.subscribe_for_changes(events.append, debounce=0.05)
+    o.subscribe('b', mock, debounce=0.05)
+
+    await helper.load_config_dict(o, {'a': 6})
+    await helper.load_config_dict(o, {'a': 7, 'b': 7})
+    await helper.load_config_dict(o, {'a': 8, 'b': 7})
+    assert not events
+    mock.assert_not_called()
+
+    # one call with the merged changes
+    await asyncio.sleep(0.2)
+    assert events == [ConfigChangeEvent((ValueChange('a', 5, 8), ValueChange('b', 6, 7)))]
+    mock.assert_called_once_with()
+
+    with pytest.raises(ValueError, match='Prepare functions can not be delayed'):
+        o.subscribe_for_changes(mock, prepare=True, debounce=1)
+    with pytest.raises(ValueError, match='Debounce must be greater than 0'):
+        o.subscribe_for_changes(mock, debounce=0)
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_max_rate(helper) -> None:
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+
+    events = []
+
+    o = helper.from_model(SimpleModel())
+    sub = o.subscribe_for_changes(events.append, max_rate=10)
+
+    # the first change is reported immediately
+    await helper.load_config_dict(o, {'a': 6})
+    assert events == [ConfigChangeEvent((ValueChange('a', 5, 6), ))]
+
+    await helper.load_config_dict(o, {'a': 7})
+    await helper.load_config_dict(o, {'a': 8})
+    assert len(events) == 1
+
+    # the delayed call is done after 0.1s, wait until the next interval has passed
+    await asyncio.sleep(0.3)
+    assert events[1:] == [ConfigChangeEvent((ValueChange('a', 6, 8), ))]
+
+    # a pending call is canceled with the subscription
+    await helper.load_config_dict(o, {'a': 9})
+    await helper.load_config_dict(o, {'a': 10})
+    assert len(events) == 3
+    sub.cancel()
+    await asyncio.sleep(0.2)
+    assert len(events) == 3
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_delayed_rollback(helper) -> None:
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+
+    debounced = []
+    limited = []
+    mock = helper.get_mock(name='my_mock')
+
+    o = helper.from_model(SimpleModel())
+    o.subscribe_for_changes(debounced.append, debounce=0.05)
+    o.subscribe_for_changes(limited.append, max_rate=10)
+    o.subscribe_for_changes(mock)
+
+    # the first change is reported immediately by the rate limited function
+    await helper.load_config_dict(o, {'a': 6})
+    assert limited == [ConfigChangeEvent((ValueChange('a', 5, 6), ))]
+
+    # the reverted change is not reported, the change of the previous load still is
+    mock.side_effect = ValueError()
+    with pytest.raises(ValueError):  # noqa: PT011
+        await helper.load_config_dict(o, {'a': 7})
+    assert o.a == 6
+    await asyncio.sleep(0.2)
+    assert debounced == [ConfigChangeEvent((ValueChange('a', 5, 6), ))]
+    assert len(limited) == 1
+
+    # a pending call which only has reverted changes is canceled
+    # the rate limited function is not delayed, so it is called as part of the load like all other functions
+    with pytest.raises(ValueError):  # noqa: PT011
+        await helper.load_config_dict(o, {'a': 8})
+    assert limited[1:] == [ConfigChangeEvent((ValueChange('a', 6, 8), ))]
+    await asyncio.sleep(0.2)
+    assert len(debounced) == 1
+
+    # the next loads are reported as usual
+    mock.side_effect = None
+    await helper.load_config_dict(o, {'a': 10})
+    await helper.load_config_dict(o, {'a': 11})
+    await asyncio.sleep(0.3)
+    assert debounced[1:] == [ConfigChangeEvent((ValueChange('a', 6, 11), ))]
+    assert limited[2:] == [ConfigChangeEvent((ValueChange('a', 6, 10), )),
+                           ConfigChangeEvent((ValueChange('a', 10, 11), ))]
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_weak(helper) -> None:
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+
+    calls = []
+
+    class Handler:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def on_change(self) -> None:
+            calls.append(self.name)
+
+    o = helper.from_model(SimpleModel())
+    h1 = Handler('h1')
+    h2 = Handler('h2')
+    o.subscribe_for_changes(h1.on_change, weak=True)
+    sub2 = o.subscribe_for_changes(h2.on_change, weak=True)
+
+    await helper.load_config_dict(o, {'a': 6})
+    assert calls == ['h1', 'h2']
+
+    # the subscription does not keep the object alive
+    del h2
+    gc.collect()
+    calls.clear()
+    await helper.load_config_dict(o, {'a': 7})
+    assert calls == ['h1']
+    assert len(o._obj_subscriptions._subscriptions) == 1
+
+    # canceling a removed subscription is possible
+    sub2.cancel()
+
+    # dead entries are also removed on subscribe
+    del h1
+    gc.collect()
+    o.subscribe_for_changes(Handler('h3').on_change)
+    assert len(o._obj_subscriptions._subscriptions) == 1
+
+
+@pytest.mark.parametrize('helper', (SubTestHelper(AppConfig), SubTestHelper(AsyncAppConfig)), ids=pytest_ids)
+async def test_sub_many(helper) -> None:
+    class SimpleModel(BaseModel, ConfigMixin):
+        a: int = 5
+
+    calls = []
+
+    def get_func(name: str):
+        def func() -> None:
+            calls.append(name)
+        func.__name__ = name
+        return func
+
+    f1, f2, f3, f4 = (get_func(f'f{i:d}') for i in range(1, 5))
+
+    o = helper.from_model(SimpleModel())
+    s1, s2, s3 = o.subscribe_many((f1, f2, f3))
+    assert [s.name for s in (s1, s2, s3)] == ['f1 @ __root__', 'f2 @ __root__', 'f3 @ __root__']
+
+    # none of the functions is subscribed if one is a duplicate
+    with pytest.raises(DuplicateSubscriptionError):
+        o.subscribe_many((f4, f2))
+    with pytest.raises(DuplicateSubscriptionError):
+        o.subscribe_many((f4, f4))
+
+    await helper.load_config_dict(o, {'a': 6})
+    assert calls == ['f1', 'f2', 'f3']
+
+    # the functions are called in the order they were subscribed
+    s2.cancel()
+    o.subscribe_for_changes(f2)
+    o.subscribe_for_changes(f4)
+    calls.clear()
+    await helper.load_config_dict(o, {'a': 7})
+    assert calls == ['f1', 'f3', 'f2', 'f4']
@@ -0,0 +1,133 @@
+from asyncio import create_task, sleep, to_thread, wait_for
+
+import pytest
+from pydantic import BaseModel
+
+from easyconfig import create_app_config, create_async_app_config
+from easyconfig.config_objs import ConfigChangeEvent, ValueChange
+
+
+class DbModel(BaseModel):
+    host: str = 'localhost'
+    port: int = 5432
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    db: DbModel = DbModel()
+
+
+async def test_stream() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None)
+    stream = cfg.changes('db')
+
+    async def consume() -> list[ConfigChangeEvent]:
+        return [event async for event in stream]
+
+    task = create_task(consume())
+    await sleep(0)
+
+    await cfg.load_config_dict({'a': 6})
+    await cfg.load_config_dict({'a': 6, 'db': {'port': 1}})
+    await cfg.load_config_dict({'a': 7, 'db': {'port': 1, 'host': 'x'}})
+    stream.close()
+
+    assert await wait_for(task, 1) == [
+        ConfigChangeEvent((ValueChange('db.port', 5432, 1), )),
+        ConfigChangeEvent((ValueChange('db.host', 'localhost', 'x'), )),
+    ]
+
+    with pytest.raises(ValueError, match='has no sub model'):
+        cfg.changes('b')
+
+
+async def test_stream_close() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None)
+
+    async with cfg.changes() as stream:
+        await cfg.load_config_dict({'a': 6})
+        await cfg.load_config_dict({'a': 7})
+
+    # queued events are still returned
+    assert [event.paths async for event in stream] == [('a', ), ('a', )]
+    assert stream.closed
+
+    await cfg.load_config_dict({'a': 8})
+    assert not cfg._streams
+
+
+async def test_stream_drop_oldest() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None)
+    stream = cfg.changes(maxsize=2)
+
+    for i in range(6, 9):
+        await cfg.load_config_dict({'a': i})
+    stream.close()
+
+    assert [event.get('a').new async for event in stream] == [7, 8]
+    assert stream.dropped == 1
+
+
+async def test_stream_coalesce() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None)
+    stream = cfg.changes(coalesce=True)
+
+    await cfg.load_config_dict({'a': 6})
+    await cfg.load_config_dict({'a': 7, 'db': {'port': 1}})
+    await cfg.load_config_dict({'a': 8, 'db': {'port': 1}})
+    stream.close()
+
+    assert [event async for event in stream] == [
+        ConfigChangeEvent((ValueChange('a', 5, 8), ValueChange('db.port', 5432, 1)))
+    ]
+
+
+async def test_stream_block() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None)
+    stream = cfg.changes(maxsize=1, overflow='block')
+
+    await cfg.load_config_dict({'a': 6})
+
+    # the load waits until the consumer picks up the queued event
+    load = create_task(cfg.load_config_dict({'a': 7}))
+    await sleep(0.01)
+    assert not load.done()
+
+    assert (await wait_for(stream.__anext__(), 1)).get('a').new == 6
+    await wait_for(load, 1)
+    assert (await wait_for(stream.__anext__(), 1)).get('a').new == 7
+    assert stream.dropped == 0
+
+    with pytest.raises(ValueError, match='Unknown overflow policy'):
+        cfg.changes(overflow='invalid')
+
+
+async def test_stream_rollback() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None)
+    stream = cfg.changes()
+
+    def fail() -> None:
+        raise ValueError()
+
+    cfg.subscribe_for_changes(fail)
+    with pytest.raises(ValueError):  # noqa: PT011
+        await cfg.load_config_dict({'a': 6})
+
+    # the changes were not applied, so they are not reported
+    stream.close()
+    assert [event async for event in stream] == []
+
+
+async def test_stream_sync() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None)
+    stream = cfg.changes('db.port')
+
+    # loads from another thread and from the event loop
+    await to_thread(cfg.load_config_dict, {'db': {'port': 1, 'host': 'x'}})
+    cfg.load_config_dict({'db': {'port': 2, 'host': 'x'}})
+
+    assert (await wait_for(stream.__anext__(), 1)).changes == (ValueChange('db.port', 5432, 1), )
+    assert (await wait_for(stream.__anext__(), 1)).changes == (ValueChange('db.port', 1, 2), )
+
+    with pytest.raises(ValueError, match='AppConfig can not wait for the consumer'):
+        cfg.changes(overflow='block')
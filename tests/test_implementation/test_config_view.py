@@ -0,0 +1,159 @@
+from threading import Event, Thread
+
+import pytest
+from pydantic import BaseModel
+
+from easyconfig import create_app_config
+
+
+class SubModel(BaseModel):
+    host: str = 'localhost'
+    port: int = 80
+
+    @property
+    def url(self) -> str:
+        return f'{self.host}:{self.port}'
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    sub: SubModel = SubModel()
+    other: SubModel = SubModel()
+    entries: tuple[SubModel, ...] = ()
+    servers: dict[str, SubModel] = {}
+
+
+def test_snapshot() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None)
+    cfg.load_config_dict({'a': 7, 'entries': [{'port': 1}], 'servers': {'main': {'port': 2}}})
+
+    view = cfg.snapshot()
+    assert view is cfg.snapshot()
+    assert view.a == 7
+    assert view.sub.url == 'localhost:80'
+    assert view.entries[0].port == 1
+    assert view.servers['main'].port == 2
+
+    with pytest.raises(AttributeError):
+        view.a = 8
+    with pytest.raises(AttributeError):
+        view.sub.port = 8
+    with pytest.raises(AttributeError):
+        del view.a
+    with pytest.raises(TypeError):
+        view.servers['main'] = view.sub
+
+
+def test_snapshot_reload() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None)
+    cfg.load_config_dict({'entries': [{'port': 1}, {'port': 2}], 'servers': {'main': {'port': 2}}})
+    view = cfg.snapshot()
+
+    cfg.load_config_dict({'sub': {'port': 81}, 'entries': [{'port': 1}, {'port': 3}], 'servers': {'main': {'port': 2}}})
+    new = cfg.snapshot()
+
+    # the old view is not modified
+    assert view.sub.port == 80
+    assert view.entries[1].port == 2
+    assert new.sub.port == 81
+    assert new.entries[1].port == 3
+
+    # unchanged parts are shared
+    assert new is not view
+    assert new.sub is not view.sub
+    assert new.other is view.other
+    assert new.entries is not view.entries
+    assert new.entries[0] is view.entries[0]
+    assert new.servers['main'] is view.servers['main']
+
+    # no change publishes the same view
+    cfg.load_config_dict({'sub': {'port': 81}, 'entries': [{'port': 1}, {'port': 3}], 'servers': {'main': {'port': 2}}})
+    assert cfg.snapshot() is new
+
+    # entries are added
+    cfg.load_config_dict({'sub': {'port': 81}, 'entries': [{'port': 1}, {'port': 3}],
+                          'servers': {'main': {'port': 2}, 'backup': {'port': 3}}})
+    assert cfg.snapshot().servers['backup'].port == 3
+    assert cfg.snapshot().servers['main'] is new.servers['main']
+    assert cfg.snapshot().entries[1] is new.entries[1]
+
+
+@pytest.mark.parametrize('requested', [True, False])
+def test_snapshot_subscription(requested) -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None)
+    cfg.load_config_dict({'a': 1, 'entries': [{'port': 1}], 'servers': {'main': {'port': 2}}})
+    view = cfg.snapshot() if requested else None
+
+    # the view is published after all subscription functions have been called
+    views = []
+    cfg.subscribe_for_changes(lambda: views.append(cfg.snapshot()))
+    cfg.load_config_dict({'a': 2, 'entries': [{'port': 3}, {'port': 4}], 'servers': {'backup': {'port': 5}}})
+    assert views[0].a == 1
+    assert [e.port for e in views[0].entries] == [1]
+    assert list(views[0].servers) == ['main']
+    if view is not None:
+        assert views[0] is view
+
+    new = cfg.snapshot()
+    assert new.a == 2
+    assert [e.port for e in new.entries] == [3, 4]
+    assert list(new.servers) == ['backup']
+
+    # a failing subscription function rolls back the load, so nothing is published
+    def fail() -> None:
+        views.append(cfg.snapshot())
+        raise ValueError()
+
+    cfg.subscribe_for_changes(fail)
+    with pytest.raises(ValueError):  # noqa: PT011
+        cfg.load_config_dict({'a': 3})
+    assert views[-1] is new
+    assert cfg.snapshot() is new
+
+
+def test_snapshot_nested_load() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None)
+    view = cfg.snapshot()
+
+    # the inner load does not publish the values of the outer load which can still fail
+    def reload() -> None:
+        cfg.load_config_dict({'a': 1, 'sub': {'port': 81}})
+        assert cfg.snapshot() is view
+        raise ValueError()
+
+    cfg.subscribe('a', reload)
+    with pytest.raises(ValueError):  # noqa: PT011
+        cfg.load_config_dict({'a': 1})
+
+    # the values of the inner load are kept and published after the rollback of the outer load
+    assert (cfg.a, cfg.sub.port) == (5, 81)
+    new = cfg.snapshot()
+    assert (new.a, new.sub.port) == (5, 81)
+    assert new.other is view.other
+
+
+def test_snapshot_consistent() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None)
+    cfg.load_config_dict({'sub': {'host': 'host 0', 'port': 0}})
+    cfg.snapshot()
+
+    stop = Event()
+    inconsistent = []
+
+    def read() -> None:
+        while not stop.is_set():
+            view = cfg.snapshot()
+            if view.sub.host != f'host {view.sub.port:d}':
+                inconsistent.append(view)
+
+    thread = Thread(target=read)
+    thread.start()
+    try:
+        for i in range(1, 500):
+            cfg.load_config_dict({'sub': {'host': f'host {i:d}', 'port': i}})
+    finally:
+        stop.set()
+        thread.join()
+
+    assert not inconsistent
+    assert cfg.snapshot().sub.port == 499
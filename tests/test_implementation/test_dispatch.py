@@ -0,0 +1,260 @@
+import threading
+import time
+from asyncio import Event, sleep
+
+import pytest
+from pydantic import BaseModel
+
+from easyconfig import create_app_config, create_async_app_config
+from easyconfig.config_objs import ConcurrentDispatch, ThreadDispatch
+from easyconfig.errors import LoadInSubscriptionError, SubscriptionTimeoutError, set_exception_handler
+from easyconfig.errors.handler import default_exception_handler
+
+
+class SubModel(BaseModel):
+    a: int = 5
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    sub1: SubModel = SubModel()
+    sub2: SubModel = SubModel()
+
+
+@pytest.fixture
+def errors():
+    errors = []
+    set_exception_handler(errors.append)
+    yield errors
+    set_exception_handler(default_exception_handler)
+
+
+async def test_concurrent() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None, dispatch=ConcurrentDispatch())
+    calls = []
+    started = Event()
+
+    async def sub1() -> None:
+        calls.append('sub1 start')
+        started.set()
+        await sleep(0.01)
+        calls.append('sub1 done')
+
+    async def sub2() -> None:
+        await started.wait()
+        calls.append('sub2')
+
+    async def prepare() -> None:
+        calls.append('prepare')
+
+    cfg.sub1.subscribe_for_changes(sub1)
+    cfg.sub2.subscribe_for_changes(sub2)
+    cfg.subscribe_for_changes(prepare, prepare=True)
+
+    await cfg.load_config_dict({'a': 1, 'sub1': {'a': 1}, 'sub2': {'a': 1}})
+    assert calls == ['prepare', 'sub1 start', 'sub2', 'sub1 done']
+
+
+async def test_limit() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None, dispatch=ConcurrentDispatch(limit=1))
+    calls = []
+
+    async def sub1() -> None:
+        calls.append('sub1 start')
+        await sleep(0.01)
+        calls.append('sub1 done')
+
+    async def sub2() -> None:
+        calls.append('sub2')
+
+    cfg.sub1.subscribe_for_changes(sub1)
+    cfg.sub2.subscribe_for_changes(sub2)
+
+    await cfg.load_config_dict({'sub1': {'a': 1}, 'sub2': {'a': 1}})
+    assert calls == ['sub1 start', 'sub1 done', 'sub2']
+
+    with pytest.raises(ValueError, match='Limit must be greater than 0'):
+        ConcurrentDispatch(limit=0)
+
+
+async def test_timeout() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None, dispatch=ConcurrentDispatch(timeout=0.01))
+
+    async def sub1() -> None:
+        await sleep(1)
+
+    cfg.sub1.subscribe_for_changes(sub1)
+
+    # the default handler raises the error and the values are restored
+    with pytest.raises(SubscriptionTimeoutError, match=r'sub1 @ __root__.sub1 did not finish within 0.01s'):
+        await cfg.load_config_dict({'sub1': {'a': 1}})
+    assert cfg.sub1.a == 5
+
+
+async def test_errors(errors) -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None, dispatch=ConcurrentDispatch(timeout=0.01))
+    calls = []
+
+    async def sub1() -> None:
+        raise ValueError()
+
+    async def sub2() -> None:
+        await sleep(1)
+
+    def sub3() -> None:
+        calls.append('sub3')
+
+    cfg.sub1.subscribe_for_changes(sub1)
+    cfg.sub2.subscribe_for_changes(sub2)
+    cfg.subscribe_for_changes(sub3)
+
+    # all functions are called and all errors are reported
+    await cfg.load_config_dict({'a': 1, 'sub1': {'a': 1}, 'sub2': {'a': 1}})
+    assert calls == ['sub3']
+    assert [type(e) for e in errors] == [ValueError, SubscriptionTimeoutError]
+    assert cfg.sub1.a == 1
+
+
+def test_thread() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None, dispatch=ThreadDispatch())
+    calls = []
+
+    def sub1() -> None:
+        time.sleep(0.01)
+        calls.append(('sub1', threading.current_thread() is threading.main_thread()))
+
+    def sub2() -> None:
+        calls.append(('sub2', threading.current_thread() is threading.main_thread()))
+
+    def prepare() -> None:
+        time.sleep(0.01)
+        calls.append(('prepare', threading.current_thread() is threading.main_thread()))
+
+    cfg.sub1.subscribe_for_changes(sub1)
+    cfg.sub2.subscribe_for_changes(sub2)
+    cfg.subscribe_for_changes(prepare, prepare=True)
+
+    cfg.load_config_dict({'a': 1, 'sub1': {'a': 1}, 'sub2': {'a': 1}})
+    assert calls == [('prepare', False), ('sub2', False), ('sub1', False)]
+
+
+def test_thread_order() -> None:
+    dispatch = ThreadDispatch()
+    cfg = create_app_config(SimpleModel(), file_values=None, dispatch=dispatch)
+    calls = []
+
+    def sub1() -> None:
+        time.sleep(0.01)
+        calls.append('sub1')
+
+    def sub2() -> None:
+        calls.append('sub2')
+
+    s1 = cfg.sub1.subscribe_for_changes(sub1)
+    s2 = cfg.sub2.subscribe_for_changes(sub2)
+    dispatch.run_after(s2, s1)
+
+    cfg.load_config_dict({'sub1': {'a': 1}, 'sub2': {'a': 1}})
+    assert calls == ['sub1', 'sub2']
+
+    # order is only relevant if both are called
+    calls.clear()
+    cfg.load_config_dict({'sub1': {'a': 1}, 'sub2': {'a': 2}})
+    assert calls == ['sub2']
+
+    with pytest.raises(ValueError, match='Cyclic order'):
+        dispatch.run_after(s1, s2)
+
+
+def test_thread_order_cancel() -> None:
+    dispatch = ThreadDispatch()
+    cfg = create_app_config(SimpleModel(), file_values=None, dispatch=dispatch)
+
+    s1 = cfg.sub1.subscribe_for_changes(lambda: None)
+    s2 = cfg.sub2.subscribe_for_changes(lambda: None)
+    s3 = cfg.subscribe_for_changes(lambda: None)
+    dispatch.run_after(s2, s1)
+    dispatch.run_after(s3, s1, s2)
+
+    # canceled subscriptions are removed from the order
+    s1.cancel()
+    assert dispatch._after == {s3: (s2, )}
+    s2.cancel()
+    assert dispatch._after == {}
+
+
+def test_thread_reload() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None, dispatch=ThreadDispatch())
+
+    def reload() -> None:
+        cfg.load_config_dict({'a': 2})
+
+    # the load waits for the function, so a load from the function would block forever
+    cfg.subscribe('a', reload)
+    with pytest.raises(LoadInSubscriptionError):
+        cfg.load_config_dict({'a': 1})
+    assert cfg.a == 5
+
+
+def test_thread_reload_no_wait() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None, dispatch=ThreadDispatch(wait=False))
+    done = threading.Event()
+
+    def reload() -> None:
+        cfg.load_config_dict({'a': 1, 'sub1': {'a': 2}})
+        done.set()
+
+    cfg.subscribe('a', reload)
+    cfg.load_config_dict({'a': 1})
+    assert done.wait(1)
+    assert (cfg.a, cfg.sub1.a) == (1, 2)
+
+
+def test_thread_no_wait() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None, dispatch=ThreadDispatch(wait=False))
+    event = threading.Event()
+    done = threading.Event()
+
+    def sub1() -> None:
+        event.wait()
+        done.set()
+
+    cfg.sub1.subscribe_for_changes(sub1)
+    cfg.load_config_dict({'sub1': {'a': 1}})
+    assert not done.is_set()
+
+    event.set()
+    assert done.wait(1)
+
+
+def test_thread_errors() -> None:
+    dispatch = ThreadDispatch()
+    cfg = create_app_config(SimpleModel(), file_values=None, dispatch=dispatch)
+    calls = []
+
+    def sub1() -> None:
+        raise ValueError()
+
+    def sub2() -> None:
+        calls.append('sub2')
+
+    def sub3() -> None:
+        calls.append('sub3')
+
+    s1 = cfg.sub1.subscribe_for_changes(sub1)
+    s2 = cfg.sub2.subscribe_for_changes(sub2)
+    cfg.subscribe_for_changes(sub3)
+    dispatch.run_after(s2, s1)
+
+    # functions which run after a failed function are not called
+    with pytest.raises(ValueError):  # noqa: PT011
+        cfg.load_config_dict({'a': 1, 'sub1': {'a': 1}, 'sub2': {'a': 1}})
+    assert calls == ['sub3']
+    assert cfg.a == 5
+
+
+def test_dispatch_type() -> None:
+    with pytest.raises(TypeError, match='requires a ThreadDispatch'):
+        create_app_config(SimpleModel(), dispatch=ConcurrentDispatch())
+    with pytest.raises(TypeError, match='requires a ConcurrentDispatch'):
+        create_async_app_config(SimpleModel(), dispatch=ThreadDispatch())
@@ -0,0 +1,121 @@
+import os
+
+import pytest
+from pydantic import BaseModel
+
+from easyconfig import create_app_config
+from easyconfig.config_objs.fragments import ConfigFragments, merge_dicts
+
+
+class SubModel(BaseModel):
+    b: int = 1
+    c: list[int] = []
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    sub: SubModel = SubModel()
+
+
+def test_merge() -> None:
+    base = {'a': 1, 'sub': {'b': 1, 'c': [1]}}
+    override = {'sub': {'c': [2]}, 'd': {'e': 1}}
+
+    assert merge_dicts(base, override) == {'a': 1, 'sub': {'b': 1, 'c': [2]}, 'd': {'e': 1}}
+
+    # values are copied
+    assert base['d'] is not override['d']
+
+
+def test_fragments(tmp_path, monkeypatch) -> None:
+    file = tmp_path / 'app.yml'
+    file.write_text('a: 7\nsub:\n  b: 2\n  c: [1]')
+
+    frag_dir = tmp_path / 'app.d'
+    frag_dir.mkdir()
+    (frag_dir / '10_sub.yml').write_text('sub:\n  c: [3]')
+    (frag_dir / '20_a.yaml').write_text('a: 9')
+    (frag_dir / '30_ignored.txt').write_text('a: 99')
+    (frag_dir / '40_empty.yml').write_text('')
+
+    cfg = create_app_config(SimpleModel(), file_values=None, fragments=True)
+
+    parsed = []
+    parse = cfg._fragments._parse
+
+    def _parse(path):
+        parsed.append(path.name)
+        return parse(path)
+
+    monkeypatch.setattr(cfg._fragments, '_parse', _parse)
+
+    cfg.load_config_file(file)
+    assert cfg.a == 9
+    assert cfg.sub.b == 2
+    assert cfg.sub.c == [3]
+    assert sorted(parsed) == ['10_sub.yml', '20_a.yaml', '40_empty.yml']
+
+    assert cfg._get_watched_files() == (
+        file, frag_dir, frag_dir / '10_sub.yml', frag_dir / '20_a.yaml', frag_dir / '40_empty.yml')
+
+    # only the changed fragment gets parsed
+    parsed.clear()
+    (frag_dir / '20_a.yaml').write_text('a: 10')
+    cfg.load_config_file()
+    assert cfg.a == 10
+    assert cfg.sub.c == [3]
+    assert parsed == ['20_a.yaml']
+
+    # removed fragment
+    parsed.clear()
+    (frag_dir / '20_a.yaml').unlink()
+    cfg.load_config_file()
+    assert cfg.a == 7
+    assert parsed == []
+
+
+def test_fragments_reload_cache(tmp_path) -> None:
+    file = tmp_path / 'app.yml'
+    file.write_text('a: 7')
+
+    frag_dir = tmp_path / 'app.d'
+    frag_dir.mkdir()
+
+    cfg = create_app_config(SimpleModel(), file_values=None, fragments=True, reload_cache=True)
+    stats = cfg.reload_cache_stats
+
+    cfg.load_config_file(file)
+    cfg.load_config_file()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+    (frag_dir / 'a.yml').write_text('a: 8')
+    cfg.load_config_file()
+    assert cfg.a == 8
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_fragment_invalid(tmp_path) -> None:
+    (tmp_path / 'app.d').mkdir()
+    (tmp_path / 'app.d' / 'a.yml').write_text('- 1\n- 2')
+
+    fragments = ConfigFragments('safe')
+    with pytest.raises(TypeError, match='must contain a mapping'):
+        fragments.load(fragments.get_state(tmp_path / 'app.yml'))
+
+
+@pytest.mark.parametrize('loader', ['rt', 'safe', 'c'])
+def test_fragments_parallel(tmp_path, monkeypatch, loader) -> None:
+    # force multiple workers even if the machine has only one cpu
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+
+    frag_dir = tmp_path / 'app.d'
+    frag_dir.mkdir()
+    text = '\n'.join(f'k{i:d}:\n  - {i:d}\n  - {i + 1:d}' for i in range(100))
+    for i in range(16):
+        (frag_dir / f'{i:02d}.yml').write_text(f'nr: {i:d}\n{text}')
+
+    fragments = ConfigFragments(loader)
+    parsed = fragments.load(fragments.get_state(tmp_path / 'app.yml'))
+
+    assert [data['nr'] for data in parsed] == list(range(16))
+    assert all(data['k99'] == [99, 100] for data in parsed)
@@ -0,0 +1,227 @@
+from unittest.mock import Mock
+
+from pydantic import BaseModel, Field, model_validator
+
+from easyconfig import create_app_config
+from easyconfig.config_objs.incremental import IncrementalResult
+
+
+class SubModel(BaseModel):
+    b: int = 1
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    sub1: SubModel = SubModel()
+    sub2: SubModel = Field(SubModel(), alias='sub_2')
+
+
+def get_results(monkeypatch, cfg) -> list[IncrementalResult]:
+    results = []
+    validate = cfg._incremental.validate
+
+    def _validate(*args, **kwargs):
+        results.append(ret := validate(*args, **kwargs))
+        return ret
+
+    monkeypatch.setattr(cfg._incremental, 'validate', _validate)
+    return results
+
+
+def test_incremental(monkeypatch) -> None:
+    cfg = create_app_config(SimpleModel(), incremental=True)
+    results = get_results(monkeypatch, cfg)
+
+    m_root = Mock(__name__='root')
+    m_sub1 = Mock(__name__='sub1')
+    m_sub2 = Mock(__name__='sub2')
+    cfg.subscribe_for_changes(m_root)
+    cfg.sub1.subscribe_for_changes(m_sub1)
+    cfg.sub2.subscribe_for_changes(m_sub2).cancel()
+    cfg.sub2.subscribe_for_changes(m_sub2)
+    cfg.sub2.subscribe_set_options(propagate=True)
+
+    sub1 = cfg.sub1
+    sub2 = cfg.sub2
+
+    cfg.load_config_dict({'a': 1, 'sub1': {'b': 2}, 'sub_2': {'b': 3}})
+    assert results[-1].model is not None
+    assert (cfg.a, cfg.sub1.b, cfg.sub2.b) == (1, 2, 3)
+    assert (m_root.call_count, m_sub1.call_count, m_sub2.call_count) == (1, 1, 1)
+
+    # only the child gets validated
+    cfg.load_config_dict({'a': 1, 'sub1': {'b': 2}, 'sub_2': {'b': 4}})
+    assert results[-1].model is None
+    assert list(results[-1].children) == ['sub2']
+    assert (cfg.a, cfg.sub1.b, cfg.sub2.b) == (1, 2, 4)
+    assert cfg.sub1 is sub1
+    assert cfg.sub2 is sub2
+    # change is propagated to the root
+    assert (m_root.call_count, m_sub1.call_count, m_sub2.call_count) == (2, 1, 2)
+
+    # nothing changed
+    cfg.load_config_dict({'a': 1, 'sub1': {'b': 2}, 'sub_2': {'b': 4}})
+    assert results[-1].model is None
+    assert results[-1].children == {}
+
+    # value of the root changed
+    cfg.load_config_dict({'a': 2, 'sub1': {'b': 2}, 'sub_2': {'b': 4}})
+    assert results[-1].model is not None
+    assert cfg.a == 2
+
+    # keys changed
+    cfg.load_config_dict({'a': 2, 'sub1': {'b': 3}})
+    assert results[-1].model is not None
+    assert (cfg.a, cfg.sub1.b, cfg.sub2.b) == (2, 3, 1)
+
+
+def test_incremental_modified_dict() -> None:
+    cfg = create_app_config(SimpleModel(), incremental=True)
+
+    data = {'a': 1, 'sub1': {'b': 2}, 'sub_2': {'b': 3}}
+    cfg.load_config_dict(data)
+
+    # the caller modifies the same dict and loads it again
+    data['sub1']['b'] = 5
+    cfg.load_config_dict(data)
+    assert cfg.sub1.b == 5
+
+
+def test_incremental_on_next_value(monkeypatch) -> None:
+    cfg = create_app_config(SimpleModel(), incremental=True)
+    results = get_results(monkeypatch, cfg)
+
+    data = {'a': 1, 'sub1': {'b': 2}, 'sub_2': {'b': 3}}
+    cfg.load_config_dict(data)
+
+    m_sub1 = Mock(__name__='sub1')
+    m_sub2 = Mock(__name__='sub2')
+    cfg.sub1.subscribe_for_changes(m_sub1)
+    cfg.sub2.subscribe_for_changes(m_sub2)
+    cfg.sub1.subscribe_set_options(on_next_value=True)
+
+    # nothing changed, but the subscription is called on the next load
+    cfg.load_config_dict(data)
+    assert results[-1].model is not None
+    m_sub1.assert_called_once_with()
+    m_sub2.assert_not_called()
+
+    # the following loads are incremental again
+    cfg.load_config_dict(data)
+    assert results[-1].model is None
+    assert results[-1].children == {}
+    m_sub1.assert_called_once_with()
+
+
+def test_incremental_validator(monkeypatch) -> None:
+    class ValidatedModel(SimpleModel):
+        @model_validator(mode='after')
+        def check(self):
+            return self
+
+    cfg = create_app_config(ValidatedModel(), incremental=True)
+    results = get_results(monkeypatch, cfg)
+
+    cfg.load_config_dict({'a': 1, 'sub1': {'b': 2}})
+    cfg.load_config_dict({'a': 1, 'sub1': {'b': 3}})
+    assert all(r.model is not None for r in results)
+    assert cfg.sub1.b == 3
+
+
+def test_skip_unchanged_subtrees(monkeypatch) -> None:
+    class NodeModel(BaseModel):
+        name: str = ''
+        sub: SubModel = SubModel()
+
+    class TreeModel(BaseModel):
+        a: int = 5
+        nodes: tuple[NodeModel, ...] = (NodeModel(), NodeModel())
+
+    cfg = create_app_config(TreeModel(), incremental=True)
+    node0, node1 = cfg.nodes
+
+    applied = []
+    for node in (node0, node0.sub, node1, node1.sub):
+        def _set_values(*args, __func=node._set_values, __node=node, **kwargs):
+            applied.append(__node)
+            return __func(*args, **kwargs)
+        monkeypatch.setattr(node, '_set_values', _set_values)
+
+    cfg.load_config_dict({'a': 1, 'nodes': [{'name': 'n0', 'sub': {'b': 1}}, {'name': 'n1', 'sub': {'b': 1}}]})
+    assert applied == [node0, node0.sub, node1, node1.sub]
+
+    # only the changed node is updated
+    applied.clear()
+    m_sub1 = Mock(__name__='sub1')
+    node1.sub.subscribe_for_changes(m_sub1)
+    cfg.load_config_dict({'a': 2, 'nodes': [{'name': 'n0', 'sub': {'b': 1}}, {'name': 'n1', 'sub': {'b': 3}}]})
+    assert applied == [node0, node1, node1.sub]
+    assert (cfg.a, node0.sub.b, node1.sub.b) == (2, 1, 3)
+    m_sub1.assert_called_once()
+
+    # the node changed but not its child
+    applied.clear()
+    cfg.load_config_dict({'a': 3, 'nodes': [{'name': 'x', 'sub': {'b': 1}}, {'name': 'n1', 'sub': {'b': 3}}]})
+    assert applied == [node0, node0.sub, node1]
+    assert node0.name == 'x'
+
+    # pending on_next_value subscriptions are not skipped
+    applied.clear()
+    m_sub0 = Mock(__name__='sub0')
+    node0.sub.subscribe_for_changes(m_sub0)
+    node0.sub.subscribe_set_options(on_next_value=True)
+    cfg.load_config_dict({'a': 4, 'nodes': [{'name': 'x', 'sub': {'b': 1}}, {'name': 'n1', 'sub': {'b': 3}}]})
+    assert applied == [node0, node0.sub, node1]
+    m_sub0.assert_called_once()
+
+    # values which were set without the raw data are always updated
+    applied.clear()
+    cfg.load_config_dict({'a': 5, 'nodes': [{'name': 'n0'}, {'name': 'n1'}]}, expansion=False)
+    cfg._call_subscriptions(cfg._apply_model(TreeModel()))
+    assert node1.sub.b == 1
+    applied.clear()
+    cfg.load_config_dict({'a': 5, 'nodes': [{'name': 'n0'}, {'name': 'n1', 'sub': {'b': 3}}]})
+    assert node1.sub.b == 3
+    assert node1 in applied
+
+
+def test_skip_modified_dict() -> None:
+    class NodeModel(BaseModel):
+        name: str = ''
+        sub: SubModel = SubModel()
+
+    class TreeModel(BaseModel):
+        a: int = 5
+        nodes: tuple[NodeModel, ...] = (NodeModel(), NodeModel())
+
+    cfg = create_app_config(TreeModel(), incremental=True)
+
+    data = {'a': 1, 'nodes': [{'name': 'n0', 'sub': {'b': 1}}, {'name': 'n1', 'sub': {'b': 1}}]}
+    cfg.load_config_dict(data)
+
+    # the subtree is modified in place, so it must not be skipped
+    data['a'] = 2
+    data['nodes'][1]['sub']['b'] = 3
+    cfg.load_config_dict(data)
+    assert (cfg.a, cfg.nodes[0].sub.b, cfg.nodes[1].sub.b) == (2, 1, 3)
+
+
+def test_skip_parent_validator() -> None:
+    class ParentModel(BaseModel):
+        sub: SubModel = SubModel()
+
+        @model_validator(mode='after')
+        def check(self):
+            self.sub.b *= 2
+            return self
+
+    class TreeModel(BaseModel):
+        a: int = 5
+        parent: ParentModel = ParentModel()
+
+    cfg = create_app_config(TreeModel(), incremental=True)
+    assert cfg.parent._obj_plan is None
+
+    cfg.load_config_dict({'a': 1, 'parent': {'sub': {'b': 1}}})
+    assert cfg.parent.sub.b == 2
+    assert cfg.parent._obj_plan.child_raw_keys == (None, )
@@ -1,8 +1,13 @@
+from asyncio import gather
+from threading import Thread, current_thread, main_thread
+from time import sleep
+
 import pytest
 from pydantic import BaseModel as PydanticBaseModel
 
 from easyconfig import AppBaseModel, BaseModel
 from easyconfig.config_objs import AppConfig
+from easyconfig.config_objs.app_config import AsyncAppConfig
 from helper import Path
 
 
@@ -56,3 +61,73 @@ def test_mutate_nested(base_cls) -> None:
     assert cfg.c == 9
     assert cfg.a is a and a.aa == 77  # noqa: PT018
     assert cfg.b is b and b.aa == 99  # noqa: PT018
+
+
+async def test_async_load_in_thread(monkeypatch) -> None:
+    class SimpleModel(PydanticBaseModel):
+        a: int = 5
+
+    cfg = AsyncAppConfig.from_model(SimpleModel())
+
+    threads = []
+    validate_file = cfg._validate_file
+
+    def _validate_file(**kwargs):
+        threads.append(current_thread())
+        return validate_file(**kwargs)
+
+    monkeypatch.setattr(cfg, '_validate_file', _validate_file)
+
+    file = Path('test_file.yml', initial_value='a: 7')
+    await cfg.load_config_file(file)
+
+    assert cfg.a == 7
+    assert threads
+    assert threads[0] is not main_thread()
+
+
+@pytest.mark.parametrize('loader', ['rt', 'safe'])
+async def test_async_load_concurrent(tmp_path, loader) -> None:
+    class SimpleModel(PydanticBaseModel):
+        entries: dict[str, list[int]] = {}
+
+    # the files are parsed in worker threads at the same time
+    text = 'entries:\n' + '\n'.join(f'  k{i:d}:\n    - {i:d}\n    - {i + 1:d}' for i in range(200))
+    configs = []
+    for i in range(6):
+        (file := tmp_path / f'test{i:d}.yml').write_text(text)
+        configs.append(AsyncAppConfig.from_model(SimpleModel(), loader=loader).set_file_path(file))
+
+    await gather(*(cfg.load_config_file() for cfg in configs))
+
+    for cfg in configs:
+        assert len(cfg.entries) == 200
+        assert cfg.entries['k199'] == [199, 200]
+
+
+def test_load_serialized() -> None:
+    class SimpleModel(PydanticBaseModel):
+        a: int = 5
+
+    cfg = AppConfig.from_model(SimpleModel())
+
+    running = []
+    overlap = []
+
+    def func() -> None:
+        overlap.append(bool(running))
+        running.append(cfg.a)
+        sleep(0.02)
+        running.pop()
+
+    cfg.subscribe_for_changes(func)
+
+    # the loads e.g. from the watcher and from the application must not interleave
+    threads = [Thread(target=cfg.load_config_dict, args=({'a': i}, )) for i in range(6, 10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(overlap) == 4
+    assert not any(overlap)
@@ -0,0 +1,152 @@
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from easyconfig import Field, create_app_config
+
+
+class EntryModel(BaseModel):
+    name: str = ''
+    port: int = 0
+
+
+class PositionModel(BaseModel):
+    entries: tuple[EntryModel, ...] = (EntryModel(name='a'), )
+    values: tuple[int, ...] = ()
+
+
+class KeyModel(BaseModel):
+    entries: tuple[EntryModel, ...] = Field((EntryModel(name='a'), EntryModel(name='b')), identity_key='name')
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_position(incremental) -> None:
+    cfg = create_app_config(PositionModel(), incremental=incremental)
+    entry_a, = cfg.entries
+
+    m_root = Mock(__name__='root')
+    m_a = Mock(__name__='a')
+    cfg.subscribe_for_changes(m_root)
+    entry_a.subscribe_for_changes(m_a)
+
+    # grow
+    cfg.load_config_dict({'entries': [{'name': 'a'}, {'name': 'b', 'port': 2}], 'values': [1, 2]})
+    assert len(cfg.entries) == 2
+    assert cfg.entries[0] is entry_a
+    assert cfg.entries[1].port == 2
+    assert cfg.entries[1]._obj_path == ('__root__', 'entries', '1')
+    assert cfg.values == (1, 2)
+    assert (m_root.call_count, m_a.call_count) == (1, 0)
+
+    # shrink
+    cfg.load_config_dict({'entries': [{'name': 'a', 'port': 1}]})
+    assert cfg.entries == (entry_a, )
+    assert entry_a.port == 1
+    assert (m_root.call_count, m_a.call_count) == (2, 1)
+
+    cfg.load_config_dict({'entries': []})
+    assert cfg.entries == ()
+    assert cfg._obj_children['entries'] == ()
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_identity_key(incremental) -> None:
+    cfg = create_app_config(KeyModel(), incremental=incremental)
+    entry_a, entry_b = cfg.entries
+    assert entry_b._obj_path == ('__root__', 'entries', 'b')
+
+    m_root = Mock(__name__='root')
+    m_a = Mock(__name__='a')
+    m_b = Mock(__name__='b')
+    cfg.subscribe_for_changes(m_root)
+    entry_a.subscribe_for_changes(m_a)
+    entry_b.subscribe_for_changes(m_b)
+
+    # insert at the front
+    cfg.load_config_dict({'entries': [{'name': 'c'}, {'name': 'a'}, {'name': 'b', 'port': 2}]})
+    entry_c = cfg.entries[0]
+    assert cfg.entries == (entry_c, entry_a, entry_b)
+    assert entry_c._obj_path == ('__root__', 'entries', 'c')
+    assert entry_b.port == 2
+    assert (m_root.call_count, m_a.call_count, m_b.call_count) == (1, 0, 1)
+
+    # nothing changed
+    cfg.load_config_dict({'entries': [{'name': 'c'}, {'name': 'a'}, {'name': 'b', 'port': 2}]})
+    assert m_root.call_count == 1
+
+    # reorder and remove
+    cfg.load_config_dict({'entries': [{'name': 'b', 'port': 2}, {'name': 'c'}]})
+    assert cfg.entries == (entry_b, entry_c)
+    assert (m_root.call_count, m_a.call_count, m_b.call_count) == (2, 0, 1)
+
+
+def test_identity_key_duplicate() -> None:
+    cfg = create_app_config(KeyModel())
+    entries = cfg.entries
+
+    with pytest.raises(ValueError, match=r'Duplicate identity key name=a in __root__\.entries'):
+        cfg.load_config_dict({'entries': [{'name': 'a'}, {'name': 'b'}, {'name': 'a', 'port': 2}]})
+    assert cfg.entries is entries
+
+    with pytest.raises(ValueError, match='Duplicate identity key name=a'):
+        create_app_config(KeyModel(entries=(EntryModel(name='a'), EntryModel(name='a'))))
+
+
+class DictModel(BaseModel):
+    entries: dict[str, EntryModel] = {'a': EntryModel(name='a'), 'b': EntryModel(name='b')}
+    empty: dict[str, EntryModel] = {}
+    values: dict[str, int] = {}
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_dict(incremental) -> None:
+    cfg = create_app_config(DictModel(), incremental=incremental)
+    entry_a = cfg.entries['a']
+    entry_b = cfg.entries['b']
+    assert entry_b._obj_path == ('__root__', 'entries', 'b')
+    assert cfg.empty == {}
+
+    m_root = Mock(__name__='root')
+    m_a = Mock(__name__='a')
+    m_b = Mock(__name__='b')
+    cfg.subscribe_for_changes(m_root)
+    entry_a.subscribe_for_changes(m_a)
+    entry_b.subscribe_for_changes(m_b)
+
+    # change one entry
+    cfg.load_config_dict({'entries': {'a': {'name': 'a'}, 'b': {'name': 'b', 'port': 2}}})
+    assert cfg.entries['a'] is entry_a
+    assert cfg.entries['b'] is entry_b
+    assert entry_b.port == 2
+    assert (m_root.call_count, m_a.call_count, m_b.call_count) == (0, 0, 1)
+
+    # add and remove entries
+    cfg.load_config_dict({'entries': {'b': {'name': 'b', 'port': 2}, 'c': {'port': 3}},
+                          'empty': {'x': {}}, 'values': {'y': 1}})
+    assert list(cfg.entries) == ['b', 'c']
+    assert cfg.entries['b'] is entry_b
+    assert cfg.entries['c'].port == 3
+    assert cfg.empty['x']._obj_path == ('__root__', 'empty', 'x')
+    assert cfg.values == {'y': 1}
+    assert (m_root.call_count, m_a.call_count, m_b.call_count) == (1, 0, 1)
+
+    # the mapping is read only
+    with pytest.raises(TypeError):
+        cfg.entries['d'] = entry_b
+
+
+class OptionalDictModel(BaseModel):
+    entries: dict[str, EntryModel] | None = {'a': EntryModel(name='a')}
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_dict_optional(incremental) -> None:
+    cfg = create_app_config(OptionalDictModel(), incremental=incremental)
+    assert cfg.entries == {'a': EntryModel(name='a')}
+
+    cfg.load_config_dict({'entries': None})
+    assert cfg.entries is None
+
+    cfg.load_config_dict({'entries': {'b': {'port': 2}}})
+    assert cfg.entries == {'b': EntryModel(port=2)}
@@ -0,0 +1,124 @@
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from easyconfig.config_objs import AppConfig
+from easyconfig.config_objs.app_config import AsyncAppConfig
+from easyconfig.expansion import load_var as var_module
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    b: str = 'asdf'
+
+
+def test_reload_cache_disabled(tmp_path) -> None:
+    file = tmp_path / 'test.yml'
+    file.write_text('a: 7')
+
+    cfg = AppConfig.from_model(SimpleModel())
+    assert cfg.reload_cache_stats is None
+
+    cfg.load_config_file(file)
+    assert cfg.a == 7
+
+
+def test_reload_cache(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(var_module, 'environ', env := {'MY_ENV': 'env_1'})
+
+    file = tmp_path / 'test.yml'
+    file.write_text('a: 7\nb: ${MY_ENV}')
+
+    cfg = AppConfig.from_model(SimpleModel(), reload_cache=True)
+    stats = cfg.reload_cache_stats
+
+    m = Mock(__name__='my_mock')
+    cfg.subscribe_for_changes(m)
+
+    cfg.load_config_file(file)
+    assert (cfg.a, cfg.b) == (7, 'env_1')
+    assert (stats.hits, stats.misses) == (0, 1)
+    m.assert_called_once()
+
+    # nothing changed
+    cfg.load_config_file()
+    assert (stats.hits, stats.misses) == (1, 1)
+    m.assert_called_once()
+
+    # environment variable changed
+    env['MY_ENV'] = 'env_2'
+    cfg.load_config_file()
+    assert cfg.b == 'env_2'
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert m.call_count == 2
+
+    # file changed
+    file.write_text('a: 8\nb: ${MY_ENV}')
+    cfg.load_config_file()
+    assert cfg.a == 8
+    assert (stats.hits, stats.misses) == (1, 3)
+
+    # disabled expansion
+    cfg.load_config_file(expansion=False)
+    assert cfg.b == '${MY_ENV}'
+    assert (stats.hits, stats.misses) == (1, 4)
+
+    # loading a dict invalidates the cache
+    cfg.load_config_dict({'a': 1})
+    cfg.load_config_file(expansion=False)
+    assert cfg.a == 8
+    assert (stats.hits, stats.misses) == (1, 5)
+
+    stats.reset()
+    assert (stats.hits, stats.misses) == (0, 0)
+
+
+def test_reload_cache_secret_file(tmp_path) -> None:
+    secret = tmp_path / 'secret'
+    secret.write_text('secret_1')
+
+    file = tmp_path / 'test.yml'
+    file.write_text(f'b: ${{{secret.as_posix()}}}')
+
+    cfg = AppConfig.from_model(SimpleModel(), reload_cache=True)
+    stats = cfg.reload_cache_stats
+
+    cfg.load_config_file(file)
+    cfg.load_config_file()
+    assert cfg.b == 'secret_1'
+    assert (stats.hits, stats.misses) == (1, 1)
+
+    secret.write_text('secret_2')
+    cfg.load_config_file()
+    assert cfg.b == 'secret_2'
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_reload_cache_failed_load(tmp_path) -> None:
+    file = tmp_path / 'test.yml'
+    file.write_text('a: 7')
+
+    cfg = AppConfig.from_model(SimpleModel(), reload_cache=True)
+    stats = cfg.reload_cache_stats
+    cfg.load_config_file(file)
+
+    file.write_text('a: asdf')
+    with pytest.raises(ValueError):  # noqa: PT011
+        cfg.load_config_file()
+    with pytest.raises(ValueError):  # noqa: PT011
+        cfg.load_config_file()
+    assert (stats.hits, stats.misses) == (0, 3)
+
+
+async def test_reload_cache_async(tmp_path) -> None:
+    file = tmp_path / 'test.yml'
+    file.write_text('a: 7')
+
+    cfg = AsyncAppConfig.from_model(SimpleModel(), reload_cache=True)
+    stats = cfg.reload_cache_stats
+
+    await cfg.load_config_file(file)
+    await cfg.load_config_file()
+    assert cfg.a == 7
+    assert (stats.hits, stats.misses) == (1, 1)
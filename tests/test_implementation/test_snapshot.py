@@ -0,0 +1,98 @@
+from pydantic import BaseModel
+
+from easyconfig import create_app_config
+from easyconfig.config_objs.snapshot import ConfigSnapshot, get_model_fingerprint
+from easyconfig.expansion import load_var as var_module
+
+
+class SubModel(BaseModel):
+    b: list[int] = []
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    sub: SubModel = SubModel()
+
+
+class OtherModel(BaseModel):
+    a: int = 5
+    sub: SubModel = SubModel()
+    c: str = ''
+
+
+def create_config(monkeypatch):
+    cfg = create_app_config(SimpleModel(), file_values=None, snapshot=True)
+
+    validated = []
+    validate_dict = cfg._validate_dict
+
+    def _validate_dict(*args, **kwargs):
+        validated.append(True)
+        return validate_dict(*args, **kwargs)
+
+    monkeypatch.setattr(cfg, '_validate_dict', _validate_dict)
+    return cfg, validated
+
+
+def test_fingerprint() -> None:
+    assert get_model_fingerprint(SimpleModel) == get_model_fingerprint(SimpleModel)
+    assert get_model_fingerprint(SimpleModel) != get_model_fingerprint(OtherModel)
+    assert get_model_fingerprint(SimpleModel) != get_model_fingerprint(SubModel)
+
+
+def test_snapshot(tmp_path, monkeypatch) -> None:
+    file = tmp_path / 'test.yml'
+    file.write_text('a: 7\nsub:\n  b: [1, 2]')
+    snapshot_file = ConfigSnapshot.get_path(file)
+
+    cfg, validated = create_config(monkeypatch)
+    cfg.load_config_file(file)
+    assert validated == [True]
+    assert snapshot_file.is_file()
+
+    # new start uses the snapshot
+    cfg, validated = create_config(monkeypatch)
+    cfg.load_config_file(file)
+    assert validated == []
+    assert cfg.a == 7
+    assert cfg.sub.b == [1, 2]
+
+    # changed file
+    file.write_text('a: 8\nsub:\n  b: [1, 2]')
+    cfg, validated = create_config(monkeypatch)
+    cfg.load_config_file(file)
+    assert validated == [True]
+    assert cfg.a == 8
+
+    # changed preprocessing
+    cfg, validated = create_config(monkeypatch)
+    cfg.load_preprocess.rename_entry(['aa'], 'a')
+    cfg.load_config_file(file)
+    assert validated == [True]
+
+
+def test_snapshot_expansion(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(var_module, 'environ', {'MY_ENV': '9'})
+
+    file = tmp_path / 'test.yml'
+    file.write_text('a: ${MY_ENV}')
+
+    cfg, _ = create_config(monkeypatch)
+    cfg.load_config_file(file)
+    assert cfg.a == 9
+    assert not ConfigSnapshot.get_path(file).is_file()
+
+
+def test_snapshot_invalid(tmp_path, monkeypatch) -> None:
+    file = tmp_path / 'test.yml'
+    file.write_text('a: 7')
+    ConfigSnapshot.get_path(file).write_bytes(b'asdf')
+
+    cfg, validated = create_config(monkeypatch)
+    cfg.load_config_file(file)
+    assert validated == [True]
+    assert cfg.a == 7
+
+    cfg, validated = create_config(monkeypatch)
+    cfg.load_config_file(file)
+    assert validated == []
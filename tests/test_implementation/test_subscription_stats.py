@@ -0,0 +1,124 @@
+import logging
+import time
+from asyncio import sleep
+
+import pytest
+from pydantic import BaseModel
+
+from easyconfig import create_app_config, create_async_app_config
+from easyconfig.config_objs import ConcurrentDispatch, ThreadDispatch
+
+
+class SubModel(BaseModel):
+    a: int = 5
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    sub: SubModel = SubModel()
+
+
+def test_stats() -> None:
+    assert create_app_config(SimpleModel(), file_values=None).subscription_stats is None
+
+    cfg = create_app_config(SimpleModel(), file_values=None, subscription_stats=True)
+    stats = cfg.subscription_stats
+
+    def slow_func() -> None:
+        time.sleep(0.02)
+
+    def fast_func() -> None:
+        pass
+
+    cfg.subscribe_for_changes(slow_func)
+    cfg.sub.subscribe_for_changes(fast_func)
+
+    cfg.load_config_dict({'a': 1})
+    cfg.load_config_dict({'a': 2, 'sub': {'a': 1}})
+
+    assert set(stats.times()) == {'slow_func @ __root__', 'fast_func @ __root__.sub'}
+
+    times = stats.get('slow_func @ __root__')
+    assert times.count == 2
+    assert times.max >= 0.02
+    assert times.total >= 0.04
+    assert times.histogram == [0, 0, 2, 0, 0, 0]
+    assert stats.buckets == (0.001, 0.01, 0.1, 1.0, 10.0)
+
+    assert stats.get('fast_func @ __root__.sub').count == 1
+    assert stats.get('invalid') is None
+
+    stats.reset()
+    assert not stats.times()
+
+
+def test_stats_error() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None, subscription_stats=True)
+
+    def func() -> None:
+        raise ValueError()
+
+    cfg.subscribe_for_changes(func)
+    with pytest.raises(ValueError):  # noqa: PT011
+        cfg.load_config_dict({'a': 1})
+    assert cfg.subscription_stats.get('func @ __root__').count == 1
+
+
+def test_stats_thread() -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None, subscription_stats=True, dispatch=ThreadDispatch())
+
+    def func() -> None:
+        time.sleep(0.02)
+
+    cfg.subscribe_for_changes(func)
+    cfg.load_config_dict({'a': 1})
+    assert cfg.subscription_stats.get('func @ __root__').max >= 0.02
+
+
+@pytest.mark.parametrize('dispatch', (None, ConcurrentDispatch()))
+async def test_stats_async(dispatch) -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None, subscription_stats=True, dispatch=dispatch)
+
+    async def func() -> None:
+        await sleep(0.02)
+
+    cfg.subscribe_for_changes(func)
+    await cfg.load_config_dict({'a': 1})
+
+    # async functions are measured until they are done
+    times = cfg.subscription_stats.get('func @ __root__')
+    assert times.count == 1
+    assert times.max >= 0.02
+
+
+async def test_stats_delayed() -> None:
+    cfg = create_async_app_config(SimpleModel(), file_values=None, subscription_stats=True)
+
+    async def func() -> None:
+        await sleep(0.02)
+
+    cfg.subscribe_for_changes(func, debounce=0.01)
+    await cfg.load_config_dict({'a': 1})
+    assert cfg.subscription_stats.get('func @ __root__') is None
+
+    await sleep(0.1)
+    assert cfg.subscription_stats.get('func @ __root__').max >= 0.02
+
+
+def test_slow(caplog) -> None:
+    cfg = create_app_config(SimpleModel(), file_values=None, slow_subscription=0.01)
+
+    def slow_func() -> None:
+        time.sleep(0.02)
+
+    cfg.subscribe_for_changes(slow_func)
+
+    with caplog.at_level(logging.WARNING, logger='easyconfig'):
+        cfg.load_config_dict({'a': 1})
+
+    assert [r.name for r in caplog.records] == ['easyconfig.subscription_stats']
+    assert caplog.records[0].getMessage().startswith('Subscription slow_func @ __root__ took ')
+    assert cfg.subscription_stats.get('slow_func @ __root__').count == 1
+
+    with pytest.raises(ValueError, match='Slow subscription threshold must be greater than 0'):
+        create_app_config(SimpleModel(), file_values=None, slow_subscription=0)
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import time
+from threading import Event
+
+import pytest
+from pydantic import BaseModel
+
+from easyconfig.config_objs import AppConfig
+from easyconfig.config_objs.app_config import AsyncAppConfig
+from easyconfig.watcher import backend as backend_module
+from easyconfig.watcher.backend import InotifyBackend, PollingBackend, create_backend
+
+
+class SimpleModel(BaseModel):
+    a: int = 5
+    b: str = 'asdf'
+
+
+@pytest.fixture(params=['inotify', 'polling'])
+def backend(request, monkeypatch):
+    if request.param == 'polling':
+        monkeypatch.setattr(backend_module, '_load_libc', lambda: None)
+    elif backend_module._load_libc() is None:
+        pytest.skip('inotify not available')
+    return request.param
+
+
+def wait_for(func, timeout: float = 3) -> None:
+    start = time.monotonic()
+    while not func():
+        assert time.monotonic() - start < timeout
+        time.sleep(0.01)
+
+
+def test_create_backend(backend) -> None:
+    b = create_backend(Event())
+    try:
+        assert isinstance(b, InotifyBackend if backend == 'inotify' else PollingBackend)
+    finally:
+        b.close()
+
+
+def test_backend_change(tmp_path, backend) -> None:
+    file = tmp_path / 'test.yml'
+    file.write_text('a: 1')
+
+    b = create_backend(Event())
+    try:
+        b.set_paths([file])
+        assert not b.wait(0.05)
+
+        file.write_text('a: 22')
+        assert b.wait(0.05)
+        assert not b.wait(0.05)
+
+        # deleted file
+        file.unlink()
+        assert b.wait(0.05)
+    finally:
+        b.close()
+
+
+def test_watch(tmp_path, backend, caplog) -> None:
+    secret = tmp_path / 'secret'
+    secret.write_text('secret_1')
+
+    file = tmp_path / 'test.yml'
+    file.write_text(f'a: 7\nb: ${{{secret.as_posix()}}}')
+
+    cfg = AppConfig.from_model(SimpleModel())
+    cfg.load_config_file(file)
+
+    calls = []
+    cfg.subscribe_for_changes(lambda: calls.append((cfg.a, cfg.b)))
+
+    watcher = cfg.watch(interval=0.05, debounce=0.05)
+    try:
+        assert watcher.is_running
+
+        # burst of writes results in one reload
+        for i in range(5):
+            file.write_text(f'a: {10 + i:d}\nb: ${{{secret.as_posix()}}}')
+            time.sleep(0.01)
+        wait_for(lambda: cfg.a == 14)
+        time.sleep(0.2)
+        assert calls == [(14, 'secret_1')]
+
+        # file from the expansion
+        secret.write_text('secret_2')
+        wait_for(lambda: cfg.b == 'secret_2')
+
+        # invalid file keeps the current values
+        with caplog.at_level(logging.ERROR, logger='easyconfig.watcher'):
+            file.write_text('a: asdf')
+            wait_for(lambda: caplog.records)
+        assert cfg.a == 14
+        assert cfg.b == 'secret_2'
+        assert watcher.is_running
+    finally:
+        watcher.cancel()
+
+    assert not watcher.is_running
+
+
+async def test_watch_async(tmp_path, backend) -> None:
+    file = tmp_path / 'test.yml'
+    file.write_text('a: 7')
+
+    cfg = AsyncAppConfig.from_model(SimpleModel())
+    await cfg.load_config_file(file)
+
+    watcher = cfg.watch(interval=0.05, debounce=0.05)
+    try:
+        file.write_text('a: 8')
+        for _ in range(300):
+            if cfg.a == 8:
+                break
+            await asyncio.sleep(0.01)
+        assert cfg.a == 8
+    finally:
+        watcher.cancel()
+
+    await asyncio.sleep(0.3)
+    assert watcher._task.done()
@@ -0,0 +1,37 @@
+import pytest
+from pydantic import BaseModel
+
+from easyconfig import create_app_config
+from easyconfig.yaml import get_yaml_loader
+
+
+def test_get_loader() -> None:
+    assert get_yaml_loader('rt').typ == ['rt']
+    assert get_yaml_loader('safe').typ == ['safe']
+    assert get_yaml_loader('safe').pure
+    assert get_yaml_loader('c').typ == ['safe']
+
+    # the instances are not thread safe, so a new instance is returned every time
+    assert get_yaml_loader('rt') is not get_yaml_loader('rt')
+
+    with pytest.raises(ValueError, match='Unknown yaml loader "asdf"'):
+        get_yaml_loader('asdf')
+
+
+@pytest.mark.parametrize('loader', ['rt', 'safe', 'c'])
+def test_load_file(tmp_path, loader) -> None:
+    class SubModel(BaseModel):
+        b: list[int] = []
+
+    class SimpleModel(BaseModel):
+        a: int = 5
+        sub: SubModel = SubModel()
+
+    file = tmp_path / 'test.yml'
+    file.write_text('# comment\na: 7  # comment\nsub:\n  b: [1, 2]\n')
+
+    cfg = create_app_config(SimpleModel(), loader=loader)
+    cfg.load_config_file(file)
+
+    assert cfg.a == 7
+    assert cfg.sub.b == [1, 2]